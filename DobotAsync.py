@@ -0,0 +1,107 @@
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import DobotDllType as dType
+
+
+def _takesApi(func):
+    # DobotDllType里以api为首参数的函数，生成的wrapper也一样
+    if not callable(func) or isinstance(func, type):
+        return False
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return next(iter(parameters), None) == "api"
+
+
+class AsyncDobot(object):
+    """asyncio front-end for one Dobot.
+
+    Every blocking DobotDllType call runs on an executor owned by this
+    device, one worker thread, so calls to the same arm keep their order and
+    never block the event loop. Waiting for queued commands does not take a
+    thread: wait_index() awaits the session's CompletionPoller future.
+
+    Any DobotDllType function taking ``api`` is available as a coroutine
+    method, e.g. ``await robot.SetPTPCommonParams(100, 100, isQueued=1)``.
+    The *Ex functions wait on the device worker; use ptp()/cp() and
+    wait_index() instead so other calls to the arm are not held up.
+    """
+
+    def __init__(self, api, executor=None):
+        if not isinstance(api, dType.DobotSession):
+            api = dType.DobotSession(api)
+        self.api = api
+        self._ownExecutor = executor is None
+        self.executor = executor or concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="Dobot")
+
+    @classmethod
+    async def connect(cls, dll, portName, baudrate=115200, **sessionArgs):
+        """Open ``portName`` on a new session, raising ConnectionError on failure."""
+        robot = cls(dType.DobotSession(dll, **sessionArgs))
+        state = (await robot.call(dType.ConnectDobot, portName, baudrate))[0]
+        if state != dType.DobotConnect.DobotConnect_NoError:
+            robot.close()
+            raise ConnectionError("ConnectDobot(%r) returned %d" % (portName, state))
+        return robot
+
+    async def call(self, func, *args, **kwargs):
+        """Run ``func(api, *args, **kwargs)`` on the device executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, self.api, *args, **kwargs))
+
+    def __getattr__(self, name):
+        func = getattr(dType, name, None)
+        if not _takesApi(func):
+            raise AttributeError("%r object has no attribute %r" % (type(self).__name__, name))
+
+        async def method(*args, **kwargs):
+            return await self.call(func, *args, **kwargs)
+        method.__name__ = name
+        method.__doc__ = func.__doc__
+        return method
+
+    async def wait_index(self, index, queue=None):
+        """Wait until queued command ``index`` has been executed.
+
+        ``queue`` is 0 for the arm and 1 for the controller queue, as in
+        GetQueuedCmdCurrentIndex; None follows the arm's queue, which is 1
+        on a Controller-only connection. Returns the current index.
+        """
+        if queue is None:
+            queue = self.api.routes.armQueue
+        return await asyncio.wrap_future(dType.GetQueuedCmdFuture(self.api, index, queue))
+
+    async def ptp(self, ptpMode, x, y, z, rHead, wait=True):
+        """Queue a PTP motion and return its queued index, waiting for it by default."""
+        index = (await self.call(dType.SetPTPCmd, ptpMode, x, y, z, rHead, isQueued=1))[0]
+        if wait:
+            await self.wait_index(index)
+        return index
+
+    async def cp(self, cpMode, x, y, z, velocity, wait=False):
+        """Queue a CP segment and return its queued index.
+
+        CP segments are blended, so by default this does not wait.
+        """
+        index = (await self.call(dType.SetCPCmd, cpMode, x, y, z, velocity, isQueued=1))[0]
+        if wait:
+            await self.wait_index(index)
+        return index
+
+    async def get_pose(self):
+        """Return [x, y, z, rHead, joint1Angle, joint2Angle, joint3Angle, joint4Angle]."""
+        return await self.call(dType.GetPose)
+
+    def close(self):
+        """Shut down the executor if this object created it."""
+        if self._ownExecutor:
+            self.executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
@@ -0,0 +1,151 @@
+"""Wrapper overhead micro-benchmarks.
+
+Runs the hot DobotDllType wrappers against a library whose functions do
+nothing, so the numbers are the cost of the Python side alone: argument
+packing, device routing, retry bookkeeping and result unpacking. Each
+wrapper is measured once per routing branch.
+
+    python DobotBenchmark.py                       # all wrappers, all branches
+    python DobotBenchmark.py -n 20000 --reuse-buffers GetPose SetPTPCmd
+    python DobotBenchmark.py --stats GetPose         # with CallStats attached
+    python DobotBenchmark.py --dll ./libstub.so    # through ctypes instead
+
+``--dll`` loads a compiled no-op library with the ctypes backend, which
+adds the ctypes argument conversion to every call.
+"""
+import argparse
+import time
+import DobotDllType as dType
+import DobotSimulator
+
+
+class StubDll(object):
+    """Library object whose every function returns DobotCommunicate_NoError."""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def func(*args):
+            return 0
+        func.__name__ = name
+        self.__dict__[name] = func
+        return func
+
+    def __getitem__(self, name):
+        return getattr(self, name)
+
+
+# 路由分支：名字 -> (masterDevType, slaveDevType)
+# Routing branches: name -> (masterDevType, slaveDevType)
+ROUTES = [
+    ("Magician", (dType.DevType.Magician, dType.DevType.Idle)),
+    ("Controller+MagicianLite", (dType.DevType.Conntroller, dType.DevType.MagicianLite)),
+    ("Controller", (dType.DevType.Conntroller, dType.DevType.Idle)),
+]
+
+
+def connectedIds(masterDevType, slaveDevType):
+    """(masterId, slaveId, masterDevType, slaveDevType) as ConnectDobot sets them for this layout.
+
+    Taken from a ConnectDobot on the simulator, so the benchmark routes
+    exactly like a real connection (e.g. slaveId -1 for a Controller only).
+    """
+    session = dType.DobotSession(DobotSimulator.SimulatedDll(masterDevType, slaveDevType))
+    dType.ConnectDobot(session, "", 115200)
+    return session.masterId, session.slaveId, session.masterDevType, session.slaveDevType
+
+# 被测接口及其参数（不含api）
+# Wrappers under test and their arguments after ``api``
+CALLS = [
+    ("SetPTPCmd", (dType.PTPMode.PTPMOVLXYZMode, 200.0, 0.0, 50.0, 0.0), {"isQueued": 1}),
+    ("SetCPCmd", (dType.ContinuousPathMode.CPAbsoluteMode, 200.0, 0.0, 50.0, 100.0), {"isQueued": 1}),
+    ("SetCPLECmd", (dType.ContinuousPathMode.CPAbsoluteMode, 200.0, 0.0, 50.0, 50.0), {"isQueued": 1}),
+    ("GetPose", (), {}),
+    ("GetQueuedCmdCurrentIndex", (), {}),
+    ("GetIODI", (1,), {}),
+    ("GetIOADC", (1,), {}),
+    ("GetColorSensor", (), {}),
+]
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def measure(func, api, args, kwargs, number=10000):
+    """Time ``number`` calls of ``func(api, *args, **kwargs)``.
+
+    Returns a dict with calls/sec from an untimed loop, and p50/p90/p99/max
+    per-call latency in microseconds from a second, individually timed loop.
+    """
+    for _ in range(min(number, 1000)):
+        func(api, *args, **kwargs)
+
+    clock = time.perf_counter
+    start = clock()
+    for _ in range(number):
+        func(api, *args, **kwargs)
+    elapsed = clock() - start
+
+    clock = time.perf_counter_ns
+    samples = []
+    append = samples.append
+    for _ in range(number):
+        t = clock()
+        func(api, *args, **kwargs)
+        append(clock() - t)
+    samples.sort()
+    return {
+        "callsPerSec": number / elapsed,
+        "p50": _percentile(samples, 0.50) / 1000,
+        "p90": _percentile(samples, 0.90) / 1000,
+        "p99": _percentile(samples, 0.99) / 1000,
+        "max": samples[-1] / 1000,
+    }
+
+
+def run(dll=None, number=10000, names=None, reuseBuffers=False, stats=False):
+    """Benchmark every wrapper in CALLS (or ``names``) on every route.
+
+    ``stats=True`` attaches a CallStats to each session to show the cost of
+    the instrumentation.
+
+    Returns a list of (wrapper, route, result) with results from measure().
+    """
+    if dll is None:
+        dll = StubDll()
+    results = []
+    for name, args, kwargs in CALLS:
+        if names and name not in names:
+            continue
+        func = getattr(dType, name)
+        for route, layout in ROUTES:
+            session = dType.DobotSession(dll, reuseBuffers=reuseBuffers, stats=dType.CallStats() if stats else None)
+            session.masterId, session.slaveId, session.masterDevType, session.slaveDevType = connectedIds(*layout)
+            session.updateRoutes()
+            results.append((name, route, measure(func, session, args, kwargs, number)))
+    return results
+
+
+def report(results):
+    print("%-26s %-24s %12s %8s %8s %8s %8s" % ("wrapper", "route", "calls/s", "p50 us", "p90 us", "p99 us", "max us"))
+    for name, route, r in results:
+        print("%-26s %-24s %12.0f %8.2f %8.2f %8.2f %8.1f" % (
+            name, route, r["callsPerSec"], r["p50"], r["p90"], r["p99"], r["max"]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmark the DobotDllType wrappers against a no-op library.")
+    parser.add_argument("names", nargs="*", help="wrappers to run (default: all)")
+    parser.add_argument("-n", "--number", type=int, default=10000, help="calls per wrapper and route")
+    parser.add_argument("--reuse-buffers", action="store_true", help="use DobotSession(reuseBuffers=True)")
+    parser.add_argument("--stats", action="store_true", help="record every call in a CallStats")
+    parser.add_argument("--dll", help="load this no-op library with the ctypes backend instead of StubDll")
+    options = parser.parse_args(argv)
+    dll = dType.load("ctypes", options.dll) if options.dll else None
+    report(run(dll, options.number, options.names, options.reuse_buffers, options.stats))
+
+
+if __name__ == "__main__":
+    main()
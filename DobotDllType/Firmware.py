@@ -0,0 +1,68 @@
+"""Firmware upgrade handshake.
+
+Imported on first use through DobotDllType; use the functions from there.
+"""
+from ctypes import *
+import warnings
+from DobotDllType import _IDS, _SIGNATURES, _attachMethods, _call, _session
+
+
+class UpgradeFWReadyCmd(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("fwSize", c_uint32),
+        ("md5", c_char_p)
+    ]
+
+
+_SIGNATURES.update({
+    "SetUpgradeFWReadyCmd": _IDS + [POINTER(UpgradeFWReadyCmd)],
+    "GetUpgradeFWReadyCmd": _IDS + [POINTER(UpgradeFWReadyCmd), POINTER(c_byte)],
+})
+
+
+def SetUpgradeFWReadyCmd(api,fwSize, md5):
+    session = _session(api)
+    upgradeFWReadyCmd = UpgradeFWReadyCmd()
+    upgradeFWReadyCmd.fwSize = fwSize
+    try:
+        md5Bytes = bytes.fromhex(md5)
+        md5CBuf = create_string_buffer(len(md5Bytes))
+        md5CBuf.raw = md5Bytes
+        upgradeFWReadyCmd.md5 = addressof(md5CBuf)
+    except Exception as e:
+        warnings.warn("md5 is not a hex string: %s" % e, RuntimeWarning, stacklevel=2)
+
+    # # 只发送给主设备
+    # result = api.SetUpgradeFWReadyCmd(c_int(masterId), c_int(-1), byref(upgradeFWReadyCmd))
+    # return result
+
+    # 不能去掉等待！！！！！！，jomar 2019年5月7日 09:28:30
+    tempSlaveId = session.routes.box
+    result = _call(session, 5, session.dll.SetUpgradeFWReadyCmd, session.masterId, tempSlaveId, byref(upgradeFWReadyCmd))
+
+
+def GetUpgradeFWReadyCmd(api,fwSize, md5):
+    session = _session(api)
+    upgradeFWReadyCmd = UpgradeFWReadyCmd()
+    upgradeFWReadyCmd.fwSize = fwSize
+    isUpgrade = c_byte(0)
+    try:
+        md5Bytes = bytes.fromhex(md5)
+        md5CBuf = create_string_buffer(len(md5Bytes))
+        md5CBuf.raw = md5Bytes
+        upgradeFWReadyCmd.md5 = addressof(md5CBuf)
+    except Exception as e:
+        warnings.warn("md5 is not a hex string: %s" % e, RuntimeWarning, stacklevel=2)
+
+    # # 只发送给主设备
+    # result = api.SetUpgradeFWReadyCmd(c_int(masterId), c_int(-1), byref(upgradeFWReadyCmd))
+    # return result
+
+    # 不能去掉等待！！！！！！，jomar 2019年5月7日 09:28:30
+    tempSlaveId = session.routes.box
+    result = _call(session, 5, session.dll.GetUpgradeFWReadyCmd, session.masterId, tempSlaveId, byref(upgradeFWReadyCmd), byref(isUpgrade))
+    return [isUpgrade.value]
+
+
+_attachMethods(globals())
@@ -0,0 +1,153 @@
+"""IO wrappers: EIO multiplexing, DO/PWM/DI/ADC, stepper motors and the
+color and infrared sensors, for the Magician and the controller box (*Ext).
+
+Imported on first use through DobotDllType; use the functions from there.
+"""
+from ctypes import *
+from DobotDllType import enum, _IDS, _QUEUED, _SIGNATURES, _attachMethods, _call, _generate, _session
+
+
+class EMotor(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("index", c_byte), 
+        ("isEnabled", c_byte), 
+        ("speed", c_int32)
+        ]
+
+class EMotorS(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("index", c_byte), 
+        ("isEnabled", c_byte), 
+        ("speed", c_int32), 
+        ("distance", c_uint32)
+        ]
+
+GPIOType = enum(
+    GPIOTypeDummy = 0, 
+    GPIOTypeDO = 1,
+    GPIOTypePWM=2,
+    GPIOTypeDI=3, 
+    GPIOTypeADC=4, 
+    GPIOTypeDIPU=5, 
+    GPIOTypeDIPD=6)
+
+class IOMultiplexing(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("address", c_byte), 
+        ("multiplex", c_byte)
+        ]
+
+class IODO(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("address", c_byte), 
+        ("level", c_byte)
+        ]
+
+class IOPWM(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("address", c_byte), 
+        ("frequency", c_float), 
+        ("dutyCycle", c_float)
+        ]
+
+class IODI(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("address", c_byte), 
+        ("level", c_byte)
+        ]
+
+class IOADC(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("address", c_byte), 
+        ("value", c_int)
+        ]
+
+
+_SIGNATURES.update({
+    "SetIOMultiplexing": _IDS + [POINTER(IOMultiplexing)] + _QUEUED,
+    "GetIOMultiplexing": _IDS + [POINTER(IOMultiplexing)],
+    "SetIODO": _IDS + [POINTER(IODO)] + _QUEUED,
+    "GetIODO": _IDS + [POINTER(IODO)],
+    "SetIOPWM": _IDS + [POINTER(IOPWM)] + _QUEUED,
+    "GetIOPWM": _IDS + [POINTER(IOPWM)],
+    "GetIODI": _IDS + [POINTER(IODI)],
+    "GetIOADC": _IDS + [POINTER(IOADC)],
+    "SetEMotor": _IDS + [POINTER(EMotor)] + _QUEUED,
+    "SetEMotorS": _IDS + [POINTER(EMotorS)] + _QUEUED,
+    "SetColorSensor": _IDS + [c_bool, c_uint8, c_uint8] + _QUEUED,
+    "GetColorSensor": _IDS + [POINTER(c_uint8), POINTER(c_uint8), POINTER(c_uint8)],
+    "SetInfraredSensor": _IDS + [c_bool, c_uint8, c_uint8] + _QUEUED,
+    "GetInfraredSensor": _IDS + [c_uint8, POINTER(c_uint8)],
+})
+
+
+# 普通、Ex、Ext、ExtEx四套函数只差路由和是否等待，由下表生成
+# The plain, Ex, Ext and ExtEx copies differ only in routing and waiting, so
+# they are generated from this table, see DobotDllType._generate.
+_ALL = (("", "box", False), ("Ex", "box", True), ("Ext", "controller", False), ("ExtEx", "controller", True))
+_READ = (("", "box", False), ("Ext", "controller", False))
+_EXT = (("Ext", "controller", False), ("ExtEx", "controller", True))
+
+_generate(globals(), [
+    ("SetIOMultiplexing", ("address", "multiplex"), None, _ALL),
+    ("GetIOMultiplexing", ("addr:address",), ("multiplex",), _READ),
+    ("SetIODO", ("address", "level"), None, _ALL),
+    ("GetIODO", ("addr:address",), ("level",), _READ),
+    ("SetIOPWM", ("address", "frequency", "dutyCycle"), None, _ALL),
+    ("GetIOPWM", ("addr:address",), ("frequency", "dutyCycle"), _READ),
+    ("GetIODI", ("addr:address",), ("level",), _READ),
+    ("GetIOADC", ("addr:address",), ("value",), _READ),
+    ("SetEMotor", ("index", "isEnabled", "speed"), None, _ALL),
+    ("SetEMotorS", ("index", "isEnabled", "speed", "distance"), None, _ALL),
+    ("GetColorSensor", (), None, (("", "box", False),)),
+    ("SetColorSensor", ("isEnable", "colorPort", "version=0"), None, _EXT),
+    ("SetInfraredSensor", ("isEnable", "infraredPort", "version=0"), None, _EXT),
+    ("GetInfraredSensor", ("infraredPort",), None, _READ),
+])
+
+
+# 以下几个与上面的格式不同，保留手写
+# These differ from the pattern above and stay hand-written.
+
+def SetColorSensor(api, isEnable, colorPort, version=0):
+    session = _session(api)
+    enable = c_bool(isEnable)
+    port = c_uint8(colorPort)
+    version = c_uint8(version)
+    queuedCmdIndex = c_uint64(0)
+    tempSlaveId = session.routes.box
+    _call(session, 5, session.dll.SetColorSensor, session.masterId, tempSlaveId, enable, port, version, 1, byref(queuedCmdIndex))
+
+
+def SetInfraredSensor(api,  isEnable, infraredPort, version=0):
+    session = _session(api)
+    enable = c_bool(isEnable)
+    port = c_uint8(infraredPort)
+    queuedCmdIndex = c_uint64(0)
+    version = c_uint8(version)
+    tempSlaveId = session.routes.box
+    _call(session, 5, session.dll.SetInfraredSensor, session.masterId, tempSlaveId, enable, port, version, 1, byref(queuedCmdIndex))
+
+
+def GetColorSensorEx(api,  index):
+    result = GetColorSensor(api)
+    return result[index]
+
+
+def GetColorSensorExt(api, index):
+    session = _session(api)
+    r = c_ubyte(0)
+    g = c_ubyte(0)
+    b = c_ubyte(0)
+    _call(session, 5, session.dll.GetColorSensor, session.masterId, -1, byref(r), byref(g), byref(b))
+    return [r.value, g.value, b.value][index]
+
+
+_attachMethods(globals())
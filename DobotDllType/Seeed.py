@@ -0,0 +1,38 @@
+"""Seeed Grove sensors and RGB LED attached to the controller box.
+
+Imported on first use through DobotDllType; use the functions from there.
+"""
+from ctypes import *
+from DobotDllType import _IDS, _QUEUED, _SIGNATURES, _attachMethods, _generate
+
+
+_SIGNATURES.update({
+    "GetSeeedColorSensor": _IDS + [POINTER(c_uint16)] * 4,
+    "SetSeeedColorSensor": _IDS + [c_uint8] + _QUEUED,
+    "GetSeeedDistanceSensor": _IDS + [c_uint8, POINTER(c_uint8)],
+    "SetSeeedTempSensor": _IDS + [c_uint8] + _QUEUED,
+    "GetSeeedTempSensor": _IDS + [POINTER(c_uint16), POINTER(c_uint16)],
+    "SetSeeedLightSensor": _IDS + [c_uint8] + _QUEUED,
+    "GetSeeedLightSensor": _IDS + [POINTER(c_uint16)],
+    "SetSeeedRgb": _IDS + [c_uint8, c_float] + _QUEUED,
+})
+
+
+#2019.08.21 by song add Seeed Sensor API    
+# Ext为普通调用，ExtEx等待指令执行完毕；都发给控制盒（有的话）
+# Ext calls return at once, ExtEx ones wait; see DobotDllType._generate.
+_EXT = (("Ext", "box", False), ("ExtEx", "box", True))
+
+_generate(globals(), [
+    ("GetSeeedColorSensor", (), None, (("Ext", "box", False),)),
+    ("SetSeeedColorSensor", ("SeeedPort",), None, _EXT),
+    ("GetSeeedDistanceSensor", ("SeeedPort",), None, (("Ext", "box", False),)),
+    ("SetSeeedTempSensor", ("SeeedPort",), None, _EXT),
+    ("GetSeeedTempSensor", (), None, (("Ext", "box", False),)),
+    ("SetSeeedLightSensor", ("SeeedPort",), None, _EXT),
+    ("GetSeeedLightSensor", (), None, (("Ext", "box", False),)),
+    ("SetSeeedRgb", ("SeeedPort", "Rgb"), None, _EXT),
+])
+
+
+_attachMethods(globals())
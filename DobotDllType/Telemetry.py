@@ -0,0 +1,135 @@
+"""Background pose sampling into a NumPy ring buffer.
+
+Imported on first use through DobotDllType; needs numpy.
+"""
+import threading
+import time
+import numpy as np
+from DobotDllType import DobotCancelledError, DobotCommunicateError, GetKinematics, GetPose, GetPoseL
+
+
+POSE_COLUMNS = ("timestamp", "x", "y", "z", "rHead", "joint1", "joint2", "joint3", "joint4")
+
+
+class PoseSampler(object):
+    """Samples GetPose on a background thread at ``rate`` Hz.
+
+    Each sample is one float64 row of ``columns``: a time.time() timestamp,
+    x, y, z, rHead and joint1-4, then ``l`` with ``withL=True`` (GetPoseL)
+    and ``velocity``, ``acceleration`` with ``withKinematics=True``
+    (GetKinematics). The last ``capacity`` samples are kept.
+
+    Readers never talk to the device. window() returns a view into the
+    buffer without copying, so its rows are overwritten once the sampler
+    has taken ``capacity`` more samples; copy() what you keep. latest()
+    returns a copy of the newest row.
+
+    A call that fails with DobotCommunicateError, or is broken off with
+    DobotCancelledError (CancelWaits, EmergencyStop), is counted in
+    ``errors`` and skipped. Any other exception ends the sampling thread;
+    it is kept in ``error`` and raised again by latest() and stop().
+    """
+
+    def __init__(self, api, rate=50.0, capacity=4096, withL=False, withKinematics=False):
+        self.api = api
+        self.rate = rate
+        self.capacity = capacity
+        self.withL = withL
+        self.withKinematics = withKinematics
+        self.columns = POSE_COLUMNS + (("l",) if withL else ()) + (("velocity", "acceleration") if withKinematics else ())
+        # 每行写两次（i和i+capacity），任意最近的一段都是连续内存
+        # Every row is written twice, at i and i + capacity, so any run of
+        # recent rows is contiguous and can be returned as a plain slice.
+        self._buffer = np.zeros((2 * capacity, len(self.columns)))
+        self.count = 0
+        self.errors = 0
+        self.error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="DobotPoseSampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def __len__(self):
+        # 正在写入的那一行不算在内
+        return min(self.count, self.capacity - 1)
+
+    def _run(self):
+        interval = 1.0 / self.rate
+        due = time.monotonic()
+        while not self._stop.wait(max(0.0, due - time.monotonic())):
+            try:
+                self.sample()
+            except (DobotCommunicateError, DobotCancelledError):
+                self.errors += 1
+            except Exception as error:
+                self.error = error
+                return
+            due += interval
+            now = time.monotonic()
+            if due < now:
+                # 跟不上时不补采
+                due = now
+
+    def sample(self):
+        """Take one sample now and return it."""
+        row = [time.time()] + GetPose(self.api)
+        if self.withL:
+            row += GetPoseL(self.api)
+        if self.withKinematics:
+            row += GetKinematics(self.api)
+        i = self.count % self.capacity
+        self._buffer[i] = row
+        self._buffer[i + self.capacity] = row
+        self.count += 1
+        return row
+
+    def latest(self):
+        """Copy of the newest sample, or None before the first one."""
+        if self.error is not None:
+            raise self.error
+        if not self.count:
+            return None
+        return self._buffer[(self.count - 1) % self.capacity].copy()
+
+    def window(self, count=None, seconds=None, step=1):
+        """View of the most recent samples, oldest first.
+
+        ``count`` limits the number of rows, ``seconds`` keeps the rows no
+        older than that relative to the newest one; by default every kept
+        sample is returned. ``step`` decimates, keeping every step-th row
+        and always the newest. Returns a read-only NumPy view.
+        """
+        count = len(self) if count is None else min(count, len(self))
+        end = (self.count - 1) % self.capacity + self.capacity + 1
+        view = self._buffer[end - count:end]
+        if seconds is not None and count:
+            view = view[np.searchsorted(view[:, 0], view[-1, 0] - seconds):]
+        if step > 1:
+            view = view[(len(view) - 1) % step::step]
+        view = view.view()
+        view.flags.writeable = False
+        return view
+
+    def column(self, name):
+        """Index of column ``name`` in the rows, e.g. ``window()[:, sampler.column("z")]``."""
+        return self.columns.index(name)
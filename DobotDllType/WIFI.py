@@ -0,0 +1,198 @@
+"""WIFI module configuration. Every call can be abandoned by clearing
+DobotDllType.QuitDobotApiFlag.
+
+Imported on first use through DobotDllType; use the functions from there.
+"""
+from ctypes import *
+from DobotDllType import DobotCommunicate, _IDS, _SIGNATURES, _attachMethods, _cancelToken, _quitRequested, _session
+
+
+class WIFIIPAddress(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("dhcp", c_byte),
+        ("addr1", c_byte),
+        ("addr2", c_byte),
+        ("addr3", c_byte),
+        ("addr4", c_byte),
+        ]
+
+class WIFINetmask(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("addr1", c_byte),
+        ("addr2", c_byte),
+        ("addr3", c_byte),
+        ("addr4", c_byte),
+        ]
+
+class WIFIGateway(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("addr1", c_byte),
+        ("addr2", c_byte),
+        ("addr3", c_byte),
+        ("addr4", c_byte),
+        ]
+
+class WIFIDNS(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("addr1", c_byte),
+        ("addr2", c_byte),
+        ("addr3", c_byte),
+        ("addr4", c_byte),
+        ]
+
+
+_SIGNATURES.update({
+    "SetWIFIConfigMode": _IDS + [c_bool],
+    "GetWIFIConfigMode": _IDS + [POINTER(c_bool)],
+    "SetWIFISSID": _IDS + [c_char_p],
+    "GetWIFISSID": _IDS + [c_char_p, c_uint32],
+    "SetWIFIPassword": _IDS + [c_char_p],
+    "GetWIFIPassword": _IDS + [c_char_p, c_uint32],
+    "SetWIFIIPAddress": _IDS + [POINTER(WIFIIPAddress)],
+    "GetWIFIIPAddress": _IDS + [POINTER(WIFIIPAddress)],
+    "SetWIFINetmask": _IDS + [POINTER(WIFINetmask)],
+    "GetWIFINetmask": _IDS + [POINTER(WIFINetmask)],
+    "SetWIFIGateway": _IDS + [POINTER(WIFIGateway)],
+    "GetWIFIGateway": _IDS + [POINTER(WIFIGateway)],
+    "SetWIFIDNS": _IDS + [POINTER(WIFIDNS)],
+    "GetWIFIDNS": _IDS + [POINTER(WIFIDNS)],
+    "GetWIFIConnectStatus": _IDS + [POINTER(c_bool)],
+})
+
+
+def _callWIFI(session, delay, func, *args):
+    # WiFi设置可以通过QuitDobotApiFlag中途退出
+    if _quitRequested():
+        return None
+    if session.stats is not None:
+        return session.stats.call(func, args, session.retryPolicy, delay, abort=_quitRequested, token=_cancelToken(session))
+    result = func(*args)
+    if result != DobotCommunicate.DobotCommunicate_NoError:
+        result = session.retryPolicy.retry(func, args, result, delay, abort=_quitRequested, token=_cancelToken(session))
+    return result
+
+
+def GetWIFIConnectStatus(api):
+    session = _session(api)
+    isConnected = c_bool(0)
+    _callWIFI(session, 5, session.dll.GetWIFIConnectStatus, session.masterId, session.slaveId, byref(isConnected))
+    return [isConnected.value]
+
+
+def SetWIFIConfigMode(api,  enable):
+    session = _session(api)
+    _callWIFI(session, 5, session.dll.SetWIFIConfigMode, session.masterId, session.slaveId, enable)
+
+
+def GetWIFIConfigMode(api):
+    session = _session(api)
+    isEnabled = c_bool(0)
+    _callWIFI(session, 5, session.dll.GetWIFIConfigMode, session.masterId, session.slaveId, byref(isEnabled))
+    return [isEnabled.value]
+
+
+def SetWIFISSID(api,  ssid):
+    session = _session(api)
+    szPara = create_string_buffer(len(ssid))
+    szPara.raw = ssid.encode("utf-8")
+    _callWIFI(session, 5, session.dll.SetWIFISSID, session.masterId, session.slaveId, szPara)
+
+
+def GetWIFISSID(api):
+    session = _session(api)
+    szPara = create_string_buffer(100)
+    _callWIFI(session, 5, session.dll.GetWIFISSID, session.masterId, session.slaveId, szPara, 25)
+    ssid = szPara.value.decode("utf-8") 
+    return [ssid]
+
+
+def SetWIFIPassword(api,  password):
+    session = _session(api)
+    szPara = create_string_buffer(25)
+    szPara.raw = password.encode("utf-8")
+    _callWIFI(session, 5, session.dll.SetWIFIPassword, session.masterId, session.slaveId, szPara)
+
+
+def GetWIFIPassword(api):
+    session = _session(api)
+    szPara = create_string_buffer(25)  
+    _callWIFI(session, 5, session.dll.GetWIFIPassword, session.masterId, session.slaveId, szPara, 25)
+    password = szPara.value.decode("utf-8") 
+    return [password]
+
+
+def SetWIFIIPAddress(api,  dhcp,  addr1,  addr2,  addr3,  addr4):
+    session = _session(api)
+    wifiIPAddress = WIFIIPAddress()
+    wifiIPAddress.dhcp = dhcp
+    wifiIPAddress.addr1 = addr1
+    wifiIPAddress.addr2 = addr2
+    wifiIPAddress.addr3 = addr3
+    wifiIPAddress.addr4 = addr4
+
+    _callWIFI(session, 5, session.dll.SetWIFIIPAddress, session.masterId, session.slaveId, byref(wifiIPAddress))
+
+
+def GetWIFIIPAddress(api):
+    session = _session(api)
+    wifiIPAddress = WIFIIPAddress()
+    _callWIFI(session, 5, session.dll.GetWIFIIPAddress, session.masterId, session.slaveId, byref(wifiIPAddress))
+    return [c_uint8(wifiIPAddress.dhcp).value,  c_uint8(wifiIPAddress.addr1).value,  c_uint8(wifiIPAddress.addr2).value,   c_uint8(wifiIPAddress.addr3).value,  c_uint8(wifiIPAddress.addr4).value]
+
+
+def SetWIFINetmask(api, addr1,  addr2,  addr3,  addr4):
+    session = _session(api)
+    wifiNetmask = WIFINetmask()
+    wifiNetmask.addr1 = addr1
+    wifiNetmask.addr2 = addr2
+    wifiNetmask.addr3 = addr3
+    wifiNetmask.addr4 = addr4
+    _callWIFI(session, 5, session.dll.SetWIFINetmask, session.masterId, session.slaveId, byref(wifiNetmask))
+
+
+def GetWIFINetmask(api):
+    session = _session(api)
+    wifiNetmask = WIFINetmask()
+    _callWIFI(session, 5, session.dll.GetWIFINetmask, session.masterId, session.slaveId, byref(wifiNetmask))
+    return [c_uint8(wifiNetmask.addr1).value,  c_uint8(wifiNetmask.addr2).value,  c_uint8(wifiNetmask.addr3).value,  c_uint8(wifiNetmask.addr4).value]
+
+
+def SetWIFIGateway(api, addr1,  addr2,  addr3,  addr4):
+    session = _session(api)
+    wifiGateway = WIFIGateway()
+    wifiGateway.addr1 = addr1
+    wifiGateway.addr2 = addr2
+    wifiGateway.addr3 = addr3
+    wifiGateway.addr4 = addr4
+    _callWIFI(session, 5, session.dll.SetWIFIGateway, session.masterId, session.slaveId, byref(wifiGateway))
+
+
+def GetWIFIGateway(api):
+    session = _session(api)
+    wifiGateway = WIFIGateway()
+    _callWIFI(session, 5, session.dll.GetWIFIGateway, session.masterId, session.slaveId, byref(wifiGateway))
+    return [c_uint8(wifiGateway.addr1).value,  c_uint8(wifiGateway.addr2).value,  c_uint8(wifiGateway.addr3).value,  c_uint8(wifiGateway.addr4).value]
+
+
+def SetWIFIDNS(api, addr1,  addr2,  addr3,  addr4):
+    session = _session(api)
+    wifiDNS = WIFIDNS()
+    wifiDNS.addr1 = addr1
+    wifiDNS.addr2 = addr2
+    wifiDNS.addr3 = addr3
+    wifiDNS.addr4 = addr4
+    _callWIFI(session, 5, session.dll.SetWIFIDNS, session.masterId, session.slaveId, byref(wifiDNS))
+
+
+def GetWIFIDNS(api):
+    session = _session(api)
+    wifiDNS = WIFIDNS()
+    _callWIFI(session, 5, session.dll.GetWIFIDNS, session.masterId, session.slaveId, byref(wifiDNS))
+    return [c_uint8(wifiDNS.addr1).value,  c_uint8(wifiDNS.addr2).value,  c_uint8(wifiDNS.addr3).value,  c_uint8(wifiDNS.addr4).value]
+
+
+_attachMethods(globals())
@@ -0,0 +1,3302 @@
+from ctypes import *
+from ctypes import _CFuncPtr
+import time
+import math
+import os
+import random
+import threading
+import types
+import heapq
+import itertools
+import importlib
+import operator
+import warnings
+
+def enum(**enums):
+    return type("Enum", (), enums)
+
+EndType = enum(EndTypeCustom=0, 
+    EndTypeSuctionCup=1, 
+    EndTypeGripper=2, 
+    EndTypeLaser=3,
+    EndTypePen = 4,  
+    EndTypeMax=5)
+
+DevType = enum(Idle=0,
+               Conntroller=1,
+               Magician=2,
+               MagicianLite=3
+               )
+
+ParamsMode = enum(JOG=0,
+                other=1)
+
+
+class DevInfo(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("devId", c_int),
+        ("type", c_int),
+        ("firmwareName", c_byte * 50),
+        ("firwareVersion", c_byte * 50),
+        ("runTime", c_float)
+               ]
+
+class ConnectInfo(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("masterDevInfo", DevInfo),
+        ("slaveDevInfo1", DevInfo),
+        ("slaveDevInfo2", DevInfo)
+    ]
+
+
+class DeviceID(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("deviceID1", c_uint32),
+        ("deviceID2", c_uint32),
+        ("deviceID3", c_uint32)
+    ]
+
+class DeviceVersion(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("fw_majorVersion", c_byte),
+        ("fw_minorVersion", c_byte),
+        ("fw_revision", c_byte),
+        ("fw_alphaVersion", c_byte),
+        ("hw_majorVersion", c_byte),
+        ("hw_minorVersion", c_byte),
+        ("hw_revision", c_byte),
+        ("hw_alphaVersion", c_byte)
+    ]
+
+# For EndTypeParams
+class EndTypeParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("xBias", c_float),
+        ("yBias", c_float),
+        ("zBias", c_float)
+        ]
+
+class Pose(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("x", c_float),
+        ("y", c_float),
+        ("z", c_float),
+        ("rHead", c_float),
+        ("joint1Angle", c_float),
+        ("joint2Angle", c_float),
+        ("joint3Angle", c_float),
+        ("joint4Angle", c_float)
+        ]
+
+class Kinematics(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("velocity", c_float),
+        ("acceleration", c_float)
+        ]
+
+class AlarmsState(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("alarmsState", c_int32)
+        ]
+
+class HOMEParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("x", c_float), 
+        ("y", c_float), 
+        ("z", c_float), 
+        ("r", c_float)
+        ]
+
+class HOMECmd(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("temp", c_float)
+        ]
+        
+class AutoLevelingCmd(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("controlFlag", c_ubyte),
+        ("precision", c_float)
+        ]
+        
+        
+        
+##################  Arm orientation定义   ##################
+ArmOrientation = enum(
+    LeftyArmOrientation=0, 
+    RightyArmOrientation=1)
+    
+##################  点动示教部分   ##################
+
+class JOGJointParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("joint1Velocity", c_float), 
+        ("joint2Velocity", c_float), 
+        ("joint3Velocity", c_float), 
+        ("joint4Velocity", c_float), 
+        ("joint1Acceleration", c_float),
+        ("joint2Acceleration", c_float),
+        ("joint3Acceleration", c_float),
+        ("joint4Acceleration", c_float)
+        ]
+
+class JOGCoordinateParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("xVelocity", c_float), 
+        ("yVelocity", c_float), 
+        ("zVelocity", c_float), 
+        ("rVelocity", c_float), 
+        ("xAcceleration", c_float),
+        ("yAcceleration", c_float),
+        ("zAcceleration", c_float),
+        ("rAcceleration", c_float)
+        ]
+
+class JOGCommonParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("velocityRatio", c_float), 
+        ("accelerationRatio", c_float)
+        ]
+
+class JOGLParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("velocity",  c_float), 
+        ("acceleration",  c_float)
+    ]
+
+
+JC = enum(JogIdle=0, 
+    JogAPPressed=1, 
+    JogANPressed=2, 
+    JogBPPressed=3, 
+    JogBNPressed=4,
+    JogCPPressed=5,
+    JogCNPressed=6,
+    JogDPPressed=7,
+    JogDNPressed=8,
+    JogEPPressed=9,
+    JogENPressed=10)
+
+class JOGCmd(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("isJoint", c_byte), 
+        ("cmd", c_byte)
+        ]
+
+##################  再现运动部分   ##################
+
+class PTPJointParams(Structure):
+    _fields_ = [
+        ("joint1Velocity", c_float), 
+        ("joint2Velocity", c_float), 
+        ("joint3Velocity", c_float), 
+        ("joint4Velocity", c_float), 
+        ("joint1Acceleration", c_float),
+        ("joint2Acceleration", c_float),
+        ("joint3Acceleration", c_float),
+        ("joint4Acceleration", c_float)
+        ]
+        
+class PTPCoordinateParams(Structure):
+    _fields_ = [
+        ("xyzVelocity", c_float), 
+        ("rVelocity", c_float),
+        ("xyzAcceleration", c_float), 
+        ("rAcceleration", c_float)
+        ]
+
+class PTPLParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("velocity",  c_float), 
+        ("acceleration",  c_float)
+    ]
+
+class PTPJumpParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("jumpHeight", c_float), 
+        ("zLimit", c_float)
+        ]
+
+class PTPCommonParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("velocityRatio", c_float), 
+        ("accelerationRatio", c_float)
+        ]
+
+PTPMode = enum(
+    PTPJUMPXYZMode=0,
+    PTPMOVJXYZMode=1,
+    PTPMOVLXYZMode=2,
+    
+    PTPJUMPANGLEMode=3,
+    PTPMOVJANGLEMode=4,
+    PTPMOVLANGLEMode=5,
+    
+    PTPMOVJANGLEINCMode=6,
+    PTPMOVLXYZINCMode=7, 
+    PTPMOVJXYZINCMode=8, 
+    
+    PTPJUMPMOVLXYZMode=9)
+
+InputPin = enum( InputPinNone=0,
+    InputPin1=1,
+    InputPin2=2,
+    InputPin3=3,
+    InputPin4=4,
+    InputPin5=5,
+    InputPin6=6,
+    InputPin7=7,
+    InputPin8=8)
+
+InputLevel = enum(InputLevelBoth=0,
+    InputLevelLow=1,
+    InputLevelHigh=2)
+
+OutputPin = enum(
+    SIGNALS_O1=1,
+    SIGNALS_O2=2,
+    SIGNALS_O3=3,
+    SIGNALS_O4=4,
+    SIGNALS_O5=5,
+    SIGNALS_O6=6,
+    SIGNALS_O7=7,
+    SIGNALS_O8=8)
+
+class PTPCmd(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("ptpMode", c_byte),
+        ("x", c_float),
+        ("y", c_float),
+        ("z", c_float),
+        ("rHead", c_float)
+        ]
+        
+class DeviceCountInfo(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("deviceRunTime",  c_uint64),
+        ("devicePowerOn",  c_uint32),
+        ("devicePowerOff", c_uint32)
+        ]
+        
+class PTPWithLCmd(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("ptpMode", c_byte),
+        ("x", c_float),
+        ("y", c_float),
+        ("z", c_float),
+        ("rHead", c_float),
+        ("l", c_float)
+        ]
+
+##################  Continuous path   ##################
+
+class CPParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("planAcc", c_float),
+        ("juncitionVel", c_float),
+        ("acc", c_float), 
+        ("realTimeTrack",  c_byte)
+        ]
+
+ContinuousPathMode = enum(
+    CPRelativeMode=0,
+    CPAbsoluteMode=1)
+
+class CPCmd(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("cpMode", c_byte),
+        ("x", c_float),
+        ("y", c_float),
+        ("z", c_float),
+        ("velocity", c_float)
+        ]
+
+class CP2Cmd(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("cpMode", c_byte),
+        ("x", c_float),
+        ("y", c_float),
+        ("z", c_float),
+        ("velocity", c_float)
+        ]
+        
+class CPCommonParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("velocityRatio", c_float), 
+        ("accelerationRatio", c_float)
+        ]
+
+##################  圆弧：ARC   ##################
+class ARCPoint(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("x", c_float),
+        ("y", c_float),
+        ("z", c_float),
+        ("rHead", c_float)
+    ]
+        
+class ARCParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("xyzVelocity", c_float), 
+        ("rVelocity", c_float),
+        ("xyzAcceleration", c_float), 
+        ("rAcceleration", c_float)
+        ]
+
+class ARCCmd(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("cirPoint", ARCPoint),
+        ("toPoint", ARCPoint)
+    ]
+    
+class CircleCmd(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("cirPoint", ARCPoint),
+        ("toPoint", ARCPoint)
+    ]
+
+class ARCCommonParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("velocityRatio", c_float), 
+        ("accelerationRatio", c_float)
+        ]
+
+##################  User parameters   ##################
+
+class WAITParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("unitType", c_byte)
+        ]
+
+class WAITCmd(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("waitTime", c_uint32)
+        ]
+
+TRIGMode = enum(
+    TRIGInputIOMode = 0,
+    TRIGADCMode=1)
+    
+TRIGInputIOCondition = enum(
+    TRIGInputIOEqual = 0,
+    TRIGInputIONotEqual=1)
+    
+TRIGADCCondition = enum(
+    TRIGADCLT = 0,
+    TRIGADCLE=1, 
+    TRIGADCGE = 2,
+    TRIGADCGT=3)
+    
+class TRIGCmd(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("address", c_byte), 
+        ("mode", c_byte), 
+        ("condition",  c_byte), 
+        ("threshold", c_uint16)
+        ]
+
+    
+        
+        
+        
+        
+
+class UserParams(Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("params1", c_float),
+        ("params2", c_float),
+        ("params3", c_float),
+        ("params4", c_float),
+        ("params5", c_float),
+        ("params6", c_float),
+        ("params7", c_float),
+        ("params8", c_float)
+        ]
+
+ZDFCalibStatus = enum(
+    ZDFCalibNotFinished=0,
+    ZDFCalibFinished=1)
+    
+
+        
+        
+        
+
+ColorPort = enum(
+    PORT_GP1 = 0, 
+    PORT_GP2 = 1,
+    PORT_GP4 = 2,
+    PORT_GP5 = 3
+    )
+    
+InfraredPort = enum(
+    PORT_GP1 = 0, 
+    PORT_GP2 = 1,
+    PORT_GP4 = 2,
+    PORT_GP5 = 3
+    )
+    
+UART4PeripheralsType = enum(
+    UART4PeripheralsUART = 0,
+    UART4PeripheralsWIFI = 1,
+    UART4PeripheralsBLE = 2,
+    UART4PeripheralsCH375 = 3
+    )
+##################  API result   ##################
+
+DobotConnect = enum(
+    DobotConnect_NoError=0,
+    DobotConnect_NotFound=1,
+    DobotConnect_Occupied=2)
+
+DobotCommunicate = enum(
+    DobotCommunicate_NoError=0,
+    DobotCommunicate_BufferFull=1,
+    DobotCommunicate_Timeout=2,
+    DobotCommunicate_InvalidParams=3,
+    DobotCommunicate_InvalidDevice=4
+    )
+
+isUsingLinearRail = False
+##################  API func   ##################
+
+#parker add 2018 8 29 添加Wifi设置模块退出标志位
+QuitDobotApiFlag = True
+
+##################  DLL signatures   ##################
+
+# DobotDll.h早于多设备接口，这里的签名按各封装函数的实际调用整理
+# DobotDll.h predates the (masterId, slaveId) arguments, so these follow the
+# wrapper call sites. Every export returns a DobotCommunicate/DobotConnect code.
+_IDS = [c_int, c_int]
+_QUEUED = [c_bool, POINTER(c_uint64)]
+
+_SIGNATURES = {
+    "DobotExec": [],
+    "PeriodicTask": [],
+    "SetDebugEnable": [c_bool],
+    "SearchDobot": [c_char_p, c_uint32],
+    "ConnectDobot": [c_char_p, c_uint32, POINTER(ConnectInfo)],
+    "DisconnectDobot": [c_int],
+    "SetCmdTimeout": [c_int, c_uint32],
+    "GetMarlinVersion": _IDS,
+
+    # Queued command
+    "GetQueuedCmdCurrentIndex": _IDS + [POINTER(c_uint64)],
+    "GetQueuedCmdMotionFinish": _IDS + [POINTER(c_bool)],
+    "SetQueuedCmdStartExec": _IDS,
+    "SetQueuedCmdStopExec": _IDS,
+    "SetQueuedCmdForceStopExec": _IDS,
+    "SetQueuedCmdStartDownload": _IDS + [c_uint32, c_uint32],
+    "SetQueuedCmdStopDownload": _IDS,
+    "SetQueuedCmdClear": _IDS,
+
+    # Device information
+    "SetDeviceSN": _IDS + [c_char_p],
+    "GetDeviceSN": _IDS + [c_char_p, c_uint32],
+    # SetDeviceNumName也走这个接口，参数可能是字符串或整数
+    "SetDeviceName": _IDS,
+    "GetDeviceName": _IDS + [c_char_p, c_uint32],
+    "GetDeviceVersion": _IDS + [POINTER(DeviceVersion)],
+    "SetDeviceWithL": _IDS + [c_bool, c_uint8] + _QUEUED,
+    "GetDeviceWithL": _IDS + [POINTER(c_bool)],
+    "GetDeviceTime": _IDS + [POINTER(c_uint32)],
+    "GetDeviceID": _IDS + [POINTER(DeviceID)],
+    "GetDeviceInfo": _IDS + [POINTER(DeviceCountInfo)],
+    "GetUART4PeripheralsType": _IDS + [POINTER(c_uint8)],
+    "RestartMagicBox": _IDS,
+    "PrintInfo": _IDS + [c_char_p],
+    "SetProgbar": _IDS + [c_uint8],
+
+    # Pose
+    "GetPose": _IDS + [POINTER(Pose)],
+    "ResetPose": _IDS + [c_bool, c_float, c_float],
+    "GetKinematics": _IDS + [POINTER(Kinematics)],
+    "GetPoseL": _IDS + [POINTER(c_float)],
+
+    # Alarms
+    "GetAlarmsState": _IDS + [c_char_p, POINTER(c_int), c_uint32],
+    "ClearAllAlarmsState": _IDS,
+    "GetUserParams": _IDS + [POINTER(UserParams)],
+
+    # HOME
+    "SetHOMEParams": _IDS + [POINTER(HOMEParams)] + _QUEUED,
+    "GetHOMEParams": _IDS + [POINTER(HOMEParams)],
+    "SetHOMECmd": _IDS + [POINTER(HOMECmd)] + _QUEUED,
+    "SetAutoLevelingCmd": _IDS + [POINTER(AutoLevelingCmd)] + _QUEUED,
+    "GetAutoLevelingResult": _IDS + [POINTER(c_float)],
+
+    # Arm orientation
+    "SetArmOrientation": _IDS + [c_int] + _QUEUED,
+    "GetArmOrientation": _IDS + [POINTER(c_int32)],
+
+    # Handheld teach
+    "SetHHTTrigMode": _IDS + [c_int],
+    "GetHHTTrigMode": _IDS + [POINTER(c_int)],
+    "SetHHTTrigOutputEnabled": _IDS + [c_bool],
+    "GetHHTTrigOutputEnabled": _IDS + [POINTER(c_int32)],
+    "GetHHTTrigOutput": _IDS + [POINTER(c_int32)],
+
+    # EndEffector
+    "SetEndEffectorParams": _IDS + [POINTER(EndTypeParams)] + _QUEUED,
+    "GetEndEffectorParams": _IDS + [POINTER(EndTypeParams)],
+    "SetEndEffectorLaser": _IDS + [c_bool, c_bool] + _QUEUED,
+    "GetEndEffectorLaser": _IDS + [POINTER(c_int), POINTER(c_int)],
+    "SetEndEffectorSuctionCup": _IDS + [c_bool, c_bool] + _QUEUED,
+    "GetEndEffectorSuctionCup": _IDS + [POINTER(c_int), POINTER(c_int)],
+    "SetEndEffectorGripper": _IDS + [c_bool, c_bool] + _QUEUED,
+    "GetEndEffectorGripper": _IDS + [POINTER(c_int), POINTER(c_int)],
+    "SetEndEffectorType": _IDS + [c_bool, c_uint8, POINTER(c_uint64)],
+    "GetEndEffectorType": _IDS + [POINTER(c_uint8)],
+
+    # JOG
+    "SetJOGJointParams": _IDS + [POINTER(JOGJointParams)] + _QUEUED,
+    "GetJOGJointParams": _IDS + [POINTER(JOGJointParams)],
+    "SetJOGCoordinateParams": _IDS + [POINTER(JOGCoordinateParams)] + _QUEUED,
+    "GetJOGCoordinateParams": _IDS + [POINTER(JOGCoordinateParams)],
+    "SetJOGLParams": _IDS + [POINTER(JOGLParams)] + _QUEUED,
+    "GetJOGLParams": _IDS + [POINTER(JOGLParams)],
+    "SetJOGCommonParams": _IDS + [POINTER(JOGCommonParams)] + _QUEUED,
+    "GetJOGCommonParams": _IDS + [POINTER(JOGCommonParams)],
+    "SetJOGCmd": _IDS + [POINTER(JOGCmd)] + _QUEUED,
+
+    # PTP
+    "SetPTPJointParams": _IDS + [POINTER(PTPJointParams)] + _QUEUED,
+    "GetPTPJointParams": _IDS + [POINTER(PTPJointParams)],
+    "SetPTPCoordinateParams": _IDS + [POINTER(PTPCoordinateParams)] + _QUEUED,
+    "GetPTPCoordinateParams": _IDS + [POINTER(PTPCoordinateParams)],
+    "SetPTPLParams": _IDS + [POINTER(PTPLParams)] + _QUEUED,
+    "GetPTPLParams": _IDS + [POINTER(PTPLParams)],
+    "SetPTPJumpParams": _IDS + [POINTER(PTPJumpParams)] + _QUEUED,
+    "GetPTPJumpParams": _IDS + [POINTER(PTPJumpParams)],
+    "SetPTPCommonParams": _IDS + [POINTER(PTPCommonParams)] + _QUEUED,
+    "GetPTPCommonParams": _IDS + [POINTER(PTPCommonParams)],
+    "SetPTPCmd": _IDS + [POINTER(PTPCmd)] + _QUEUED,
+    "SetPTPWithLCmd": _IDS + [POINTER(PTPWithLCmd)] + _QUEUED,
+    "SetArmSpeedRatio": _IDS + [c_bool, c_uint8, c_uint8, POINTER(c_uint64)],
+    "GetArmSpeedRatio": _IDS + [c_uint8, POINTER(c_uint8)],
+    "SetLSpeedRatio": _IDS + [c_bool, c_uint8, c_uint8, POINTER(c_uint64)],
+    "GetLSpeedRatio": _IDS + [c_uint8, POINTER(c_uint8)],
+
+    # CP
+    "SetCPRHoldEnable": _IDS + [c_bool],
+    "GetCPRHoldEnable": _IDS + [POINTER(c_bool)],
+    "SetCPParams": _IDS + [POINTER(CPParams)] + _QUEUED,
+    "GetCPParams": _IDS + [POINTER(CPParams)],
+    "SetCPCmd": _IDS + [POINTER(CPCmd)] + _QUEUED,
+    "SetCP2Cmd": _IDS + [POINTER(CP2Cmd)] + _QUEUED,
+    "SetCPLECmd": _IDS + [POINTER(CPCmd)] + _QUEUED,
+    "SetCPCommonParams": _IDS + [POINTER(CPCommonParams)] + _QUEUED,
+    "GetCPCommonParams": _IDS + [POINTER(CPCommonParams)],
+
+    # ARC
+    "SetARCParams": _IDS + [POINTER(ARCParams)] + _QUEUED,
+    "GetARCParams": _IDS + [POINTER(ARCParams)],
+    "SetARCCmd": _IDS + [POINTER(ARCCmd)] + _QUEUED,
+    "SetCircleCmd": _IDS + [POINTER(CircleCmd)] + _QUEUED,
+    "SetARCCommonParams": _IDS + [POINTER(ARCCommonParams)] + _QUEUED,
+    "GetARCCommonParams": _IDS + [POINTER(ARCCommonParams)],
+
+    # WAIT / TRIG
+    "SetWAITCmd": _IDS + [POINTER(WAITCmd)] + _QUEUED,
+    "SetTRIGCmd": _IDS + [POINTER(TRIGCmd)] + _QUEUED,
+
+    # EIO
+    "SetMotorMode": _IDS + [c_int],
+    "GetMotorMode": _IDS + [POINTER(c_int)],
+    "SetServoAngle": _IDS + [c_bool, c_uint8, c_float, POINTER(c_uint64)],
+    "GetServoAngle": _IDS + [c_uint8, POINTER(c_float)],
+
+    # CAL
+    "SetAngleSensorStaticError": _IDS + [c_float, c_float],
+    "GetAngleSensorStaticError": _IDS + [POINTER(c_float), POINTER(c_float)],
+    "SetAngleSensorCoef": _IDS + [c_float, c_float],
+    "GetAngleSensorCoef": _IDS + [POINTER(c_float), POINTER(c_float)],
+    "SetBaseDecoderStaticError": _IDS + [c_float],
+    "GetBaseDecoderStaticError": _IDS + [POINTER(c_float)],
+
+    # LOSTSTEP
+    "SetLostStepParams": _IDS + [c_float] + _QUEUED,
+    "SetLostStepCmd": _IDS + _QUEUED,
+    "SetLostStepEnableAndParamsCmd": _IDS + [c_uint8, c_float] + _QUEUED,
+    "GetLostStepEnableAndParamsCmd": _IDS + [POINTER(c_uint8), POINTER(c_float)],
+}
+
+
+##################  Lazy submodules   ##################
+
+# IO、WIFI、Seeed传感器、固件升级接口和位姿采样放在子模块里，第一次用到时才导入
+# The IO, WIFI, Seeed sensor and firmware upgrade wrappers and the pose
+# sampler live in submodules that are imported the first time one of their
+# names is used.
+_LAZY_MODULES = {
+    "IO": (
+        "EMotor", "EMotorS", "GPIOType", "IOMultiplexing", "IODO", "IOPWM", "IODI", "IOADC",
+        "SetIOMultiplexing", "GetIOMultiplexing", "SetIODO", "GetIODO", "SetIOPWM", "GetIOPWM",
+        "GetIODI", "SetEMotor", "SetEMotorS", "GetIOADC", "SetColorSensor", "GetColorSensor",
+        "SetInfraredSensor", "GetInfraredSensor", "SetIOMultiplexingEx", "SetIODOEx",
+        "SetEMotorEx", "SetEMotorSEx", "SetIOPWMEx", "GetColorSensorEx", "SetIOMultiplexingExt",
+        "GetIOMultiplexingExt", "GetIOADCExt", "SetIOPWMExt", "GetIOPWMExt", "GetIODIExt",
+        "SetIODOExt", "GetIODOExt", "SetEMotorExt", "SetEMotorSExt", "SetColorSensorExt",
+        "SetInfraredSensorExt", "GetInfraredSensorExt", "GetColorSensorExt",
+        "SetIOMultiplexingExtEx", "SetIOPWMExtEx", "SetIODOExtEx", "SetEMotorExtEx",
+        "SetEMotorSExtEx", "SetColorSensorExtEx", "SetInfraredSensorExtEx",
+    ),
+    "WIFI": (
+        "WIFIIPAddress", "WIFINetmask", "WIFIGateway", "WIFIDNS", "GetWIFIConnectStatus",
+        "SetWIFIConfigMode", "GetWIFIConfigMode", "SetWIFISSID", "GetWIFISSID", "SetWIFIPassword",
+        "GetWIFIPassword", "SetWIFIIPAddress", "GetWIFIIPAddress", "SetWIFINetmask",
+        "GetWIFINetmask", "SetWIFIGateway", "GetWIFIGateway", "SetWIFIDNS", "GetWIFIDNS",
+    ),
+    "Seeed": (
+        "GetSeeedColorSensorExt", "SetSeeedColorSensorExt", "GetSeeedDistanceSensorExt",
+        "SetSeeedTempSensorExt", "GetSeeedTempSensorExt", "SetSeeedLightSensorExt",
+        "GetSeeedLightSensorExt", "SetSeeedRgbExt", "SetSeeedColorSensorExtEx",
+        "SetSeeedTempSensorExtEx", "SetSeeedLightSensorExtEx", "SetSeeedRgbExtEx",
+    ),
+    "Firmware": (
+        "UpgradeFWReadyCmd", "SetUpgradeFWReadyCmd", "GetUpgradeFWReadyCmd",
+    ),
+    "Telemetry": (
+        "POSE_COLUMNS", "PoseSampler",
+    ),
+}
+
+_LAZY = dict((name, module) for module, names in _LAZY_MODULES.items() for name in names)
+
+
+def _importLazy(module):
+    mod = importlib.import_module("." + module, __name__)
+    globals().update((name, getattr(mod, name)) for name in _LAZY_MODULES[module])
+    return mod
+
+
+def _signature(name):
+    # 子模块导入时会把自己的签名加进_SIGNATURES
+    if name not in _SIGNATURES:
+        for module in _LAZY_MODULES:
+            _importLazy(module)
+    return _SIGNATURES.get(name)
+
+
+def _attachMethods(namespace):
+    # 把模块里所有以api为首参数的函数挂到DobotSession上
+    # Expose every wrapper defined in ``namespace`` as a DobotSession method
+    for name, func in list(namespace.items()):
+        if (isinstance(func, types.FunctionType) and func.__module__ == namespace["__name__"]
+                and func.__code__.co_varnames[:1] == ("api",)):
+            setattr(DobotSession, name, func)
+
+
+##################  Generated wrappers   ##################
+
+# 路由类别 -> (目标id, Ex函数等待的队列)；"all"的目标是一组id
+# Routing class -> (target id, queue the waiting variant polls); the target
+# of "all" is a tuple of ids.
+_ROUTES = {
+    "arm": (operator.attrgetter("slaveId"), operator.attrgetter("routes.armQueue")),
+    "box": (operator.attrgetter("routes.box"), operator.attrgetter("routes.boxQueue")),
+    "controller": (lambda session: -1, operator.attrgetter("routes.controllerQueue")),
+    "all": (operator.attrgetter("routes.all"), operator.attrgetter("routes.armQueue")),
+}
+
+
+def _literal(text):
+    # 参数表里的默认值只有数字和True/False
+    if text in ("True", "False"):
+        return text == "True"
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _bindArgs(name, names, defaults, args, kwargs):
+    # 关键字参数和默认值补成位置参数，报错与普通函数一致
+    count = len(names)
+    if len(args) > count:
+        raise TypeError("%s() takes %d positional arguments but %d were given" % (name, count + 1, len(args) + 1))
+    for paramName in names[:len(args)]:
+        if paramName in kwargs:
+            raise TypeError("%s() got multiple values for argument '%s'" % (name, paramName))
+    values = list(args)
+    required = count - len(defaults)
+    for i in range(len(args), count):
+        paramName = names[i]
+        if paramName in kwargs:
+            values.append(kwargs.pop(paramName))
+        elif i >= required:
+            values.append(defaults[i - required])
+        else:
+            raise TypeError("%s() missing required argument: '%s'" % (name, paramName))
+    if kwargs:
+        raise TypeError("%s() got an unexpected keyword argument '%s'" % (name, next(iter(kwargs))))
+    return tuple(values)
+
+
+def _structBuilder(structType, fields):
+    # 参数正好是结构体的前几个字段时按位置构造，否则逐个字段赋值；
+    # 嵌套结构体（如ARCCmd的两个点）从序列构造
+    fieldTypes = dict(structType._fields_)
+    order = [field for field, _ in structType._fields_][:len(fields)]
+    nested = any(isinstance(fieldTypes[field], type) and issubclass(fieldTypes[field], Structure) for field in fields)
+    if order == list(fields) and not nested:
+        return None
+    setters = []
+    for field in fields:
+        fieldType = fieldTypes[field]
+        if isinstance(fieldType, type) and issubclass(fieldType, Structure):
+            setters.append((field, fieldType, len(fieldType._fields_)))
+        else:
+            setters.append((field, None, 0))
+
+    def build(args):
+        param = structType()
+        for (field, fieldType, size), value in zip(setters, args):
+            setattr(param, field, value if fieldType is None else fieldType(*value[:size]))
+        return param
+    return build
+
+
+def _wrapper(name, symbol, params, results, route, wait, isQueued=0, cache=None):
+    signature = _SIGNATURES[symbol]
+    queued = signature[-len(_QUEUED):] == _QUEUED
+    argtypes = signature[len(_IDS):len(signature) - len(_QUEUED) if queued else len(signature)]
+    targetOf, queueOf = _ROUTES[route]
+    multi = route == "all"
+    names = []
+    defaults = []
+    fields = []
+    for param in params:
+        # "name[:field][=default]"
+        declaration, _, default = param.partition("=")
+        paramName, _, field = declaration.partition(":")
+        names.append(paramName)
+        if default:
+            defaults.append(_literal(default))
+        fields.append(field or paramName)
+    if queued:
+        names.append("isQueued")
+        defaults.append(isQueued)
+    elif cache is not None:
+        names.append("refresh")
+        defaults.append(False)
+    names = tuple(names)
+    defaults = tuple(defaults)
+    count = len(names)
+    required = count - len(defaults)
+    inputs = len(fields)
+
+    struct = len(argtypes) == 1 and hasattr(argtypes[0], "contents") and issubclass(argtypes[0]._type_, Structure)
+    if struct:
+        # 结构体参数：输入写进字段，输出读字段
+        structType = argtypes[0]._type_
+        build = _structBuilder(structType, fields)
+        getter = operator.attrgetter(*results) if results else None
+        single = bool(results) and len(results) == 1
+    else:
+        # 标量参数在前按顺序取输入，指针参数在后是输出
+        outTypes = tuple(argtype._type_ for argtype in argtypes if hasattr(argtype, "contents"))
+        if any(hasattr(argtype, "contents") for argtype in argtypes[:len(argtypes) - len(outTypes)]):
+            raise ValueError("%s: output arguments must come last" % symbol)
+        if len(argtypes) - len(outTypes) != inputs:
+            raise ValueError("%s: expected %d parameters" % (symbol, len(argtypes) - len(outTypes)))
+        select = None if results is None else tuple(results)
+    if multi and not queued:
+        raise ValueError("%s: only queued writes can go to every device" % symbol)
+    if cache is not None and not (struct and (queued or not inputs)):
+        raise ValueError("%s: cached parameters must be a structure read without arguments" % symbol)
+
+    if queued:
+        def wrapper(api, *args, **kwargs):
+            if kwargs or len(args) != count:
+                if kwargs or not required <= len(args) <= count:
+                    args = _bindArgs(name, names, defaults, args, kwargs)
+                else:
+                    args += defaults[len(args) - required:]
+            session = _session(api)
+            if struct:
+                param = structType(*args[:inputs]) if build is None else build(args)
+                callArgs = (byref(param), args[-1])
+            else:
+                # 标量输入后面正好是isQueued
+                param = None
+                callArgs = args
+            if cache is not None:
+                unchanged = _unchangedParams(session, cache, param, args[-1])
+                if unchanged is not None:
+                    if wait:
+                        _waitQueuedCmdIndex(api, unchanged[0], queueOf(session))
+                        return None
+                    return unchanged
+            queuedCmdIndex = c_uint64(0)
+            func = getattr(session.dll, symbol)
+            if multi:
+                for target in targetOf(session):
+                    _call(session, 5, func, session.masterId, target, *callArgs, byref(queuedCmdIndex))
+            else:
+                _call(session, 5, func, session.masterId, targetOf(session), *callArgs, byref(queuedCmdIndex))
+            if cache is not None:
+                _storeParams(session, cache, param, queuedCmdIndex.value)
+            if wait:
+                _waitQueuedCmdIndex(api, queuedCmdIndex.value, queueOf(session))
+                return None
+            return [queuedCmdIndex.value]
+    elif struct:
+        def wrapper(api, *args, **kwargs):
+            if kwargs or len(args) != count:
+                if kwargs or not required <= len(args) <= count:
+                    args = _bindArgs(name, names, defaults, args, kwargs)
+                else:
+                    args += defaults[len(args) - required:]
+            session = _session(api)
+            if cache is not None:
+                cached = _cachedParams(session, cache, args[0])
+                if cached is not None:
+                    return cached
+                param = structType()
+            else:
+                param = structType(*args) if build is None else build(args)
+            _call(session, 5, getattr(session.dll, symbol), session.masterId, targetOf(session), byref(param))
+            if cache is not None:
+                return _storeParams(session, cache, param)
+            if getter is None:
+                return None
+            return [getter(param)] if single else list(getter(param))
+    else:
+        # 输出个数不多，分开写免得每次都走循环
+        outCount = len(outTypes)
+        out0, out1, out2 = (outTypes + (None, None, None))[:3]
+
+        def wrapper(api, *args, **kwargs):
+            if kwargs or len(args) != count:
+                if kwargs or not required <= len(args) <= count:
+                    args = _bindArgs(name, names, defaults, args, kwargs)
+                else:
+                    args += defaults[len(args) - required:]
+            session = _session(api)
+            func = getattr(session.dll, symbol)
+            if outCount == 0:
+                _call(session, 5, func, session.masterId, targetOf(session), *args)
+                return None
+            if outCount == 1:
+                a = out0()
+                _call(session, 5, func, session.masterId, targetOf(session), *args, byref(a))
+                values = [a.value]
+            elif outCount == 2:
+                a = out0()
+                b = out1()
+                _call(session, 5, func, session.masterId, targetOf(session), *args, byref(a), byref(b))
+                values = [a.value, b.value]
+            elif outCount == 3:
+                a = out0()
+                b = out1()
+                c = out2()
+                _call(session, 5, func, session.masterId, targetOf(session), *args, byref(a), byref(b), byref(c))
+                values = [a.value, b.value, c.value]
+            else:
+                outputs = [outType() for outType in outTypes]
+                _call(session, 5, func, session.masterId, targetOf(session), *args, *[byref(out) for out in outputs])
+                values = [out.value for out in outputs]
+            return values if select is None else [values[i] for i in select]
+
+    # inspect.signature读__text_signature__，不必为此导入inspect
+    signature = "(%s)" % ", ".join(
+        ["api"] + [n if i < required else "%s=%r" % (n, defaults[i - required]) for i, n in enumerate(names)])
+    wrapper.__name__ = wrapper.__qualname__ = name
+    wrapper.__text_signature__ = signature
+    wrapper.__doc__ = name + signature
+    return wrapper
+
+
+def _generate(namespace, specs):
+    """Define the wrappers described by ``specs`` in ``namespace``.
+
+    Each spec is (symbol, params, results, variants[, options]). ``symbol``
+    is the DLL function; its _SIGNATURES entry decides the rest: a single
+    struct pointer is filled from ``params`` (a nested structure field from
+    a sequence) and, for a read, ``results`` names the fields returned;
+    otherwise plain arguments are taken from ``params`` in order and the
+    pointer arguments are outputs, all returned unless ``results`` picks
+    some by position. A params entry is "name", "name:field" or
+    "name=default". ``variants`` lists (suffix, routing class, wait[,
+    isQueued default]) for every function to define, e.g. ("Ext",
+    "controller", False) makes symbol + "Ext" send to the controller box,
+    and "all" sends to every id in DeviceRoutes.all; queued writes with
+    ``wait`` block until the command has run, like the other *Ex
+    functions. ``options`` may give ``cache``, the parameter-cache name
+    the wrapper reads and writes through (a read then takes ``refresh``).
+
+    The wrappers are closures made here at import, so nothing is compiled
+    or written to disk; whether a call fills a structure, is queued or goes
+    through the cache is settled when the closure is made. They take the
+    same positional and keyword arguments as hand-written functions, and
+    ``__doc__`` and inspect.signature() show the call signature.
+    """
+    module = namespace["__name__"]
+    for spec in specs:
+        symbol, params, results, variants = spec[:4]
+        options = spec[4] if len(spec) > 4 else {}
+        for variant in variants:
+            suffix, route, wait = variant[:3]
+            isQueued = variant[3] if len(variant) > 3 else 0
+            func = _wrapper(symbol + suffix, symbol, params, results, route, wait, isQueued, **options)
+            func.__module__ = module
+            namespace[symbol + suffix] = func
+
+
+class _DobotLibrary(CDLL):
+    # 函数第一次被取到时才设置签名，CDLL随后把函数对象缓存在实例上
+    # argtypes are set when a function is first looked up; CDLL then caches
+    # the function object, so later api.XXX calls reuse the prepared pointer.
+    def __getitem__(self, name):
+        func = CDLL.__getitem__(self, name)
+        argtypes = _signature(name)
+        if argtypes is not None:
+            func.argtypes = argtypes
+            func.restype = c_int
+        return func
+
+
+class _LazyLibrary(object):
+    # 第一次调用时才打开dll
+    # Opens the library on first use
+    def __init__(self, factory, path):
+        self._factory = factory
+        self._path = path
+        self._dll = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._dll is None:
+                self._dll = self._factory(self._path)
+        return self._dll
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self._dll or self._load(), name)
+
+    def __getitem__(self, name):
+        return (self._dll or self._load())[name]
+
+
+##################  Backends   ##################
+
+# load()可选的后端：名字 -> factory(path)，返回带有dll同名函数的对象
+# Backends selectable in load(): name -> factory(path), returning an object
+# that has the DLL's function names.
+_BACKENDS = {}
+
+_LIBRARY_NAMES = {
+    "Windows": "./DobotDll.dll",
+    "Darwin": "./libDobotDll.dylib",
+    "Linux": "libDobotDll.so",
+}
+
+
+def registerBackend(name, factory):
+    _BACKENDS[name] = factory
+
+
+def _ctypesBackend(path=None):
+    import platform
+    system = platform.system()
+    if system == "Windows":
+        # 您用的dll是64位，为了顺利运行，请保证您的python环境也是64位
+        if platform.architecture()[0] != "64bit":
+            warnings.warn("DobotDll is 64-bit but this Python is %s" % platform.architecture()[0], RuntimeWarning)
+    if path is None:
+        path = os.environ.get("DOBOT_DLL_PATH") or _LIBRARY_NAMES.get(system, "libDobotDll.so")
+    return _DobotLibrary(path,  RTLD_GLOBAL)
+
+
+def _simulatorBackend(path=None):
+    import DobotSimulator
+    # DOBOT_SIM_SPEED>1时按倍速运行
+    speed = float(os.environ.get("DOBOT_SIM_SPEED", "1"))
+    return DobotSimulator.SimulatedDll(clock=DobotSimulator.SimClock(speed))
+
+
+def _serialBackend(path=None):
+    import DobotProtocol
+    return DobotProtocol.SerialDll()
+
+
+registerBackend("ctypes", _ctypesBackend)
+registerBackend("sim", _simulatorBackend)
+registerBackend("serial", _serialBackend)
+
+
+def load(backend=None, path=None, lazy=False):
+    """Load the Dobot library and return the object passed around as ``api``.
+
+    ``backend`` defaults to the DOBOT_BACKEND environment variable, else
+    "ctypes". The ctypes backend opens ``path``, DOBOT_DLL_PATH, or the
+    platform's default library name; "sim" is the in-process simulator and
+    "serial" speaks the Magician serial protocol without the DLL.
+
+    With ``lazy=True`` the backend is only created by the first call
+    through the returned handle.
+    """
+    if backend is None:
+        backend = os.environ.get("DOBOT_BACKEND", "ctypes")
+    try:
+        factory = _BACKENDS[backend]
+    except KeyError:
+        raise ValueError("unknown backend %r, expected one of %s" % (backend, ", ".join(sorted(_BACKENDS))))
+    if lazy:
+        return _LazyLibrary(factory, path)
+    return factory(path)
+
+
+def dSleep(ms):
+    time.sleep(ms / 1000)  
+
+def gettime():
+    return [time.time()]
+
+
+##################  Retry   ##################
+
+RETRY = "retry"
+FAIL = "fail"
+
+_COMMUNICATE_NAMES = dict((v, k) for k, v in vars(DobotCommunicate).items() if k.startswith("DobotCommunicate_"))
+
+
+class DobotCommunicateError(Exception):
+    """A DLL call kept failing until the session's RetryPolicy gave up."""
+
+    def __init__(self, function, result, attempts):
+        Exception.__init__(self, "%s failed with %s after %d attempt(s)" % (
+            function, _COMMUNICATE_NAMES.get(result, result), attempts))
+        self.function = function
+        self.result = result
+        self.attempts = attempts
+
+
+class RetryPolicy(object):
+    """How the wrappers retry a DLL call that did not return NoError.
+
+    maxAttempts  total calls allowed, None for no limit
+    timeout      ms budget for all attempts of one call, None for no limit
+    delay        first pause in ms; None keeps each wrapper's own delay
+    backoff      factor applied to the pause after every retry
+    maxDelay     upper bound for the pause in ms
+    jitter       random spread of each pause, 0.2 means +/-20%
+    actions      {DobotCommunicate code: RETRY or FAIL}, unlisted codes retry
+
+    The defaults retry forever with a fixed pause, as the wrappers always did.
+    When a limit is hit DobotCommunicateError is raised.
+    """
+
+    def __init__(self, maxAttempts=None, timeout=None, delay=None, backoff=1.0, maxDelay=None, jitter=0.0, actions=None):
+        self.maxAttempts = maxAttempts
+        self.timeout = timeout
+        self.delay = delay
+        self.backoff = backoff
+        self.maxDelay = maxDelay
+        self.jitter = jitter
+        self.actions = dict(actions) if actions else {}
+
+    def retry(self, func, args, result, delay=5, abort=None, token=None):
+        # result为第一次调用的返回值；成功时返回NoError，否则抛出异常
+        # token被取消时在暂停中立即抛出DobotCancelledError
+        attempts = 1
+        start = time.monotonic()
+        wait = delay if self.delay is None else self.delay
+        while True:
+            if self.actions.get(result, RETRY) == FAIL:
+                raise DobotCommunicateError(getattr(func, "__name__", repr(func)), result, attempts)
+            if self.maxAttempts is not None and attempts >= self.maxAttempts:
+                raise DobotCommunicateError(getattr(func, "__name__", repr(func)), result, attempts)
+            pause = wait
+            if self.jitter:
+                pause += wait * self.jitter * random.uniform(-1.0, 1.0)
+            if self.timeout is not None and (time.monotonic() - start) * 1000 + pause > self.timeout:
+                raise DobotCommunicateError(getattr(func, "__name__", repr(func)), result, attempts)
+            if token is not None:
+                token.sleep(pause / 1000)
+            else:
+                dSleep(pause)
+            if abort is not None and abort():
+                return result
+            result = func(*args)
+            attempts += 1
+            if result == DobotCommunicate.DobotCommunicate_NoError:
+                return result
+            wait *= self.backoff
+            if self.maxDelay is not None and wait > self.maxDelay:
+                wait = self.maxDelay
+
+
+# GetDeviceID一直只尝试5次，失败时返回错误码
+_deviceIDRetryPolicy = RetryPolicy(maxAttempts=5)
+
+
+def _call(session, delay, func, *args, policy=None):
+    if session.stats is not None:
+        return session.stats.call(func, args, policy or session.retryPolicy, delay, token=_cancelToken(session))
+    result = func(*args)
+    if result != DobotCommunicate.DobotCommunicate_NoError:
+        result = (policy or session.retryPolicy).retry(func, args, result, delay, token=_cancelToken(session))
+    return result
+
+
+def _callOnce(session, func, *args):
+    # 不重试的调用（连接、断开等），开启统计时同样记录
+    if session.stats is not None:
+        return session.stats.call(func, args)
+    return func(*args)
+
+
+def _quitRequested():
+    return not QuitDobotApiFlag
+
+
+##################  Cancellation   ##################
+
+class DobotCancelledError(Exception):
+    """A retry loop or completion wait was given up because its CancelToken
+    was cancelled; ``reason`` is "timeout" when its deadline passed."""
+
+    def __init__(self, reason):
+        Exception.__init__(self, reason)
+        self.reason = reason
+
+
+class CancelToken(object):
+    """Lets another thread, or a deadline, break blocking calls.
+
+    Retry pauses and completion waits watching the token wake as soon as
+    cancel() is called and raise DobotCancelledError. ``timeout`` (ms)
+    cancels the token by itself with reason "timeout". A token made with
+    ``parent`` is cancelled with its parent and keeps the earlier of the
+    two deadlines.
+    """
+
+    def __init__(self, timeout=None, parent=None):
+        self.reason = None
+        self.deadline = None if timeout is None else time.monotonic() + timeout / 1000
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self._unlink = None
+        if parent is not None:
+            if parent.deadline is not None and (self.deadline is None or parent.deadline < self.deadline):
+                self.deadline = parent.deadline
+            self._unlink = parent.onCancel(self.cancel)
+
+    def cancel(self, reason="cancelled"):
+        with self._lock:
+            if self.reason is not None:
+                return
+            self.reason = reason
+            callbacks, self._callbacks = self._callbacks, []
+        self._event.set()
+        for callback in callbacks:
+            callback(reason)
+
+    def cancelled(self):
+        if self.reason is None and self.deadline is not None and time.monotonic() >= self.deadline:
+            self.cancel("timeout")
+        return self.reason is not None
+
+    def remaining(self):
+        """Seconds left before the deadline, None without one."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def wait(self, seconds=None):
+        """Sleep up to ``seconds`` (None: until cancelled); True if cancelled."""
+        remaining = self.remaining()
+        if remaining is not None and (seconds is None or remaining < seconds):
+            seconds = remaining
+        self._event.wait(seconds)
+        return self.cancelled()
+
+    def sleep(self, seconds):
+        """wait(), raising DobotCancelledError if the token was cancelled."""
+        if self.wait(seconds):
+            raise DobotCancelledError(self.reason)
+
+    def check(self):
+        """Raise DobotCancelledError if the token has been cancelled."""
+        if self.cancelled():
+            raise DobotCancelledError(self.reason)
+
+    def onCancel(self, callback):
+        """Call ``callback(reason)`` when cancelled, or now if already.
+
+        Returns a function that unregisters the callback. Deadlines do not
+        trigger callbacks; waiters watch them through remaining().
+        """
+        with self._lock:
+            if self.reason is None:
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        callback(self.reason)
+        return lambda: None
+
+    def _remove(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def close(self):
+        # 不再需要时与父令牌解除关联
+        if self._unlink is not None:
+            self._unlink()
+            self._unlink = None
+
+
+def _cancelToken(session):
+    # 当前线程的cancellable()作用域，没有则用会话的令牌
+    return getattr(session.scope, "token", None) or session.cancelToken
+
+
+class _CancelScope(object):
+
+    def __init__(self, session, timeout, token):
+        self.session = session
+        self.timeout = timeout
+        self.token = token
+
+    def __enter__(self):
+        session = self.session
+        self._outer = getattr(session.scope, "token", None)
+        self._scope = CancelToken(self.timeout, parent=self._outer or session.cancelToken)
+        self._unlink = self.token.onCancel(self._scope.cancel) if self.token is not None else None
+        session.scope.token = self._scope
+        return self._scope
+
+    def __exit__(self, *exc):
+        self.session.scope.token = self._outer
+        self._scope.close()
+        if self._unlink is not None:
+            self._unlink()
+
+
+def cancellable(api, timeout=None, token=None):
+    """Scope in which this thread's calls on the session can be cancelled.
+
+        with dType.cancellable(api, timeout=2000) as token:
+            dType.SetPTPCmdEx(api, dType.PTPMode.PTPMOVLXYZMode, 200, 0, 0, 0, isQueued=1)
+
+    Inside the ``with`` block every retry loop and completion wait gives up
+    with DobotCancelledError once ``timeout`` ms have passed, when
+    ``token`` (e.g. one shared by a whole cell) or the yielded token is
+    cancelled, or when CancelWaits() is called on the session.
+    """
+    return _CancelScope(_session(api), timeout, token)
+
+
+def CancelWaits(api, reason="cancelled"):
+    """Break every blocking call now in progress on the session.
+
+    They raise DobotCancelledError(reason) within one poll; calls made
+    afterwards are not affected.
+    """
+    session = _session(api)
+    token, session.cancelToken = session.cancelToken, CancelToken()
+    token.cancel(reason)
+
+
+def SetCancelToken(api, token):
+    _session(api).cancelToken = token
+
+
+def GetCancelToken(api):
+    return _session(api).cancelToken
+
+
+def SetWaitTimeout(api, timeout):
+    _session(api).waitTimeout = timeout
+
+
+def GetWaitTimeout(api):
+    return _session(api).waitTimeout
+
+
+##################  Instrumentation   ##################
+
+# 延时直方图的桶上界，单位ms，最后一个桶收集更慢的调用
+# Upper bounds of the latency histogram buckets in ms; one more bucket
+# collects everything slower.
+LATENCY_BUCKETS = (0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class _FunctionStats(object):
+    __slots__ = ("calls", "attempts", "errors", "totalNs", "maxNs", "buckets", "results")
+
+    def __init__(self):
+        self.calls = 0
+        self.attempts = 0
+        self.errors = 0
+        self.totalNs = 0
+        self.maxNs = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.results = {}
+
+    def percentile(self, q):
+        # 取所在桶的上界，不超过观测到的最大值
+        rank = q * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min(bound, self.maxNs / 1e6)
+        return self.maxNs / 1e6
+
+    def export(self):
+        return {
+            "calls": self.calls,
+            "attempts": self.attempts,
+            "retries": self.attempts - self.calls,
+            "errors": self.errors,
+            "results": dict(self.results),
+            "totalMs": self.totalNs / 1e6,
+            "meanMs": self.totalNs / 1e6 / self.calls if self.calls else 0.0,
+            "maxMs": self.maxNs / 1e6,
+            "p50": self.percentile(0.50),
+            "p90": self.percentile(0.90),
+            "p99": self.percentile(0.99),
+            "histogram": list(zip(LATENCY_BUCKETS + (None,), self.buckets)),
+        }
+
+
+class CallStats(object):
+    """Per-function counters for the DLL calls made by the wrappers.
+
+    Attach one to a session with SetCallStats(api, stats), or pass
+    ``stats=`` to DobotSession; several sessions may share one. While no
+    CallStats is attached the wrappers skip all bookkeeping.
+
+    For every DLL function it counts wrapper calls, attempts (so retries
+    made by the RetryPolicy), calls that raised, and how often each return
+    code came back, and keeps a latency histogram over LATENCY_BUCKETS.
+    Latency is the wall time of the whole call including retries.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bounds = [int(bound * 1e6) for bound in LATENCY_BUCKETS]
+        self._functions = {}
+
+    def call(self, func, args, policy=None, delay=5, abort=None, token=None):
+        # 计数每次尝试的返回值，policy为None时不重试
+        name = getattr(func, "__name__", repr(func))
+        results = []
+
+        def attempt(*args):
+            result = func(*args)
+            results.append(result)
+            return result
+        attempt.__name__ = name
+
+        start = time.perf_counter_ns()
+        failed = True
+        try:
+            result = attempt(*args)
+            if policy is not None and result != DobotCommunicate.DobotCommunicate_NoError:
+                result = policy.retry(attempt, args, result, delay, abort, token)
+            failed = False
+            return result
+        finally:
+            self.record(name, time.perf_counter_ns() - start, results, failed)
+
+    def record(self, name, elapsed, results, failed):
+        """Count one call made outside call(): ``elapsed`` in ns, ``results``
+        the return code of every attempt, ``failed`` when it raised."""
+        bucket = 0
+        for bound in self._bounds:
+            if elapsed <= bound:
+                break
+            bucket += 1
+        with self._lock:
+            stats = self._functions.get(name)
+            if stats is None:
+                stats = self._functions[name] = _FunctionStats()
+            stats.calls += 1
+            stats.attempts += len(results)
+            stats.errors += failed
+            stats.totalNs += elapsed
+            if elapsed > stats.maxNs:
+                stats.maxNs = elapsed
+            stats.buckets[bucket] += 1
+            for result in results:
+                stats.results[result] = stats.results.get(result, 0) + 1
+
+    def snapshot(self, reset=False):
+        """Return {function name: counters} as plain dicts and lists.
+
+        Each entry has calls, attempts, retries, errors, results (return
+        code -> count), totalMs, meanMs, maxMs, p50/p90/p99 in ms estimated
+        from the histogram, and histogram as [(upper bound ms, count)] with
+        None for the last bound. ``reset=True`` starts new counters.
+        """
+        with self._lock:
+            functions = self._functions
+            if reset:
+                self._functions = {}
+            return dict((name, stats.export()) for name, stats in functions.items())
+
+    def percentile(self, name, q):
+        """Estimated latency in ms of function ``name`` at quantile ``q`` (0..1), None if never called."""
+        with self._lock:
+            stats = self._functions.get(name)
+            return None if stats is None else stats.percentile(q)
+
+
+##################  Session   ##################
+
+class DeviceRoutes(object):
+    """Where commands go for one (masterDevType, slaveDevType, slaveId).
+
+    Worked out once per connection instead of on every call:
+
+    ``arm``    id of the arm, i.e. slaveId
+    ``box``    id for IO, peripherals and the linear rail: -1 (the
+               controller) when a Controller drives a MagicianLite or
+               nothing, else slaveId
+    ``all``    ids that queue control, JOG/PTP common params and HOME are
+               sent to, e.g. (-1, slaveId) for Controller + MagicianLite
+    ``controllerWithLite``  True for Controller + MagicianLite
+
+    ``armQueue``, ``boxQueue`` and ``controllerQueue`` are the
+    GetQueuedCmdCurrentIndex entries (0 or 1) that track commands sent to
+    ``arm``, ``box`` and -1.
+    """
+    __slots__ = ("arm", "box", "all", "controllerWithLite", "armQueue", "boxQueue", "controllerQueue")
+
+    def __init__(self, masterDevType, slaveDevType, slaveId):
+        controller = masterDevType == DevType.Conntroller
+        self.controllerWithLite = controller and slaveDevType == DevType.MagicianLite
+        self.arm = slaveId
+        # 控制盒带MagicianLite或不带从机时，外设和滑轨都挂在控制盒上
+        if controller and slaveDevType in (DevType.MagicianLite, DevType.Idle):
+            self.box = -1
+        else:
+            self.box = slaveId
+        if self.controllerWithLite:
+            self.all = (-1, slaveId)
+        elif controller and slaveDevType == DevType.Idle:
+            self.all = (-1,)
+        else:
+            self.all = (slaveId,)
+        # 只有控制盒时-1的进度在第1个队列，否则-1即主机本身
+        self.armQueue = 1 if controller and slaveId == -1 else 0
+        self.boxQueue = 1 if controller and self.box == -1 else 0
+        self.controllerQueue = 1 if controller else 0
+
+
+class _ThreadBuffers(threading.local):
+    # 每个线程一份，供高频接口重复使用，避免每次调用都创建结构体
+    # One set per thread, reused by the hot wrappers instead of allocating
+    def __init__(self):
+        self.ptpCmd = PTPCmd()
+        self.ptpCmdRef = byref(self.ptpCmd)
+        self.cpCmd = CPCmd()
+        self.cpCmdRef = byref(self.cpCmd)
+        self.pose = Pose()
+        self.poseRef = byref(self.pose)
+        self.queuedCmdIndex = c_uint64(0)
+        self.queuedCmdIndexRef = byref(self.queuedCmdIndex)
+        self.queuedCmdIndex1 = c_uint64(0)
+        self.queuedCmdIndex1Ref = byref(self.queuedCmdIndex1)
+
+
+class DobotSession(object):
+    """One connected Dobot.
+
+    Keeps the ids and device types filled in by ConnectDobot, so a process
+    can hold several connections at once. Every wrapper below that takes
+    ``api`` is also a method, e.g. ``session.SetPTPCmd(mode, x, y, z, r)``.
+    Passing the session as ``api`` to the module functions works too.
+
+    ``retryPolicy`` decides how failed DLL calls are retried, see RetryPolicy.
+    ``poller`` is the session's CompletionPoller, started by the first *Ex
+    call that waits for a queued command. ``stats`` is an optional
+    CallStats recording every DLL call.
+
+    With ``reuseBuffers=True`` SetPTPCmd, SetCPCmd, SetCPLECmd, GetPose and
+    GetQueuedCmdCurrentIndex fill per-thread structures owned by the
+    session instead of allocating new ones on every call.
+
+    ``poseMaxAge`` is how old, in ms, a pose read may be for GetPoseEx,
+    GetPoseMultiEx and GetPoseSnapshot to return it again instead of
+    asking the device; 0 always reads.
+
+    With ``cacheParams=True`` the Get*Params functions listed in
+    CACHED_PARAMS, and GetArmSpeedRatio, answer from ``paramsCache`` once
+    the value is known, see RefreshParams. ``skipRedundantParams=True``
+    also turns the cache on and makes their Set*Params, and
+    SetArmSpeedRatio, skip writing a value the cache says the device
+    already has; they then return the queued index of the write that set
+    it, or 0 if it was read from the device.
+
+    ``routes`` is the DeviceRoutes for the connected devices. Call
+    updateRoutes() after setting the ids or device types by hand.
+
+    ``cancelToken`` is watched by every retry pause and completion wait on
+    the session, see CancelWaits and cancellable. ``waitTimeout`` (ms)
+    bounds each *Ex completion wait; None waits as long as it takes.
+    ``stopLane`` is the StopLane used by EmergencyStop and ``sender`` the
+    QueuedCmdSender behind ReplaceQueueTail, both made on first use.
+    ``ptpTarget`` is (ptpMode, (x, y, z, rHead)) of the last SetPTPCmd,
+    from which SetPTPCmdEx estimates how long the next move takes.
+    """
+
+    def __init__(self, dll, reuseBuffers=False, retryPolicy=None, stats=None, poseMaxAge=0, cacheParams=False,
+                 skipRedundantParams=False, waitTimeout=None):
+        self.dll = dll
+        self.masterId = 0
+        self.slaveId = 0
+        self.masterDevType = 0
+        self.slaveDevType = 0
+        self.buffers = _ThreadBuffers() if reuseBuffers else None
+        self.retryPolicy = retryPolicy if retryPolicy is not None else RetryPolicy()
+        self.poller = None
+        self.stats = stats
+        self.poseMaxAge = poseMaxAge
+        self.snapshots = {}
+        self.snapshotLock = threading.Lock()
+        self.paramsCache = {} if cacheParams or skipRedundantParams else None
+        self.skipRedundantParams = skipRedundantParams
+        self.routes = DeviceRoutes(0, 0, 0)
+        self.cancelToken = CancelToken()
+        self.scope = threading.local()
+        self.waitTimeout = waitTimeout
+        self.stopLane = None
+        self.sender = None
+        self.ptpTarget = None
+
+    def updateRoutes(self):
+        self.routes = DeviceRoutes(self.masterDevType, self.slaveDevType, self.slaveId)
+        return self.routes
+
+    def __getattr__(self, name):
+        # 子模块的函数在导入时才挂到DobotSession上
+        module = _LAZY.get(name)
+        if module is None or getattr(DobotSession, name, None) is not None:
+            raise AttributeError("%r object has no attribute %r" % (type(self).__name__, name))
+        _importLazy(module)
+        if getattr(DobotSession, name, None) is None:
+            raise AttributeError("%r object has no attribute %r" % (type(self).__name__, name))
+        return getattr(self, name)
+
+
+# 兼容旧接口：直接传入CDLL时使用模块级的默认会话
+# Callers passing the bare CDLL share this session, as with the old globals
+_legacySession = DobotSession(None)
+
+
+def _session(api):
+    if isinstance(api, DobotSession):
+        return api
+    _legacySession.dll = api
+    return _legacySession
+
+
+def SetRetryPolicy(api, policy):
+    _session(api).retryPolicy = policy
+
+
+def GetRetryPolicy(api):
+    return _session(api).retryPolicy
+
+
+def SetPoseMaxAge(api, maxAge):
+    _session(api).poseMaxAge = maxAge
+
+
+def GetPoseMaxAge(api):
+    return _session(api).poseMaxAge
+
+
+def SetCallStats(api, stats):
+    _session(api).stats = stats
+
+
+def GetCallStats(api):
+    return _session(api).stats
+
+
+##################  Parameter cache   ##################
+
+# 缓存的参数组及Get*Params返回值对应的结构体字段
+# Cached parameter groups and the structure fields their Get*Params return
+_PARAMS_FIELDS = {
+    "HOMEParams": ("x", "y", "z", "r"),
+    "EndEffectorParams": ("xBias", "yBias", "zBias"),
+    "JOGCommonParams": ("velocityRatio", "accelerationRatio"),
+    "PTPJointParams": ("joint1Velocity", "joint1Acceleration", "joint2Velocity", "joint2Acceleration",
+                       "joint3Velocity", "joint3Acceleration", "joint4Velocity", "joint4Acceleration"),
+    "PTPCoordinateParams": ("xyzVelocity", "rVelocity", "xyzAcceleration", "rAcceleration"),
+    "PTPCommonParams": ("velocityRatio", "accelerationRatio"),
+    "CPParams": ("planAcc", "juncitionVel", "acc", "realTimeTrack"),
+    "ARCParams": ("xyzVelocity", "rVelocity", "xyzAcceleration", "rAcceleration"),
+}
+
+CACHED_PARAMS = tuple(_PARAMS_FIELDS)
+
+
+def _cachedParams(session, name, refresh=False):
+    cache = session.paramsCache
+    if cache is None or refresh:
+        return None
+    entry = cache.get(name)
+    return None if entry is None else list(entry[0])
+
+
+def _paramsValues(name, param):
+    # 参数结构体，或没有结构体的参数组（如ArmSpeedRatio）的取值列表
+    if name in _PARAMS_FIELDS:
+        return [getattr(param, field) for field in _PARAMS_FIELDS[name]]
+    return list(param)
+
+
+def _storeParams(session, name, param, index=0):
+    # index为写入时的队列索引，读到的值为0
+    values = _paramsValues(name, param)
+    if session.paramsCache is not None:
+        session.paramsCache[name] = (tuple(values), index, session.routes.armQueue)
+    return values
+
+
+def _unchangedParams(session, name, param, isQueued):
+    # 与已知的设备状态相同时不再下发，返回上次写入的索引，等待它即可
+    # An unchanged write is skipped; the index of the write that set the
+    # value is returned instead, so waiting on it still means "in effect".
+    if not session.skipRedundantParams or session.paramsCache is None:
+        return None
+    entry = session.paramsCache.get(name)
+    if entry is None or entry[0] != tuple(_paramsValues(name, param)):
+        return None
+    if entry[1] and not isQueued:
+        # 上次是排队写入，可能还没执行，立即写入不能省
+        return None
+    return [entry[1]]
+
+
+def _dropPendingParams(api, session, policy=None):
+    # 清空指令队列后，还没执行的参数写入不会生效
+    # policy限制读取进度的重试；读不到时丢掉所有排队写入的缓存
+    cache = session.paramsCache
+    if not cache or not any(entry[1] for entry in cache.values()):
+        return
+    if policy is None:
+        current = GetQueuedCmdCurrentIndex(api)
+    else:
+        current = [0, 0]
+        try:
+            for target in session.routes.all:
+                queuedCmdIndex = c_uint64(0)
+                _call(session, 2, session.dll.GetQueuedCmdCurrentIndex, session.masterId, target,
+                      byref(queuedCmdIndex), policy=policy)
+                current[1 if target == -1 else 0] = queuedCmdIndex.value
+        except (DobotCommunicateError, DobotCancelledError):
+            current = [0, 0]
+    for name, (values, index, queue) in list(cache.items()):
+        if index > current[queue]:
+            del cache[name]
+
+
+def SetParamsCache(api, enabled):
+    """Turn the session's parameter cache on or off; either way it starts empty."""
+    _session(api).paramsCache = {} if enabled else None
+
+
+def SetSkipRedundantParams(api, enabled):
+    """Skip Set*Params writes that match the cached device state, see DobotSession."""
+    session = _session(api)
+    session.skipRedundantParams = enabled
+    if enabled and session.paramsCache is None:
+        session.paramsCache = {}
+
+
+def ClearParamsCache(api):
+    session = _session(api)
+    if session.paramsCache is not None:
+        session.paramsCache.clear()
+
+
+def RefreshParams(api):
+    """Read every parameter group in CACHED_PARAMS from the device.
+
+    Fills the cache in one pass, e.g. right after ConnectDobot, and returns
+    {name: values} as the Get*Params functions would.
+    """
+    module = globals()
+    return dict((name, module["Get" + name](api, refresh=True)) for name in CACHED_PARAMS)
+
+
+def __getattr__(name):
+    if name in ("masterId", "slaveId", "masterDevType", "slaveDevType"):
+        return getattr(_legacySession, name)
+    if name in _LAZY_MODULES:
+        return _importLazy(name)
+    if name in _LAZY:
+        return getattr(_importLazy(_LAZY[name]), name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES) | set(_LAZY))
+
+
+def SetDebugEnable(api, flag=False):
+    session = _session(api)
+    result = _callOnce(session, session.dll.SetDebugEnable, flag)
+
+
+def SearchDobot(api,  maxLen=1000):
+    session = _session(api)
+    szPara = create_string_buffer(1000) #((len(str(maxLen)) + 4) * maxLen + 10)
+    l = _callOnce(session, session.dll.SearchDobot, szPara,  maxLen)
+    if l == 0:
+        return []
+    ret = szPara.value.decode("utf-8") 
+    
+    def fix(devices):
+        for index in range(len(devices)):
+            device = devices[index]
+            if "(" in device and ")" not in device:
+                yield device + " " + devices[index + 1]
+            elif "(" not in device and ")" in device:
+                pass
+            else:
+                yield device
+        
+    return list(fix(ret.split(" ")))
+
+
+def ConnectDobot(api, portName, baudrate):
+    session = _session(api)
+    szPara = create_string_buffer(100)
+    szPara.raw = portName.encode("utf-8") 
+    connectInfo = ConnectInfo()
+
+    if session.paramsCache is not None:
+        session.paramsCache.clear()
+    result = _callOnce(session, session.dll.ConnectDobot, szPara, baudrate, byref(connectInfo))
+    if result != DobotConnect.DobotConnect_NoError:
+        return [result, 0, 0, 0, 0, 0, 0, 0]
+    session.masterId = connectInfo.masterDevInfo.devId
+    session.masterDevType = connectInfo.masterDevInfo.type
+    try:
+        if session.masterDevType == DevType.Conntroller:
+            if connectInfo.slaveDevInfo1.type == 0 and connectInfo.slaveDevInfo2.type == 0:
+                session.slaveId = -1
+                session.slaveDevType = 0
+                try:
+                    fwName = str(connectInfo.masterDevInfo.firmwareName, encoding="utf-8").strip(b'\x00'.decode())
+                    fwVer = str(connectInfo.masterDevInfo.firwareVersion, encoding="utf-8").strip(b'\x00'.decode())
+                    # print("masterId: ", masterId, connectInfo.slaveDevInfo1.devId, connectInfo.slaveDevInfo2.devId, fwName, fwVer)
+                except Exception as e:
+                    warnings.warn("ConnectDobot: unreadable firmware info: %s" % e, RuntimeWarning, stacklevel=2)
+            else:
+                session.slaveId = connectInfo.slaveDevInfo1.devId if connectInfo.slaveDevInfo1.type != DevType.Idle else connectInfo.slaveDevInfo2.devId
+                fwName = str(connectInfo.slaveDevInfo1.firmwareName, encoding="utf-8").strip(b'\x00'.decode()) if connectInfo.slaveDevInfo1.type != DevType.Idle else str(connectInfo.slaveDevInfo2.firmwareName, encoding="utf-8").strip(b'\x00'.decode())
+                fwVer = str(connectInfo.slaveDevInfo1.firwareVersion, encoding="utf-8").strip(b'\x00'.decode()) if connectInfo.slaveDevInfo1.type != DevType.Idle else str(connectInfo.slaveDevInfo2.firwareVersion, encoding="utf-8").strip(b'\x00'.decode())
+                session.slaveDevType = connectInfo.slaveDevInfo1.type if connectInfo.slaveDevInfo1.type != DevType.Idle else connectInfo.slaveDevInfo2.type
+                # slaveDevType = dType.DevType.MagicianLite  # for test
+        else:
+            session.slaveId = 0
+            session.slaveDevType = 0
+            fwName = str(connectInfo.masterDevInfo.firmwareName, encoding="utf-8").strip(b'\x00'.decode())
+            fwVer = str(connectInfo.masterDevInfo.firwareVersion, encoding="utf-8").strip(b'\x00'.decode())
+
+    except Exception as e:
+        warnings.warn("ConnectDobot: unreadable device info: %s" % e, RuntimeWarning, stacklevel=2)
+    session.updateRoutes()
+    return [result, session.masterDevType, session.slaveDevType, fwName, fwVer, session.masterId, session.slaveId, connectInfo.masterDevInfo.runTime]
+
+
+def DisconnectDobot(api):
+    session = _session(api)
+    if session.paramsCache is not None:
+        session.paramsCache.clear()
+    _callOnce(session, session.dll.DisconnectDobot, session.masterId)
+
+
+def GetMarlinVersion(api):
+    session = _session(api)
+    _callOnce(session, session.dll.GetMarlinVersion, session.masterId, session.slaveId)
+
+
+def PeriodicTask(api):
+    session = _session(api)
+    _callOnce(session, session.dll.PeriodicTask)
+
+
+def SetCmdTimeout(api, times):
+    session = _session(api)
+    _callOnce(session, session.dll.SetCmdTimeout, session.masterId, times)
+
+
+def DobotExec(api):
+    session = _session(api)
+    return [_callOnce(session, session.dll.DobotExec)]
+
+
+def GetQueuedCmdCurrentIndex(api):
+    session = _session(api)
+    buf = session.buffers
+    if buf is None:
+        queuedCmdIndex = c_uint64(0)
+        queuedCmdIndex1 = c_uint64(0)
+        indexRef = byref(queuedCmdIndex)
+        indexRef1 = byref(queuedCmdIndex1)
+    else:
+        queuedCmdIndex = buf.queuedCmdIndex
+        queuedCmdIndex1 = buf.queuedCmdIndex1
+        indexRef = buf.queuedCmdIndexRef
+        indexRef1 = buf.queuedCmdIndex1Ref
+        queuedCmdIndex.value = 0
+        queuedCmdIndex1.value = 0
+    # 控制盒(-1)的进度放在第二个返回值
+    for target in session.routes.all:
+        _call(session, 2, session.dll.GetQueuedCmdCurrentIndex, session.masterId, target, indexRef1 if target == -1 else indexRef)
+    return [queuedCmdIndex.value, queuedCmdIndex1.value]
+
+
+def GetQueuedCmdMotionFinish(api):
+    session = _session(api)
+    isFinish = c_bool(False)
+    _call(session, 2, session.dll.GetQueuedCmdMotionFinish, session.masterId, session.slaveId, byref(isFinish))
+
+    if isFinish.value != None:
+        return [isFinish.value]
+    else:
+        return [False]
+
+
+def SetQueuedCmdStartExec(api):
+    session = _session(api)
+    # 特殊处理
+    for target in session.routes.all:
+        _call(session, 5, session.dll.SetQueuedCmdStartExec, session.masterId, target)
+
+
+def SetQueuedCmdStopExec(api):
+    session = _session(api)
+    # 滑轨特殊处理
+    for target in session.routes.all:
+        _call(session, 5, session.dll.SetQueuedCmdStopExec, session.masterId, target)
+
+       
+ 
+def SetQueuedCmdForceStopExec(api):
+    session = _session(api)
+    # 滑轨特殊处理
+    for target in session.routes.all:
+        _call(session, 5, session.dll.SetQueuedCmdForceStopExec, session.masterId, target)
+
+    
+
+def SetQueuedCmdStartDownload(api,  totalLoop, linePerLoop):
+    session = _session(api)
+    _call(session, 5, session.dll.SetQueuedCmdStartDownload, session.masterId, session.slaveId, totalLoop, linePerLoop)
+        
+
+def SetQueuedCmdStopDownload(api):
+    session = _session(api)
+    _call(session, 5, session.dll.SetQueuedCmdStopDownload, session.masterId, session.slaveId)
+    
+
+def SetQueuedCmdClear(api):
+    session = _session(api)
+    # 滑轨特殊处理
+    # return [api.SetQueuedCmdClear(c_int(masterId), c_int(slaveId))]
+    _dropPendingParams(api, session)
+    result = DobotCommunicate.DobotCommunicate_NoError
+    for target in session.routes.all:
+        result = _call(session, 5, session.dll.SetQueuedCmdClear, session.masterId, target)
+    return [result]
+
+
+def SetDeviceSN(api, str): 
+    session = _session(api)
+    szPara = create_string_buffer(25)
+    szPara.raw = str.encode("utf-8")
+    _call(session, 5, session.dll.SetDeviceSN, session.masterId, session.slaveId, szPara)
+
+
+def GetDeviceSN(api): 
+    session = _session(api)
+    szPara = create_string_buffer(25)
+    _call(session, 5, session.dll.GetDeviceSN, session.masterId, session.slaveId, szPara, 25)
+    ret = szPara.value.decode("utf-8") 
+    return [ret]
+
+
+def SetDeviceName(api, str):
+    session = _session(api)
+    szPara = create_string_buffer(len(str) * 4)
+    szPara.raw = str.encode("utf-8")
+    _call(session, 5, session.dll.SetDeviceName, session.masterId, session.slaveId, szPara)
+        
+
+def SetDeviceNumName(api, num): 
+    session = _session(api)
+    cNum = c_int(num)
+    _call(session, 5, session.dll.SetDeviceName, session.masterId, session.slaveId, cNum)
+
+
+def GetDeviceName(api): 
+    session = _session(api)
+    szPara = create_string_buffer(66)
+    _call(session, 5, session.dll.GetDeviceName, session.masterId, session.slaveId, szPara, 100)
+    ret = szPara.value.decode("utf-8")
+    return [ret]
+    
+
+def GetDeviceVersion(api):
+    session = _session(api)
+    deviceVersion = DeviceVersion()
+    if (session.masterDevType == DevType.Conntroller and (session.slaveDevType == DevType.MagicianLite or session.slaveDevType == DevType.Idle)):
+        _call(session, 5, session.dll.GetDeviceVersion, session.masterId, -1, byref(deviceVersion))
+        return [deviceVersion.fw_majorVersion, deviceVersion.fw_minorVersion, deviceVersion.fw_revision, deviceVersion.fw_alphaVersion,
+            deviceVersion.hw_majorVersion, deviceVersion.hw_minorVersion, deviceVersion.hw_revision, deviceVersion.hw_alphaVersion]
+    elif session.masterDevType == DevType.MagicianLite:
+        _call(session, 5, session.dll.GetDeviceVersion, session.masterId, session.slaveId, byref(deviceVersion))
+        return [deviceVersion.fw_majorVersion, deviceVersion.fw_minorVersion, deviceVersion.fw_revision, deviceVersion.fw_alphaVersion,
+            deviceVersion.hw_majorVersion, deviceVersion.hw_minorVersion, deviceVersion.hw_revision, deviceVersion.hw_alphaVersion]
+
+    elif session.masterDevType == DevType.Magician:
+        _call(session, 5, session.dll.GetDeviceVersion, session.masterId, session.slaveId, byref(deviceVersion))
+        return [deviceVersion.fw_majorVersion, deviceVersion.fw_minorVersion, deviceVersion.fw_revision, deviceVersion.fw_alphaVersion]
+
+
+def GetDeviceID(api):
+    session = _session(api)
+    deviceID = DeviceID()
+    try:
+        result = _call(session, 5, session.dll.GetDeviceID, session.masterId, -1, byref(deviceID), policy=_deviceIDRetryPolicy)
+    except DobotCommunicateError as e:
+        return [e.result, 0, 0, 0]
+    return [result, deviceID.deviceID1, deviceID.deviceID2, deviceID.deviceID3]
+
+
+def GetPose(api):
+    session = _session(api)
+    buf = session.buffers
+    if buf is None:
+        pose = Pose()
+        poseRef = byref(pose)
+    else:
+        pose = buf.pose
+        poseRef = buf.poseRef
+    _call(session, 5, session.dll.GetPose, session.masterId, session.slaveId, poseRef)
+    return [pose.x, pose.y, pose.z,pose.rHead, pose.joint1Angle, pose.joint2Angle, pose.joint3Angle, pose.joint4Angle]
+
+
+def GetPoseL(api):
+    session = _session(api)
+    # 滑轨的特殊处理
+    tempSlaveId = session.routes.box
+
+    l = c_float(0)
+    _call(session, 5, session.dll.GetPoseL, session.masterId, tempSlaveId, byref(l))
+    #parker add 20190524  判断返回的值是否为空
+    if not math.isnan(l.value):
+        return [l.value]
+    else:
+        return [0.0]
+
+
+def GetAlarmsState(api,  maxLen=1000):
+    session = _session(api)
+    alarmsState = create_string_buffer(maxLen) 
+    #alarmsState = c_byte(0)
+    len = c_int(0)
+    _call(session, 5, session.dll.GetAlarmsState, session.masterId, session.slaveId, alarmsState, byref(len), maxLen)
+    return [alarmsState.raw, len.value]
+    
+
+def SetHOMECmd(api, temp, isQueued=0):
+    session = _session(api)
+    cmd = HOMECmd()
+    cmd.temp = temp
+    queuedCmdIndex = c_uint64(0)
+    queuedCmdIndex1 = c_uint64(0)
+    # 滑轨的特殊处理
+    # 滑轨的特殊处理：控制盒(-1)的索引放在第二个返回值
+    for target in session.routes.all:
+        _call(session, 5, session.dll.SetHOMECmd, session.masterId, target, byref(cmd), isQueued, byref(queuedCmdIndex1 if target == -1 else queuedCmdIndex))
+    return [queuedCmdIndex.value, queuedCmdIndex1.value]
+    
+
+def GetHHTTrigOutput(api):
+    session = _session(api)
+    isAvailable = c_int32(0)
+    result = _callOnce(session, session.dll.GetHHTTrigOutput, session.masterId, session.slaveId, byref(isAvailable))
+    if result != DobotCommunicate.DobotCommunicate_NoError or isAvailable.value == 0:
+        return [False]
+    return [True]
+
+   
+
+def SetJOGCmd(api, isJoint, cmd, isQueued=0):
+    session = _session(api)
+    # 滑轨的特殊处理
+    if session.routes.controllerWithLite and (cmd == 9 or cmd == 10):
+        tempSlaveId = -1
+    else:
+        tempSlaveId = session.slaveId
+
+    cmdParam = JOGCmd()
+    cmdParam.isJoint = isJoint
+    cmdParam.cmd = cmd
+    queuedCmdIndex = c_uint64(0)
+
+    if cmd == 0:
+        # 停止点动时所有设备都要停
+        for target in session.routes.all:
+            _call(session, 5, session.dll.SetJOGCmd, session.masterId, target, byref(cmdParam), isQueued, byref(queuedCmdIndex))
+    else:
+        _call(session, 5, session.dll.SetJOGCmd, session.masterId, tempSlaveId, byref(cmdParam), isQueued, byref(queuedCmdIndex))
+    return [queuedCmdIndex.value]
+
+
+def SetPTPCmd(api, ptpMode, x, y, z, rHead, isQueued=0):
+    session = _session(api)
+    buf = session.buffers
+    if buf is None:
+        cmd = PTPCmd()
+        cmdRef = byref(cmd)
+        queuedCmdIndex = c_uint64(0)
+        indexRef = byref(queuedCmdIndex)
+    else:
+        cmd = buf.ptpCmd
+        cmdRef = buf.ptpCmdRef
+        queuedCmdIndex = buf.queuedCmdIndex
+        indexRef = buf.queuedCmdIndexRef
+        queuedCmdIndex.value = 0
+    cmd.ptpMode=ptpMode
+    cmd.x=x
+    cmd.y=y
+    cmd.z=z
+    cmd.rHead=rHead
+    _call(session, 2, session.dll.SetPTPCmd, session.masterId, session.slaveId, cmdRef, isQueued, indexRef)
+    session.ptpTarget = (ptpMode, (x, y, z, rHead))
+    return [queuedCmdIndex.value]
+    
+
+def SetPTPWithLCmd(api, ptpMode, x, y, z, rHead, l, isQueued=0):
+    session = _session(api)
+    cmd = PTPWithLCmd()
+    cmd.ptpMode=ptpMode
+    cmd.x=x
+    cmd.y=y
+    cmd.z=z
+    cmd.rHead=rHead
+    cmd.l = l
+    queuedCmdIndex = c_uint64(0)
+
+    # 滑轨的特殊处理
+    if session.routes.controllerWithLite:
+        cmd1 = PTPCmd()
+        cmd1.ptpMode = ptpMode
+        cmd1.x = x
+        cmd1.y = y
+        cmd1.z = z
+        cmd1.rHead = rHead
+        queuedCmdIndex1 = c_uint64(0)
+        _call(session, 2, session.dll.SetPTPWithLCmd, session.masterId, -1, byref(cmd), isQueued, byref(queuedCmdIndex))
+        _call(session, 2, session.dll.SetPTPCmd, session.masterId, session.slaveId, byref(cmd1), isQueued, byref(queuedCmdIndex1))
+    else:
+        _call(session, 2, session.dll.SetPTPWithLCmd, session.masterId, session.slaveId, byref(cmd), isQueued, byref(queuedCmdIndex))
+    return [queuedCmdIndex.value]
+    
+
+def SetCPCmd(api, cpMode, x, y, z, velocity, isQueued=0):
+    session = _session(api)
+    buf = session.buffers
+    if buf is None:
+        cmd = CPCmd()
+        cmdRef = byref(cmd)
+        queuedCmdIndex = c_uint64(0)
+        indexRef = byref(queuedCmdIndex)
+    else:
+        cmd = buf.cpCmd
+        cmdRef = buf.cpCmdRef
+        queuedCmdIndex = buf.queuedCmdIndex
+        indexRef = buf.queuedCmdIndexRef
+        queuedCmdIndex.value = 0
+    cmd.cpMode = cpMode
+    cmd.x = x
+    cmd.y = y
+    cmd.z = z
+    cmd.velocity = velocity
+
+    _call(session, 2, session.dll.SetCPCmd, session.masterId, session.slaveId, cmdRef, isQueued, indexRef)
+    return [queuedCmdIndex.value]
+
+
+def SetCP2Cmd(api, cpMode, x, y, z, isQueued=0):
+    session = _session(api)
+    cmd = CP2Cmd()
+    cmd.cpMode = cpMode
+    cmd.x = x
+    cmd.y = y
+    cmd.z = z
+    cmd.velocity = c_float(100)
+    queuedCmdIndex = c_uint64(0)
+
+    _call(session, 2, session.dll.SetCP2Cmd, session.masterId, session.slaveId, byref(cmd), isQueued, byref(queuedCmdIndex))
+    return [queuedCmdIndex.value]
+    
+
+def SetCPLECmd(api, cpMode, x, y, z, power, isQueued=0):
+    session = _session(api)
+    buf = session.buffers
+    if buf is None:
+        cmd = CPCmd()
+        cmdRef = byref(cmd)
+        queuedCmdIndex = c_uint64(0)
+        indexRef = byref(queuedCmdIndex)
+    else:
+        cmd = buf.cpCmd
+        cmdRef = buf.cpCmdRef
+        queuedCmdIndex = buf.queuedCmdIndex
+        indexRef = buf.queuedCmdIndexRef
+        queuedCmdIndex.value = 0
+    cmd.cpMode = cpMode
+    cmd.x = x
+    cmd.y = y
+    cmd.z = z
+    cmd.velocity = power
+    _call(session, 2, session.dll.SetCPLECmd, session.masterId, session.slaveId, cmdRef, isQueued, indexRef)
+    return [queuedCmdIndex.value]
+    
+
+def SetWAITCmd(api, waitTime, isQueued=0):
+    session = _session(api)
+    param = WAITCmd()
+    param.waitTime = int(waitTime)
+    queuedCmdIndex = c_uint64(0)
+    _call(session, 5, session.dll.SetWAITCmd, session.masterId, session.slaveId, byref(param), isQueued, byref(queuedCmdIndex))
+    return [queuedCmdIndex.value]
+
+
+def GetUART4PeripheralsType(api):
+    session = _session(api)
+    type = c_uint8(0)
+    if (session.masterDevType == DevType.Conntroller and session.slaveDevType == DevType.MagicianLite) or (session.masterDevType == DevType.Conntroller and session.slaveDevType == DevType.Idle):
+        _call(session, 5, session.dll.GetUART4PeripheralsType, session.masterId, -1, byref(type))
+    elif session.masterDevType == DevType.Magician:
+        _call(session, 5, session.dll.GetUART4PeripheralsType, session.masterId, session.slaveId, byref(type))
+    return [type.value]
+    
+
+def GetDeviceVersionEx(api):       #2019.6.25 song 控制盒+Magician Lite时，获取控制盒的版本
+    session = _session(api)
+    # majorVersion = c_byte(0)
+    # minorVersion = c_byte(0)
+    # revision     = c_byte(0)
+    # hwVersion    = c_byte(0)
+    deviceVersion1 = DeviceVersion()
+    deviceVersion2 = DeviceVersion()
+    if session.masterDevType == DevType.Conntroller and session.slaveDevType == DevType.MagicianLite:
+        # 2019.09.03 by song 控制盒+magicianLite 返回两个设备的版本信息
+        _call(session, 5, session.dll.GetDeviceVersion, session.masterId, -1, byref(deviceVersion1))
+        list_MagicBoxVersion = [deviceVersion1.fw_majorVersion, deviceVersion1.fw_minorVersion, deviceVersion1.fw_revision, deviceVersion1.fw_alphaVersion,
+                                deviceVersion1.hw_majorVersion, deviceVersion1.hw_minorVersion, deviceVersion1.hw_revision, deviceVersion1.hw_alphaVersion]
+        _call(session, 5, session.dll.GetDeviceVersion, session.masterId, session.slaveId, byref(deviceVersion2))
+        list_MagicianLiteVersion = [deviceVersion2.fw_majorVersion, deviceVersion2.fw_minorVersion, deviceVersion2.fw_revision, deviceVersion2.fw_alphaVersion,
+                                    deviceVersion2.hw_majorVersion, deviceVersion2.hw_minorVersion, deviceVersion2.hw_revision, deviceVersion2.hw_alphaVersion]
+        return [list_MagicBoxVersion, list_MagicianLiteVersion]
+
+        
+##################  Generated arm wrappers   ##################
+
+# 只差参数、路由和是否等待的函数由下表生成，见_generate
+# Wrappers that differ only in parameters, routing and waiting are generated
+# from this table, see _generate.
+_ARM = (("", "arm", False),)
+_ARM_EX = (("", "arm", False), ("Ex", "arm", True))
+_ARM_EX_QUEUED = (("", "arm", False), ("Ex", "arm", True, 1))
+_ALL_EX = (("", "all", False), ("Ex", "all", True))
+_BOX = (("", "box", False),)
+_CONTROLLER = (("", "controller", False),)
+
+_generate(globals(), [
+    ("SetDeviceWithL", ("isWithL", "version=0"), None, _BOX),
+    ("GetDeviceWithL", (), None, _BOX),
+    ("GetDeviceTime", (), None, _ARM),
+    ("GetDeviceInfo", (), ("deviceRunTime", "devicePowerOn", "devicePowerOff"), _ARM),
+    ("ResetPose", ("manual", "rearArmAngle", "frontArmAngle"), None, _ARM),
+    ("GetKinematics", (), ("velocity", "acceleration"), _ARM),
+    ("ClearAllAlarmsState", (), None, _ARM),
+    ("GetUserParams", (), ("params1", "params2", "params3", "params4", "params5", "params6", "params7", "params8"), _ARM),
+
+    ("SetHOMEParams", ("x", "y", "z", "r"), None, _ARM, {"cache": "HOMEParams"}),
+    ("GetHOMEParams", (), None, _ARM, {"cache": "HOMEParams"}),
+    ("SetAutoLevelingCmd", ("controlFlag", "precision"), None, _ARM_EX_QUEUED),
+    ("GetAutoLevelingResult", (), None, _ARM),
+    ("SetArmOrientation", ("armOrientation",), None, _ARM),
+    ("GetArmOrientation", (), None, _ARM),
+
+    ("SetHHTTrigMode", ("hhtTrigMode",), None, _ARM),
+    ("GetHHTTrigMode", (), None, _ARM),
+    ("SetHHTTrigOutputEnabled", ("isEnabled",), None, _ARM),
+    ("GetHHTTrigOutputEnabled", (), None, _ARM),
+
+    ("SetEndEffectorParams", ("xBias", "yBias", "zBias"), None, _ARM_EX, {"cache": "EndEffectorParams"}),
+    ("GetEndEffectorParams", (), None, _ARM, {"cache": "EndEffectorParams"}),
+    ("SetEndEffectorLaser", ("enableCtrl", "on"), None, _ARM),
+    ("GetEndEffectorLaser", (), None, _ARM),
+    ("SetEndEffectorSuctionCup", ("enableCtrl", "on"), None, _ARM_EX),
+    ("GetEndEffectorSuctionCup", (), (1,), _ARM),
+    ("SetEndEffectorGripper", ("enableCtrl", "on"), None, _ARM_EX),
+    ("GetEndEffectorGripper", (), (1,), _ARM),
+    ("GetEndEffectorType", (), None, _ARM),
+
+    ("SetJOGJointParams", ("j1Velocity:joint1Velocity", "j1Acceleration:joint1Acceleration",
+                           "j2Velocity:joint2Velocity", "j2Acceleration:joint2Acceleration",
+                           "j3Velocity:joint3Velocity", "j3Acceleration:joint3Acceleration",
+                           "j4Velocity:joint4Velocity", "j4Acceleration:joint4Acceleration"), None, _ARM),
+    ("GetJOGJointParams", (), ("joint1Velocity", "joint1Acceleration", "joint2Velocity", "joint2Acceleration",
+                               "joint3Velocity", "joint3Acceleration", "joint4Velocity", "joint4Acceleration"), _ARM),
+    ("SetJOGCoordinateParams", ("xVelocity", "xAcceleration", "yVelocity", "yAcceleration",
+                                "zVelocity", "zAcceleration", "rVelocity", "rAcceleration"), None, _ARM),
+    ("GetJOGCoordinateParams", (), ("xVelocity", "xAcceleration", "yVelocity", "yAcceleration",
+                                    "zVelocity", "zAcceleration", "rVelocity", "rAcceleration"), _ARM),
+    ("SetJOGLParams", ("velocity", "acceleration"), None, _BOX),
+    ("GetJOGLParams", (), ("velocity", "acceleration"), _BOX),
+    ("SetJOGCommonParams", ("value_velocityratio:velocityRatio", "value_accelerationratio:accelerationRatio"), None,
+     (("", "all", False),), {"cache": "JOGCommonParams"}),
+    ("GetJOGCommonParams", (), None, _ARM, {"cache": "JOGCommonParams"}),
+
+    ("SetPTPJointParams", ("j1Velocity:joint1Velocity", "j1Acceleration:joint1Acceleration",
+                           "j2Velocity:joint2Velocity", "j2Acceleration:joint2Acceleration",
+                           "j3Velocity:joint3Velocity", "j3Acceleration:joint3Acceleration",
+                           "j4Velocity:joint4Velocity", "j4Acceleration:joint4Acceleration"), None, _ARM_EX,
+     {"cache": "PTPJointParams"}),
+    ("GetPTPJointParams", (), None, _ARM, {"cache": "PTPJointParams"}),
+    ("SetPTPCoordinateParams", ("xyzVelocity", "xyzAcceleration", "rVelocity", "rAcceleration"), None, _ARM_EX,
+     {"cache": "PTPCoordinateParams"}),
+    ("GetPTPCoordinateParams", (), None, _ARM, {"cache": "PTPCoordinateParams"}),
+    ("SetPTPLParams", ("velocity", "acceleration"), None, _BOX),
+    ("GetPTPLParams", (), ("velocity", "acceleration"), _BOX),
+    ("SetPTPJumpParams", ("jumpHeight", "zLimit"), None, _ARM),
+    ("GetPTPJumpParams", (), ("jumpHeight", "zLimit"), _ARM),
+    ("SetPTPCommonParams", ("velocityRatio", "accelerationRatio"), None, _ALL_EX, {"cache": "PTPCommonParams"}),
+    ("GetPTPCommonParams", (), None, _ARM, {"cache": "PTPCommonParams"}),
+
+    ("SetCPRHoldEnable", ("isEnable",), None, _ARM),
+    ("GetCPRHoldEnable", (), None, _ARM),
+    ("SetCPParams", ("planAcc", "juncitionVel", "acc", "realTimeTrack=0"), None, _ARM, {"cache": "CPParams"}),
+    ("GetCPParams", (), None, _ARM, {"cache": "CPParams"}),
+    ("SetCPCommonParams", ("velocityRatio", "accelerationRatio"), None, _ARM),
+    ("GetCPCommonParams", (), ("velocityRatio", "accelerationRatio"), _ARM),
+
+    ("SetARCParams", ("xyzVelocity", "rVelocity", "xyzAcceleration", "rAcceleration"), None, _ARM,
+     {"cache": "ARCParams"}),
+    ("GetARCParams", (), None, _ARM, {"cache": "ARCParams"}),
+    ("SetARCCmd", ("cirPoint", "toPoint"), None, _ARM_EX_QUEUED),
+    ("SetCircleCmd", ("cirPoint", "toPoint"), None, _ARM),
+    ("SetARCCommonParams", ("velocityRatio", "accelerationRatio"), None, _ARM),
+    ("GetARCCommonParams", (), ("velocityRatio", "accelerationRatio"), _ARM),
+    ("SetTRIGCmd", ("address", "mode", "condition", "threshold"), None, _ARM_EX_QUEUED),
+
+    ("SetAngleSensorStaticError", ("rearArmAngleError", "frontArmAngleError"), None, _ARM),
+    ("GetAngleSensorStaticError", (), None, _ARM),
+    ("SetAngleSensorCoef", ("rearArmAngleCoef", "frontArmAngleCoef"), None, _ARM),
+    ("GetAngleSensorCoef", (), None, _ARM),
+    ("SetBaseDecoderStaticError", ("baseDecoderError",), None, _ARM),
+    ("GetBaseDecoderStaticError", (), None, _ARM),
+    ("SetLostStepParams", ("threshold",), None, _ARM),
+    ("SetLostStepCmd", (), None, _ARM_EX_QUEUED),
+    ("SetLostStepEnableAndParamsCmd", ("enable", "threshlod"), None, _ARM),
+    ("GetLostStepEnableAndParamsCmd", (), None, _ARM),
+    ("SetMotorMode", ("mode",), None, _ARM),
+    ("GetMotorMode", (), None, _ARM),
+
+    ("RestartMagicBox", (), None, _CONTROLLER),
+    ("GetServoAngle", ("servoId",), None, _CONTROLLER),
+    ("SetProgbar", ("progbar",), None, _CONTROLLER),
+])
+
+
+##################  Ex扩展函数，该套函数会检测每一条指令运行完毕  ##################
+def _snapshot(session, name, read, maxAge):
+    # 在新鲜度窗口内复用上一次读到的值，并发调用者共用同一次读取
+    if maxAge is None:
+        maxAge = session.poseMaxAge
+    with session.snapshotLock:
+        cached = session.snapshots.get(name)
+        now = time.monotonic()
+        if cached is None or (now - cached[0]) * 1000 >= maxAge:
+            cached = session.snapshots[name] = (now, read())
+        return cached[1]
+
+
+def GetPoseSnapshot(api, maxAge=None):
+    """GetPose, reusing a read made less than ``maxAge`` ms ago.
+
+    ``maxAge`` defaults to the session's poseMaxAge.
+    """
+    return list(_snapshot(_session(api), "GetPose", lambda: GetPose(api), maxAge))
+
+
+def GetPoseMultiEx(api, indices, maxAge=None):
+    """GetPoseEx for several indices, from at most one GetPose.
+
+    Index 0 is the linear rail (None without one), 1-8 are x, y, z, rHead
+    and joint1-4. Reads younger than ``maxAge`` ms are reused, see
+    GetPoseSnapshot.
+    """
+    session = _session(api)
+    reads = {}
+
+    def read(name, func):
+        if name not in reads:
+            reads[name] = _snapshot(session, name, lambda: func(api), maxAge)
+        return reads[name]
+
+    values = []
+    for index in indices:
+        if index == 0:
+            if not read("GetDeviceWithL", GetDeviceWithL)[0]:
+                warnings.warn("Dobot is not in L model", RuntimeWarning, stacklevel=2)
+                values.append(None)
+            else:
+                values.append(round(read("GetPoseL", GetPoseL)[0],  4))
+        else:
+            values.append(round(read("GetPose", GetPose)[index-1],  4))
+    return values
+
+
+def GetPoseEx(api,  index, maxAge=None):
+    return GetPoseMultiEx(api, [index], maxAge)[0]
+    
+def SetHOMECmdEx(api,  temp,  isQueued=0):
+    session = _session(api)
+    ret = SetHOMECmd(api, temp,  isQueued)
+    if session.routes.controllerWithLite:
+        if isUsingLinearRail:        
+            _waitQueuedCmdIndex(api, ret[1], session.routes.controllerQueue)
+        _waitQueuedCmdIndex(api, ret[0], session.routes.armQueue)
+    elif session.routes.all == (-1,):
+        _waitQueuedCmdIndex(api, ret[1], session.routes.controllerQueue)
+    else:
+        _waitQueuedCmdIndex(api, ret[0], session.routes.armQueue)
+        
+def SetWAITCmdEx(api, waitTime, isQueued=0):
+    ret = SetWAITCmd(api, waitTime, isQueued)
+    _waitQueuedCmdIndex(api, ret[0], _session(api).routes.armQueue, abort=_quitRequested, duration=waitTime)
+    # dSleep(waitTime * 1000)
+    
+def SetPTPLParamsEx(api, lVelocity, lAcceleration, isQueued=0):
+    ret = GetDeviceWithL(api)
+    if not ret:
+        warnings.warn("Dobot is not in L model", RuntimeWarning, stacklevel=2)
+        return
+    
+    ret = SetPTPLParams(api, lVelocity, lAcceleration, isQueued)
+    _waitQueuedCmdIndex(api, ret[0], _session(api).routes.armQueue)
+        
+def SetPTPJumpParamsEx(api, jumpHeight, maxJumpHeight, isQueued=0):
+    ret = SetPTPJumpParams(api, jumpHeight, maxJumpHeight, isQueued)
+    _waitQueuedCmdIndex(api, ret[0], _session(api).routes.armQueue)
+        
+def SetPTPCmdEx(api, ptpMode, x, y, z, rHead, isQueued=0):
+    session = _session(api)
+    # 立即执行的指令不排队，不必估计
+    duration = _ptpDuration(session, ptpMode, (x, y, z, rHead)) if isQueued else None
+    ret = SetPTPCmd(api, ptpMode, x, y, z, rHead, isQueued)
+    _waitQueuedCmdIndex(api, ret[0], session.routes.armQueue, duration=duration)
+    
+        
+def SetEndEffectorLaserEx(api, enableCtrl, power, isQueued=0):
+    SetIOMultiplexingEx(api, 2,  1, isQueued)
+    SetIOMultiplexingEx(api, 4,  2, isQueued)
+    SetIODOEx(api, 2, enableCtrl, isQueued)
+    SetIOPWMEx(api, 4, 10000, power, isQueued)
+
+        
+    
+    
+
+
+def SetPTPWithLCmdEx(api, ptpMode, x, y, z, rHead,  l, isQueued=0):
+    session = _session(api)
+    ret = GetDeviceWithL(api)
+    if not ret:
+        warnings.warn("Dobot is not in L model", RuntimeWarning, stacklevel=2)
+        return
+
+    cmd = PTPWithLCmd()
+    cmd.ptpMode=ptpMode
+    cmd.x=x
+    cmd.y=y
+    cmd.z=z
+    cmd.rHead=rHead
+    cmd.l = l
+    queuedCmdIndex = c_uint64(0)
+    queuedCmdIndex2 = c_uint64(0)
+    # 滑轨的特殊处理
+    if session.slaveDevType == DevType.Magician:
+        result = _call(session, 2, session.dll.SetPTPWithLCmd, session.masterId, session.slaveId, byref(cmd), isQueued, byref(queuedCmdIndex))
+        _waitQueuedCmdIndex(api, queuedCmdIndex.value, session.routes.armQueue)
+    elif session.routes.controllerWithLite:
+        result = _call(session, 2, session.dll.SetPTPWithLCmd, session.masterId, -1, byref(cmd), isQueued, byref(queuedCmdIndex))
+        queuedCmdIndex2 = queuedCmdIndex
+        _waitQueuedCmdIndex(api, queuedCmdIndex2.value, session.routes.controllerQueue)
+
+        # MagicianLite只接受不带滑轨的PTPCmd
+        cmd1 = PTPCmd()
+        cmd1.ptpMode = ptpMode
+        cmd1.x = x
+        cmd1.y = y
+        cmd1.z = z
+        cmd1.rHead = rHead
+        result = _call(session, 2, session.dll.SetPTPCmd, session.masterId, session.slaveId, byref(cmd1), isQueued, byref(queuedCmdIndex))
+        _waitQueuedCmdIndex(api, queuedCmdIndex.value, session.routes.armQueue)
+    else:
+        result = _call(session, 2, session.dll.SetPTPWithLCmd, session.masterId, -1, byref(cmd), isQueued, byref(queuedCmdIndex))
+        queuedCmdIndex2 = queuedCmdIndex
+        _waitQueuedCmdIndex(api, queuedCmdIndex.value, session.routes.controllerQueue)
+    return [queuedCmdIndex2.value]
+
+
+    
+# jomar, 2019年5月9日 10:10:50
+
+
+#Magician Lite 2019-11-05 Magician Lite单独的API
+
+
+def SetEndEffectorType(api, endType=0, isQueued=0):
+    session = _session(api)
+    queuedCmdIndex = c_uint64(0)
+    _call(session, 5, session.dll.SetEndEffectorType, session.masterId, session.slaveId, isQueued, endType, byref(queuedCmdIndex))
+    return[queuedCmdIndex.value]
+
+
+def SetServoAngle(api, servoId, angle, isQueued=0):
+    session = _session(api)
+    queuedCmdIndex = c_uint64(0)
+    _call(session, 5, session.dll.SetServoAngle, session.masterId, -1, isQueued, servoId, angle, byref(queuedCmdIndex))
+    return [queuedCmdIndex.value]
+
+
+def SetArmSpeedRatio(api, paramsMode, speedRatio, isQueued=0):
+    session = _session(api)
+    unchanged = _unchangedParams(session, ("ArmSpeedRatio", paramsMode), [speedRatio], isQueued)
+    if unchanged is not None:
+        return unchanged
+    queuedCmdIndex = c_uint64(0)
+    _call(session, 5, session.dll.SetArmSpeedRatio, session.masterId, session.slaveId, isQueued, paramsMode, speedRatio, byref(queuedCmdIndex))
+    _storeParams(session, ("ArmSpeedRatio", paramsMode), [speedRatio], queuedCmdIndex.value)
+    return [queuedCmdIndex.value]
+
+
+def GetArmSpeedRatio(api, paramsMode=0, refresh=False):
+    session = _session(api)
+    cached = _cachedParams(session, ("ArmSpeedRatio", paramsMode), refresh)
+    if cached is not None:
+        return cached
+    speedRatio = c_uint8(0)
+    # paramsMode = c_uint8(0)
+    _call(session, 5, session.dll.GetArmSpeedRatio, session.masterId, session.slaveId, paramsMode, byref(speedRatio))
+    return _storeParams(session, ("ArmSpeedRatio", paramsMode), [speedRatio.value])
+
+
+def SetLSpeedRatio(api, paramsMode, speedRatio, isQueued=0):
+    session = _session(api)
+    queuedCmdIndex = c_uint64(0)
+    _call(session, 5, session.dll.SetLSpeedRatio, session.masterId, -1, isQueued, paramsMode, speedRatio, byref(queuedCmdIndex))
+    return [queuedCmdIndex.value]
+
+
+def GetLSpeedRatio(api, paramsMode):
+    session = _session(api)
+    speedRatio = c_uint8(0)
+    _call(session, 5, session.dll.GetLSpeedRatio, session.masterId, -1, paramsMode, byref(speedRatio))
+    return[speedRatio.value]
+
+
+def PrintInfo(api, info):
+    session = _session(api)
+    szPara = create_string_buffer(len(info))
+    szPara.raw = info.encode("utf-8")
+    _call(session, 5, session.dll.PrintInfo, session.masterId, -1, szPara)
+
+
+#MagicianLite/Magic Box同步等待
+
+def SetEndEffectorTypeEx(api, endType=0, isQueued=1):
+    ret = SetEndEffectorType(api, endType, isQueued)
+    _waitQueuedCmdIndex(api, ret[0], _session(api).routes.armQueue)
+
+
+def SetServoAngleEx(api, servoId, angle, isQueued=1):
+    ret = SetServoAngle(api, servoId, angle, isQueued)
+    _waitQueuedCmdIndex(api, ret[0], _session(api).routes.controllerQueue)
+
+
+def SetArmSpeedRatioEx(api, paramsMode=0, speedRatio=0, isQueued=1):
+    ret = SetArmSpeedRatio(api,paramsMode, speedRatio, isQueued)
+    _waitQueuedCmdIndex(api, ret[0], _session(api).routes.armQueue)
+
+
+def SetLSpeedRatioEx(api, paramsMode, speedRatio, isQueued=1):
+    ret = SetLSpeedRatio(api, paramsMode, speedRatio, isQueued)
+    _waitQueuedCmdIndex(api, ret[0], _session(api).routes.controllerQueue)
+
+
+##################  Flow control   ##################
+
+def _trapezoid(distance, velocity, acceleration):
+    # 从静止到静止走完distance的时间(ms)，梯形速度曲线
+    distance = abs(distance)
+    if distance == 0 or velocity <= 0 or acceleration <= 0:
+        return 0.0
+    if distance * acceleration >= velocity * velocity:
+        return (distance / velocity + velocity / acceleration) * 1000
+    return 2 * math.sqrt(distance / acceleration) * 1000
+
+
+# 绝对目标的坐标系：关节角或笛卡尔坐标
+# Space of an absolute target: joint angles or cartesian coordinates
+_PTP_JOINT_TARGETS = (PTPMode.PTPJUMPANGLEMode, PTPMode.PTPMOVJANGLEMode, PTPMode.PTPMOVLANGLEMode)
+_PTP_XYZ_TARGETS = (PTPMode.PTPJUMPXYZMode, PTPMode.PTPMOVJXYZMode, PTPMode.PTPMOVLXYZMode, PTPMode.PTPJUMPMOVLXYZMode)
+
+
+def _ptpDelta(session, target, space):
+    # 相对上一个SetPTPCmd目标的位移；上一个目标不在同一坐标系时返回None
+    last = session.ptpTarget
+    if last is None or last[0] not in space:
+        return None
+    return [b - a for a, b in zip(last[1], target)]
+
+
+def _ptpDuration(session, ptpMode, target):
+    # 按缓存的PTP参数和上一个目标估计运动时间(ms)，不知道时返回None
+    # 没有cacheParams=True时参数缓存为空，总是None
+    # Estimated from the cached PTP parameters and the session's last PTP
+    # target, so no pose is read; None when either is unknown or the mode is
+    # not a plain joint or linear move. Motions queued by other commands
+    # since then make it wrong, which only changes how often the completion
+    # is polled.
+    cache = session.paramsCache
+    if not cache or "PTPCommonParams" not in cache:
+        return None
+    velocityRatio, accelerationRatio = [ratio / 100 for ratio in cache["PTPCommonParams"][0]]
+    if ptpMode in (PTPMode.PTPMOVJANGLEMode, PTPMode.PTPMOVJANGLEINCMode):
+        if "PTPJointParams" not in cache:
+            return None
+        params = cache["PTPJointParams"][0]
+        deltas = target
+        if ptpMode == PTPMode.PTPMOVJANGLEMode:
+            deltas = _ptpDelta(session, target, _PTP_JOINT_TARGETS)
+            if deltas is None:
+                return None
+        return max(_trapezoid(delta, params[2 * i] * velocityRatio, params[2 * i + 1] * accelerationRatio)
+                   for i, delta in enumerate(deltas))
+    if ptpMode in (PTPMode.PTPMOVLXYZMode, PTPMode.PTPMOVLXYZINCMode):
+        if "PTPCoordinateParams" not in cache:
+            return None
+        xyzVelocity, rVelocity, xyzAcceleration, rAcceleration = cache["PTPCoordinateParams"][0]
+        delta = target
+        if ptpMode == PTPMode.PTPMOVLXYZMode:
+            delta = _ptpDelta(session, target, _PTP_XYZ_TARGETS)
+            if delta is None:
+                return None
+        return max(_trapezoid(math.sqrt(delta[0] ** 2 + delta[1] ** 2 + delta[2] ** 2),
+                              xyzVelocity * velocityRatio, xyzAcceleration * accelerationRatio),
+                   _trapezoid(delta[3], rVelocity * velocityRatio, rAcceleration * accelerationRatio))
+    return None
+
+
+class CompletionPoller(object):
+    """Resolves futures when queued commands have been executed.
+
+    One daemon thread per session samples GetQueuedCmdCurrentIndex and sets
+    the result of every future whose index has been reached, so any number
+    of waiters share a single poll. The thread only polls while futures are
+    pending: every ``minInterval`` ms while the index moves, backing off to
+    ``maxInterval`` ms while it stands still (e.g. during a long motion).
+
+    A waiter may come with an estimate of how long its command still takes
+    (``duration`` in ms, e.g. the WAIT time). Until then the thread sleeps
+    90% of the remaining time, at most ``maxSleep`` ms at once, and polls
+    every ``minInterval`` ms from the estimated end on. The estimate only
+    spaces the polls out; completion is still taken from the device, so a
+    command that ends early is seen late by up to 90% of its estimate
+    (``maxSleep`` at most). SetPTPCmdEx only has an estimate with
+    ``cacheParams=True``, see _ptpDuration.
+
+    ``queue`` has the GetQueuedCmdCurrentIndex meaning: 0 for the arm, 1 for
+    the controller queue.
+    """
+
+    def __init__(self, api, minInterval=5, maxInterval=20, maxSleep=2000):
+        self.api = api
+        self.minInterval = minInterval
+        self.maxInterval = maxInterval
+        self.maxSleep = maxSleep
+        self.currentIndex = [0, 0]
+        self._waiters = ([], [])
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def future(self, index, queue=0, duration=None):
+        """Return a Future resolved with the current index once it reaches ``index``.
+
+        ``duration`` is the estimated time in ms until then, None if unknown.
+        """
+        import concurrent.futures
+        future = concurrent.futures.Future()
+        due = None if duration is None else time.monotonic() + duration / 1000
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("CompletionPoller is closed")
+            heapq.heappush(self._waiters[queue], (index, next(self._seq), future, due))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="DobotCompletionPoller", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def close(self):
+        """Stop the thread and cancel pending futures."""
+        with self._cond:
+            self._closed = True
+            pending = [w[2] for heap in self._waiters for w in heap]
+            self._waiters = ([], [])
+            self._cond.notify()
+        for future in pending:
+            future.cancel()
+
+    def _pending(self):
+        # 丢弃已取消的等待
+        for heap in self._waiters:
+            if any(w[2].cancelled() for w in heap):
+                heap[:] = [w for w in heap if not w[2].cancelled()]
+                heapq.heapify(heap)
+        return self._waiters[0] or self._waiters[1]
+
+    def _run(self):
+        interval = self.minInterval
+        while True:
+            with self._cond:
+                while not self._closed and not self._pending():
+                    self._cond.wait()
+                if self._closed:
+                    return
+            try:
+                current = GetQueuedCmdCurrentIndex(self.api)
+            except Exception as e:
+                with self._cond:
+                    failed = [w[2] for heap in self._waiters for w in heap]
+                    self._waiters = ([], [])
+                for future in failed:
+                    if future.set_running_or_notify_cancel():
+                        future.set_exception(e)
+                continue
+            interval = self.minInterval if current != self.currentIndex else min(interval * 2, self.maxInterval)
+            self.currentIndex = current
+            done = []
+            with self._cond:
+                for queue in (0, 1):
+                    heap = self._waiters[queue]
+                    while heap and heap[0][0] <= current[queue]:
+                        done.append((heapq.heappop(heap)[2], current[queue]))
+            for future, value in done:
+                if future.set_running_or_notify_cancel():
+                    future.set_result(value)
+            with self._cond:
+                if not self._closed and self._pending():
+                    remaining = self._remaining()
+                    if remaining is not None and remaining > self.minInterval:
+                        # 离预计完成还远时睡掉大部分剩余时间，到预计完成时从minInterval开始查询
+                        wait = min(0.9 * remaining, self.maxSleep)
+                        if wait < self.maxInterval:
+                            interval = self.minInterval
+                    else:
+                        wait = interval
+                    self._cond.wait(wait / 1000)
+
+    def _remaining(self):
+        # 最先完成的等待者预计还要多久(ms)，有一个不知道就是None
+        dues = [heap[0][3] for heap in self._waiters if heap]
+        if not dues or None in dues:
+            return None
+        return (min(dues) - time.monotonic()) * 1000
+
+
+_pollerLock = threading.Lock()
+
+
+def _completionPoller(session):
+    with _pollerLock:
+        if session.poller is None:
+            session.poller = CompletionPoller(session)
+        return session.poller
+
+
+def GetQueuedCmdFuture(api, index, queue=0, duration=None):
+    """Future resolved once queued command ``index`` has been executed.
+
+    ``duration`` is an optional estimate in ms of how long that takes, so
+    the device is polled less often until then, see CompletionPoller.
+    """
+    return _completionPoller(_session(api)).future(index, queue, duration)
+
+
+def _waitQueuedCmdIndex(api, index, queue=0, abort=None, duration=None):
+    # *Ex变体 = 下发指令 + 等待future；取消令牌时future被取消，等待立即结束
+    import concurrent.futures
+    session = _session(api)
+    token = _cancelToken(session)
+    token.check()
+    deadline = token.deadline
+    if session.waitTimeout is not None:
+        timeout = time.monotonic() + session.waitTimeout / 1000
+        deadline = timeout if deadline is None else min(deadline, timeout)
+    future = GetQueuedCmdFuture(api, index, queue, duration)
+    unlink = token.onCancel(lambda reason: future.cancel())
+    try:
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if abort is not None:
+                timeout = 0.05 if timeout is None else min(timeout, 0.05)
+            try:
+                future.result(timeout)
+                return True
+            except concurrent.futures.TimeoutError:
+                if abort is not None and abort():
+                    future.cancel()
+                    return False
+                if deadline is not None and time.monotonic() >= deadline:
+                    future.cancel()
+                    raise DobotCancelledError("timeout")
+    except concurrent.futures.CancelledError:
+        raise DobotCancelledError(token.reason or "cancelled")
+    finally:
+        unlink()
+
+
+class QueuedCmdSender(object):
+    """Feeds queued commands without overrunning the device queue.
+
+    Keeps at most ``window`` commands issued but not yet executed, judged by
+    comparing the returned queued indices with GetQueuedCmdCurrentIndex.
+    submit() blocks while the window is full, so the device queue stays
+    close to full without BufferFull retries on the serial link. The current
+    index is only polled while the window is full.
+
+    ``queue`` selects the GetQueuedCmdCurrentIndex entry to follow: 0 for the
+    arm, 1 for the controller queue when driving a Controller only. None
+    follows the queue the arm's commands are counted in.
+
+    ``journal`` maps the queued index of every submitted command not yet
+    known to be executed to its (func, args, kwargs), so replaceTail() can
+    send the unexecuted ones again.
+    """
+
+    def __init__(self, api, window=16, pollInterval=5, queue=None):
+        self.api = api
+        self.window = window
+        self.pollInterval = pollInterval
+        self.queue = _session(api).routes.armQueue if queue is None else queue
+        self.lastIndex = None
+        self.currentIndex = 0
+        self.journal = {}
+        self._cond = threading.Condition()
+
+    def _refresh(self):
+        self.currentIndex = GetQueuedCmdCurrentIndex(self.api)[self.queue]
+        if self.lastIndex is None or self.lastIndex < self.currentIndex:
+            self.lastIndex = self.currentIndex
+        # 已执行的指令移出记录，索引按提交顺序递增
+        journal = self.journal
+        while journal:
+            index = next(iter(journal))
+            if index > self.currentIndex:
+                break
+            del journal[index]
+
+    def inFlight(self):
+        with self._cond:
+            if self.lastIndex is None:
+                return 0
+            return self.lastIndex - self.currentIndex
+
+    def wait(self):
+        """Block until one more command fits in the window."""
+        token = _cancelToken(_session(self.api))
+        with self._cond:
+            if self.lastIndex is None or len(self.journal) > 2 * self.window:
+                self._refresh()
+            while self.lastIndex - self.currentIndex >= self.window:
+                self._refresh()
+                if self.lastIndex - self.currentIndex >= self.window:
+                    self._cond.wait(self.pollInterval / 1000)
+                    token.check()
+
+    def submit(self, func, *args, **kwargs):
+        """Call ``func(api, *args, isQueued=1, **kwargs)`` once there is room.
+
+        ``func`` is any queued wrapper, e.g. SetPTPCmd or SetCPCmd. Returns
+        the wrapper's result.
+        """
+        with self._cond:
+            self.wait()
+            kwargs["isQueued"] = 1
+            ret = func(self.api, *args, **kwargs)
+            if ret[0] > self.lastIndex:
+                self.lastIndex = ret[0]
+                self.journal[ret[0]] = (func, args, kwargs)
+            return ret
+
+    def drain(self):
+        """Block until every submitted command has been executed."""
+        token = _cancelToken(_session(self.api))
+        with self._cond:
+            if self.lastIndex is None:
+                return
+            self._refresh()
+            while self.currentIndex < self.lastIndex:
+                self._cond.wait(self.pollInterval / 1000)
+                token.check()
+                self._refresh()
+
+    def replaceTail(self, commands, after=None, settle=20):
+        """Swap the not yet executed part of the queue for ``commands``.
+
+        ``commands`` are tuples like the submit() arguments, e.g.
+        ``(dType.SetPTPCmd, mode, x, y, z, rHead)``. Submitted commands up
+        to index ``after`` that have not run yet are kept; None keeps
+        none. The queue is stopped and the command in progress is let
+        finish: it is over once the current index moves, or once the pose
+        has not changed for ``settle`` ms. The device queue is then
+        cleared and restarted, and the kept commands followed by
+        ``commands`` are submitted to it while it runs.
+
+        Returns a dict: ``executed``, the last index that ran before the
+        switch; ``remap``, old index -> new index of each kept command;
+        ``indices``, the queued indices of ``commands``; and
+        ``deadTimeMs``, from the arm coming to rest to the first command
+        of the new plan being queued (None if nothing was queued).
+        Anything else that was in the device queue is dropped, and waits
+        on the old indices of later commands no longer match them.
+
+        Cancelled while the command in progress finishes, the queue is
+        left stopped with the old plan in it. Once the clear has been
+        sent the queue is always restarted, even if the call is then
+        cancelled; the journal is emptied in that case.
+        """
+        token = _cancelToken(_session(self.api))
+        with self._cond:
+            SetQueuedCmdStopExec(self.api)
+            executed = self._settle(settle, token)
+            rested = time.perf_counter()
+            keep = [(index, entry) for index, entry in self.journal.items()
+                    if index > executed and after is not None and index <= after]
+            # 清空是否完成不确定时，下次wait()重新读取进度
+            self.journal = {}
+            self.lastIndex = None
+            try:
+                SetQueuedCmdClear(self.api)
+            finally:
+                # 清空中途被取消也要重新启动队列，不能让它一直停着
+                SetQueuedCmdStartExec(self.api)
+            self.currentIndex = self.lastIndex = executed
+            deadTime = None
+            remap = {}
+            for index, (func, args, kwargs) in keep:
+                remap[index] = self.submit(func, *args, **kwargs)[0]
+                if deadTime is None:
+                    deadTime = (time.perf_counter() - rested) * 1000
+            indices = []
+            for command in commands:
+                indices.append(self.submit(command[0], *command[1:])[0])
+                if deadTime is None:
+                    deadTime = (time.perf_counter() - rested) * 1000
+        return {"executed": executed, "remap": remap, "indices": indices, "deadTimeMs": deadTime}
+
+    def _settle(self, settle, token):
+        # StopExec后不再开始新指令：索引前进说明正在执行的已走完，
+        # 位姿settle ms不变说明没有在运动
+        first = GetQueuedCmdCurrentIndex(self.api)[self.queue]
+        pose = GetPose(self.api)
+        since = time.monotonic()
+        while True:
+            token.sleep(self.pollInterval / 1000)
+            current = GetQueuedCmdCurrentIndex(self.api)[self.queue]
+            if current != first:
+                return current
+            latest = GetPose(self.api)
+            if latest != pose:
+                pose, since = latest, time.monotonic()
+            elif (time.monotonic() - since) * 1000 >= settle:
+                return current
+
+
+_senderLock = threading.Lock()
+
+
+def GetQueuedCmdSender(api):
+    """The session's own QueuedCmdSender, made on first use."""
+    session = _session(api)
+    with _senderLock:
+        if session.sender is None:
+            session.sender = QueuedCmdSender(session)
+        return session.sender
+
+
+def ReplaceQueueTail(api, commands, after=None, settle=20):
+    """QueuedCmdSender.replaceTail on the session's sender.
+
+    Only commands submitted through GetQueuedCmdSender(api) can be kept.
+    """
+    return GetQueuedCmdSender(api).replaceTail(commands, after, settle)
+
+
+class QueuedCmdPipeline(object):
+    """Keeps ``lookahead`` commands queued ahead of the executing one.
+
+    ``commands`` is an iterable, typically a generator, of tuples like the
+    QueuedCmdSender.submit() arguments, e.g. ``(dType.SetPTPCmd, mode, x,
+    y, z, rHead)``. The next one is only taken once it fits, so a
+    generator decides each move as late as the lookahead allows while the
+    arm works through the ones before it. start() runs the pipeline on a
+    background thread, run() in the calling one; either way it returns
+    once every command has been executed.
+
+    ``sender`` is the QueuedCmdSender used, ``count`` the number of
+    commands queued so far and ``lastIndex`` the queued index of the
+    latest. stop() ends the pipeline early without touching what is
+    already queued.
+    """
+
+    def __init__(self, api, commands, lookahead=4, pollInterval=5, queue=None):
+        self.api = api
+        self.commands = commands
+        self.sender = QueuedCmdSender(api, lookahead, pollInterval, queue)
+        self.count = 0
+        self.lastIndex = None
+        self.error = None
+        self.token = CancelToken()
+        self._thread = None
+
+    def run(self):
+        """Feed every command, then wait for the last one; returns ``count``."""
+        sender = self.sender
+        try:
+            with cancellable(self.api, token=self.token):
+                for command in self._pull():
+                    self.lastIndex = sender.submit(command[0], *command[1:])[0]
+                    self.count += 1
+                sender.drain()
+        except DobotCancelledError:
+            if self.token.reason != "stopped":
+                raise
+        return self.count
+
+    def _pull(self):
+        # 等到队列有空位再从生成器取下一条
+        iterator = iter(self.commands)
+        while True:
+            self.sender.wait()
+            self.token.check()
+            try:
+                yield next(iterator)
+            except StopIteration:
+                return
+
+    def _runThread(self):
+        try:
+            self.run()
+        except BaseException as error:
+            self.error = error
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._runThread, name="DobotQueuedCmdPipeline", daemon=True)
+            self._thread.start()
+        return self
+
+    def join(self, timeout=None):
+        """Wait for the background run; True once it is over.
+
+        Re-raises what ended it with an error, e.g. DobotCancelledError
+        from CancelWaits or an exception from the generator.
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                return False
+        if self.error is not None:
+            raise self.error
+        return True
+
+    def stop(self):
+        """Stop pulling commands and waiting; the queued ones still run."""
+        self.token.cancel("stopped")
+        self.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, excType, *exc):
+        # 块内出错时停止，否则等流水线跑完
+        if excType is not None:
+            self.stop()
+        else:
+            self.join()
+
+
+##################  Emergency stop   ##################
+
+class StopLane(object):
+    """Stop path of one session that does not wait for anything else.
+
+    Its threads are started ahead of time, one per routed target, and call
+    SetQueuedCmdForceStopExec then SetQueuedCmdClear on the library
+    directly: no RetryPolicy, no call statistics, no queueing behind
+    other wrappers. A failed call is repeated after ``retryDelay`` ms,
+    doubling up to ``maxRetryDelay`` ms so a saturated link is not
+    flooded, until it succeeds or ``timeout`` ms have passed. Get the
+    session's lane with GetStopLane, or just call EmergencyStop.
+    """
+
+    def __init__(self, api, timeout=500, retryDelay=2, maxRetryDelay=20):
+        self.api = api
+        self.timeout = timeout
+        self.retryDelay = retryDelay
+        self.maxRetryDelay = maxRetryDelay
+        self.last = None
+        self._cond = threading.Condition()
+        self._jobs = []
+        self._threads = []
+        self._stopping = threading.Lock()
+
+    def start(self, workers=2):
+        with self._cond:
+            while len(self._threads) < workers:
+                thread = threading.Thread(target=self._run, name="DobotStopLane", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        return self
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._jobs:
+                    self._cond.wait()
+                job = self._jobs.pop()
+            self._stopTarget(*job)
+
+    def _stopTarget(self, session, target, deadline, report, done):
+        entry = report[target] = {}
+        try:
+            for name in ("SetQueuedCmdForceStopExec", "SetQueuedCmdClear"):
+                func = getattr(session.dll, name)
+                start = time.perf_counter()
+                attempts = 0
+                pause = self.retryDelay
+                while True:
+                    result = func(session.masterId, target)
+                    attempts += 1
+                    left = deadline - time.monotonic()
+                    if result == DobotCommunicate.DobotCommunicate_NoError or left <= 0:
+                        break
+                    time.sleep(min(pause / 1000, left))
+                    pause = min(pause * 2, self.maxRetryDelay)
+                entry[name] = {"result": result, "attempts": attempts, "ms": (time.perf_counter() - start) * 1000}
+        except Exception as error:
+            entry["error"] = error
+        finally:
+            with done:
+                done.count -= 1
+                done.notify_all()
+
+    def stop(self, reason="emergency stop", timeout=None):
+        """Force-stop and clear the queues of every routed target at once.
+
+        Blocking calls on the session are broken with CancelWaits(reason)
+        while the stop commands are on their way. Returns a report dict:
+        ``latencyMs`` from the call to the last acknowledgement, ``ok``
+        when every command returned DobotCommunicate_NoError, and
+        ``targets`` mapping each target id to the result, attempts and ms
+        of both commands (or ``error``). The report is also kept in
+        ``last`` and, with a CallStats attached, recorded there as
+        "EmergencyStop". After a successful stop, cached parameter writes
+        the clear threw away are dropped; reading the queue index for that
+        is retried for at most ``timeout`` ms.
+        """
+        session = _session(self.api)
+        timeout = self.timeout if timeout is None else timeout
+        with self._stopping:
+            start = time.perf_counter_ns()
+            deadline = time.monotonic() + timeout / 1000
+            targets = session.routes.all
+            report = {}
+            done = threading.Condition()
+            done.count = len(targets)
+            self.start(len(targets))
+            with self._cond:
+                for target in targets:
+                    self._jobs.append((session, target, deadline, report, done))
+                self._cond.notify_all()
+            # 停止指令发出后再打断其他线程的等待
+            CancelWaits(self.api, reason)
+            with done:
+                done.wait_for(lambda: done.count == 0, max(0.0, deadline - time.monotonic()) + 0.1)
+            elapsed = time.perf_counter_ns() - start
+        results = [entry[name]["result"] for entry in report.values() for name in entry if name != "error"]
+        ok = len(report) == len(targets) and len(results) == 2 * len(targets) and \
+            all(result == DobotCommunicate.DobotCommunicate_NoError for result in results)
+        self.last = {"reason": reason, "latencyMs": elapsed / 1e6, "ok": ok, "targets": dict(report)}
+        if session.stats is not None:
+            session.stats.record("EmergencyStop", elapsed, results, not ok)
+        if ok:
+            # 停止后的缓存清理同样受timeout限制
+            _dropPendingParams(self.api, session, RetryPolicy(timeout=timeout))
+        return self.last
+
+
+def GetStopLane(api):
+    """The session's StopLane, created and started on first use.
+
+    Calling it once after ConnectDobot keeps thread start-up out of the
+    first EmergencyStop.
+    """
+    session = _session(api)
+    if session.stopLane is None:
+        session.stopLane = StopLane(session).start(len(session.routes.all))
+    return session.stopLane
+
+
+def EmergencyStop(api, reason="emergency stop", timeout=None):
+    """Stop the arm now; see StopLane.stop. Returns the stop report."""
+    return GetStopLane(api).stop(reason, timeout)
+
+
+##################  Batch submission   ##################
+
+def _packBatch(cmdType, mode, points):
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("%s batches need numpy" % cmdType.__name__)
+    points = np.ascontiguousarray(points, dtype=np.float32)
+    if points.ndim != 2 or points.shape[1] != 4:
+        raise ValueError("points must have shape (N, 4), got %r" % (points.shape,))
+    cmds = (cmdType * len(points))()
+    # 结构体1字节对齐，用同样布局的numpy视图按列一次性填充
+    names = [field[0] for field in cmdType._fields_]
+    layout = np.dtype({"names": names, "formats": ["i1", "<f4", "<f4", "<f4", "<f4"],
+                       "offsets": [0, 1, 5, 9, 13], "itemsize": sizeof(cmdType)})
+    view = np.frombuffer(memoryview(cmds).cast("B"), dtype=layout)
+    view[names[0]] = mode
+    for column, name in enumerate(names[1:]):
+        view[name] = points[:, column]
+    return cmds
+
+
+# 批量发送按地址传指令，用自己的原型，不改动dll上缓存的函数对象
+# Batch sends pass each command by address through their own prototype, so
+# the cached function object keeps its _SIGNATURES argtypes.
+_BATCH_PROTOTYPE = CFUNCTYPE(c_int, *(_IDS + [c_void_p] + _QUEUED))
+
+
+def _batchFunc(dll, name):
+    func = getattr(dll, name)
+    if isinstance(func, _CFuncPtr):
+        batch = _BATCH_PROTOTYPE(cast(func, c_void_p).value)
+        batch.__name__ = name
+        return batch
+    # 模拟器等纯Python后端直接接受地址
+    return func
+
+
+def _submitBatch(api, name, cmds, window, pollInterval):
+    session = _session(api)
+    func = _batchFunc(session.dll, name)
+    base = addressof(cmds)
+    size = sizeof(cmds._type_)
+    queuedCmdIndex = c_uint64(0)
+    indexRef = byref(queuedCmdIndex)
+    queue = session.routes.armQueue
+    current = GetQueuedCmdCurrentIndex(api)[queue]
+    first = None
+    for i in range(len(cmds)):
+        if queuedCmdIndex.value - current >= window:
+            current = GetQueuedCmdCurrentIndex(api)[queue]
+            while queuedCmdIndex.value - current >= window:
+                _cancelToken(session).sleep(pollInterval / 1000)
+                current = GetQueuedCmdCurrentIndex(api)[queue]
+        _call(session, 2, func, session.masterId, session.slaveId, base + i * size, True, indexRef)
+        if first is None:
+            first = queuedCmdIndex.value
+    if first is None:
+        return []
+    return [first, queuedCmdIndex.value]
+
+
+def SetPTPCmdBatch(api, ptpMode, points, window=16, pollInterval=5):
+    """Queue one PTP motion per row of ``points`` (N x 4: x, y, z, rHead).
+
+    The rows are packed into a PTPCmd array in one go and sent with at most
+    ``window`` commands waiting on the device, like QueuedCmdSender.
+    Returns [firstIndex, lastIndex], or [] for an empty array. Needs numpy.
+    """
+    return _submitBatch(api, "SetPTPCmd", _packBatch(PTPCmd, ptpMode, points), window, pollInterval)
+
+
+def SetCPCmdBatch(api, cpMode, points, window=16, pollInterval=5):
+    """Queue one CP segment per row of ``points`` (N x 4: x, y, z, velocity).
+
+    See SetPTPCmdBatch.
+    """
+    return _submitBatch(api, "SetCPCmd", _packBatch(CPCmd, cpMode, points), window, pollInterval)
+
+
+_attachMethods(globals())
@@ -0,0 +1,535 @@
+import collections
+import concurrent.futures
+import ctypes
+import glob
+import os
+import select
+import threading
+import DobotDllType as dType
+
+# 帧格式: AA AA | len | id | ctrl | params | checksum
+# Frame: 0xAA 0xAA, len = len(params) + 2, id, ctrl, params, checksum where
+# checksum makes id + ctrl + params sum to 0 mod 256.
+HEADER = b"\xaa\xaa"
+MAX_PARAMS = 253
+
+CTRL_WRITE = 0x01
+CTRL_QUEUED = 0x02
+
+# DobotDll接口名 -> 协议指令ID (Dobot Magician Communication Protocol)
+COMMANDS = {
+    "GetDeviceSN": 0, "SetDeviceSN": 0,
+    "GetDeviceName": 1,
+    "GetDeviceVersion": 2,
+    "SetDeviceWithL": 3, "GetDeviceWithL": 3,
+    "GetDeviceTime": 4,
+    "GetDeviceID": 5,
+    "GetPose": 10,
+    "ResetPose": 11,
+    "GetPoseL": 13,
+    "ClearAllAlarmsState": 20,
+    "SetHOMEParams": 30, "GetHOMEParams": 30,
+    "SetHOMECmd": 31,
+    "SetAutoLevelingCmd": 32, "GetAutoLevelingResult": 32,
+    "SetHHTTrigMode": 40, "GetHHTTrigMode": 40,
+    "SetHHTTrigOutputEnabled": 41, "GetHHTTrigOutputEnabled": 41,
+    "GetHHTTrigOutput": 42,
+    "SetArmOrientation": 50, "GetArmOrientation": 50,
+    "SetEndEffectorParams": 60, "GetEndEffectorParams": 60,
+    "SetEndEffectorLaser": 61, "GetEndEffectorLaser": 61,
+    "SetEndEffectorSuctionCup": 62, "GetEndEffectorSuctionCup": 62,
+    "SetEndEffectorGripper": 63, "GetEndEffectorGripper": 63,
+    "SetJOGJointParams": 70, "GetJOGJointParams": 70,
+    "SetJOGCoordinateParams": 71, "GetJOGCoordinateParams": 71,
+    "SetJOGCommonParams": 72, "GetJOGCommonParams": 72,
+    "SetJOGCmd": 73,
+    "SetJOGLParams": 74, "GetJOGLParams": 74,
+    "SetPTPJointParams": 80, "GetPTPJointParams": 80,
+    "SetPTPCoordinateParams": 81, "GetPTPCoordinateParams": 81,
+    "SetPTPJumpParams": 82, "GetPTPJumpParams": 82,
+    "SetPTPCommonParams": 83, "GetPTPCommonParams": 83,
+    "SetPTPCmd": 84,
+    "SetPTPLParams": 85, "GetPTPLParams": 85,
+    "SetPTPWithLCmd": 86,
+    "SetCPParams": 90, "GetCPParams": 90,
+    "SetCPCmd": 91,
+    "SetCPLECmd": 92,
+    "SetARCParams": 100, "GetARCParams": 100,
+    "SetARCCmd": 101,
+    "SetWAITCmd": 110,
+    "SetTRIGCmd": 120,
+    "SetIOMultiplexing": 130, "GetIOMultiplexing": 130,
+    "SetIODO": 131, "GetIODO": 131,
+    "SetIOPWM": 132, "GetIOPWM": 132,
+    "GetIODI": 133,
+    "GetIOADC": 134,
+    "SetEMotor": 135,
+    "SetColorSensor": 137, "GetColorSensor": 137,
+    "SetInfraredSensor": 138, "GetInfraredSensor": 138,
+    "SetWIFIConfigMode": 150, "GetWIFIConfigMode": 150,
+    "SetWIFISSID": 151, "GetWIFISSID": 151,
+    "SetWIFIPassword": 152, "GetWIFIPassword": 152,
+    "SetWIFIIPAddress": 153, "GetWIFIIPAddress": 153,
+    "SetWIFINetmask": 154, "GetWIFINetmask": 154,
+    "SetWIFIGateway": 155, "GetWIFIGateway": 155,
+    "SetWIFIDNS": 156, "GetWIFIDNS": 156,
+    "GetWIFIConnectStatus": 157,
+    "SetQueuedCmdStartExec": 240,
+    "SetQueuedCmdStopExec": 241,
+    "SetQueuedCmdForceStopExec": 242,
+    "SetQueuedCmdStartDownload": 243,
+    "SetQueuedCmdStopDownload": 244,
+    "SetQueuedCmdClear": 245,
+    "GetQueuedCmdCurrentIndex": 246,
+}
+
+
+def _obj(arg):
+    # byref()传入的参数取回原对象
+    return getattr(arg, "_obj", arg)
+
+
+def _isPointer(argtype):
+    return isinstance(argtype, type) and issubclass(argtype, ctypes._Pointer)
+
+
+def _isWrite(name):
+    return not name.startswith("Get")
+
+
+def _params(signature):
+    queued = signature[-2:] == dType._QUEUED
+    return (signature[2:-2] if queued else signature[2:]), queued
+
+
+def _addressed(structType):
+    # IO读取时请求里带上地址字节
+    return issubclass(structType, ctypes.Structure) and structType._fields_[0][0] == "address"
+
+
+def checksum(data):
+    return -sum(data) & 0xFF
+
+
+class FrameReader(object):
+    """Splits a byte stream into (id, ctrl, params) frames, dropping bad ones."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        buffer = self._buffer
+        buffer += data
+        frames = []
+        while True:
+            start = buffer.find(HEADER)
+            if start < 0:
+                del buffer[:max(len(buffer) - 1, 0)]
+                return frames
+            if len(buffer) < start + 3:
+                break
+            length = buffer[start + 2]
+            end = start + 3 + length + 1
+            if length == HEADER[0]:
+                # AA AA AA：前面多了一个字节，帧头从下一个开始
+                del buffer[:start + 1]
+                continue
+            if length < 2:
+                del buffer[:start + 2]
+                continue
+            if len(buffer) < end:
+                break
+            body = bytes(buffer[start + 3:end - 1])
+            if checksum(body) == buffer[end - 1]:
+                frames.append((body[0], body[1], body[2:]))
+                del buffer[:end]
+            else:
+                del buffer[:start + 2]
+        if start > 0:
+            del buffer[:start]
+        return frames
+
+
+def encodeRequest(name, signature, args):
+    """Turn DobotDll-style arguments into (ctrl, parts, outputs, indexOut)."""
+    params, queued = _params(signature)
+    write = _isWrite(name)
+    parts = []
+    outputs = []
+    skipLength = False
+    for argtype, value in zip(params, args[2:]):
+        if skipLength:
+            skipLength = False
+            continue
+        if argtype is ctypes.c_char_p:
+            if write:
+                parts.append(getattr(value, "value", value))
+            else:
+                outputs.append(value)
+                skipLength = True
+        elif _isPointer(argtype):
+            if isinstance(value, int):
+                # 批量接口按地址传入
+                parts.append(ctypes.string_at(value, ctypes.sizeof(argtype._type_)))
+                continue
+            obj = _obj(value)
+            if write:
+                parts.append(memoryview(obj).cast("B"))
+            else:
+                outputs.append(obj)
+                if _addressed(type(obj)):
+                    parts.append(memoryview(obj).cast("B")[:1])
+        else:
+            parts.append(bytes(argtype(value)))
+    ctrl = CTRL_WRITE if write else 0
+    indexOut = None
+    if queued:
+        if args[-2]:
+            ctrl |= CTRL_QUEUED
+        indexOut = _obj(args[-1])
+    return ctrl, parts, outputs, indexOut
+
+
+def decodeResponse(ctrl, params, outputs, indexOut):
+    """Fill the output arguments from a response; returns a DobotCommunicate code."""
+    if ctrl & CTRL_QUEUED:
+        # 队列满时模拟器回复空参数（仿真约定，协议文档没有规定固件的回复）
+        if len(params) < 8:
+            return dType.DobotCommunicate.DobotCommunicate_BufferFull
+        indexOut.value = int.from_bytes(params[:8], "little")
+        return dType.DobotCommunicate.DobotCommunicate_NoError
+    sizes = [ctypes.sizeof(out) for out in outputs]
+    if sum(sizes) != len(params) and len(params) == len(outputs):
+        # 固件用单字节表示的开关量
+        sizes = [1] * len(outputs)
+    offset = 0
+    for out, size in zip(outputs, sizes):
+        if isinstance(out, ctypes.Array) and out._type_ is ctypes.c_char:
+            text = params[offset:offset + len(out) - 1]
+            out.value = text
+            offset = len(params)
+            continue
+        chunk = params[offset:offset + size]
+        ctypes.memset(ctypes.addressof(out), 0, ctypes.sizeof(out))
+        ctypes.memmove(ctypes.addressof(out), chunk, min(len(chunk), ctypes.sizeof(out)))
+        offset += size
+    return dType.DobotCommunicate.DobotCommunicate_NoError
+
+
+class SerialLink(object):
+    """One serial port speaking Dobot frames, with pipelined requests.
+
+    request() writes a frame from a preallocated buffer and returns a Future
+    straight away; a reader thread matches responses to requests in order,
+    so several requests can be in flight on the wire at once.
+
+    A request given up with abandon() is forgotten, and before the next
+    frame goes out on an otherwise idle link the input is flushed, so a
+    lost or late reply cannot shift the replies of later requests.
+    """
+
+    def __init__(self, port, baudrate=115200):
+        # termios/tty只在POSIX上有，用到串口时再导入，Windows上导入本模块不报错
+        import termios
+        import tty
+        self._termios = termios
+        self.fd = os.open(port, os.O_RDWR | os.O_NOCTTY)
+        tty.setraw(self.fd)
+        speed = getattr(termios, "B%d" % baudrate, None)
+        if speed is not None:
+            attrs = termios.tcgetattr(self.fd)
+            attrs[4] = attrs[5] = speed
+            termios.tcsetattr(self.fd, termios.TCSANOW, attrs)
+        self._tx = bytearray(HEADER + bytes(4 + MAX_PARAMS))
+        self._txView = memoryview(self._tx)
+        self._pending = collections.deque()
+        self._frames = FrameReader()
+        self._resync = False
+        self._writeLock = threading.Lock()
+        self._readLock = threading.Lock()
+        self._closed = False
+        self._reader = threading.Thread(target=self._run, name="DobotSerialReader", daemon=True)
+        self._reader.start()
+
+    def request(self, cmdId, ctrl, parts):
+        size = sum(len(part) for part in parts)
+        if size > MAX_PARAMS:
+            raise ValueError("frame params too long: %d bytes" % size)
+        future = concurrent.futures.Future()
+        with self._writeLock:
+            tx = self._tx
+            view = self._txView
+            offset = 5
+            for part in parts:
+                n = len(part)
+                view[offset:offset + n] = part
+                offset += n
+            tx[2] = size + 2
+            tx[3] = cmdId
+            tx[4] = ctrl
+            tx[offset] = checksum(view[3:offset])
+            with self._readLock:
+                if self._resync and not self._pending:
+                    # 丢弃超时请求留下的应答和半帧
+                    self._termios.tcflush(self.fd, self._termios.TCIFLUSH)
+                    self._frames = FrameReader()
+                    self._resync = False
+                self._pending.append((cmdId, future))
+            frame = view[:offset + 1]
+            while frame:
+                frame = frame[os.write(self.fd, frame):]
+        return future
+
+    def abandon(self, future):
+        """Forget a request whose reply is no longer awaited."""
+        with self._readLock:
+            for entry in self._pending:
+                if entry[1] is future:
+                    self._pending.remove(entry)
+                    break
+            self._resync = True
+        future.cancel()
+
+    def _run(self):
+        while not self._closed:
+            try:
+                ready = select.select([self.fd], [], [], 0.1)[0]
+                with self._readLock:
+                    data = os.read(self.fd, 4096) if ready else b""
+                    frames = self._frames.feed(data)
+                    replies = [self._match(cmdId, ctrl, params) for cmdId, ctrl, params in frames]
+            except OSError:
+                break
+            for future, result in replies:
+                if future is not None and future.set_running_or_notify_cancel():
+                    future.set_result(result)
+        while self._pending:
+            future = self._pending.popleft()[1]
+            if future.set_running_or_notify_cancel():
+                future.set_exception(ConnectionError("serial link closed"))
+
+    def _match(self, cmdId, ctrl, params):
+        # 按顺序匹配；前面没有应答的请求判为丢失，谁都不匹配的应答直接丢弃
+        pending = self._pending
+        if not any(expected == cmdId for expected, _ in pending):
+            return None, None
+        while True:
+            expected, future = pending.popleft()
+            if expected == cmdId:
+                return future, (ctrl, params)
+            if future.set_running_or_notify_cancel():
+                future.set_exception(TimeoutError("no response to command %d" % expected))
+
+    def close(self):
+        self._closed = True
+        self._reader.join()
+        os.close(self.fd)
+
+
+class SerialDll(object):
+    """DobotDll replacement that talks to a Magician over its serial port.
+
+    Returned by ``load("serial")``. Functions take the same arguments as the
+    DLL ones, so the DobotDllType wrappers work unchanged; names without a
+    protocol command in COMMANDS are missing, as with an older DLL. Each
+    ConnectDobot opens one port (e.g. /dev/ttyUSB0) and gets its own
+    masterId. Only directly connected Magicians are supported, not a
+    Controller with slaves. A queued reply without an index is reported
+    as DobotCommunicate_BufferFull; that is how LoopbackEmulator answers a
+    full queue, the real firmware's answer is not documented.
+    """
+
+    def __init__(self, timeout=1.0):
+        self.timeout = timeout
+        self._links = {}
+        self._nextMasterId = 0
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        func = self[name]
+        self.__dict__[name] = func
+        return func
+
+    def __getitem__(self, name):
+        handler = getattr(self, "_" + name, None)
+        if handler is not None:
+            def func(*args):
+                return handler(*args)
+        elif name in COMMANDS:
+            cmdId = COMMANDS[name]
+            signature = dType._signature(name)
+
+            def func(*args):
+                return self._request(name, cmdId, signature, args)
+        else:
+            raise AttributeError("Dobot protocol has no command for %r" % name)
+        func.__name__ = name
+        return func
+
+    def _request(self, name, cmdId, signature, args):
+        link = self._links.get(args[0])
+        if link is None:
+            return dType.DobotCommunicate.DobotCommunicate_InvalidDevice
+        ctrl, parts, outputs, indexOut = encodeRequest(name, signature, args)
+        future = link.request(cmdId, ctrl, parts)
+        try:
+            ctrl, params = future.result(self.timeout)
+        except (concurrent.futures.TimeoutError, TimeoutError):
+            link.abandon(future)
+            return dType.DobotCommunicate.DobotCommunicate_Timeout
+        except ConnectionError:
+            return dType.DobotCommunicate.DobotCommunicate_Timeout
+        return decodeResponse(ctrl, params, outputs, indexOut)
+
+    def _DobotExec(self):
+        return 0
+
+    def _PeriodicTask(self):
+        return 0
+
+    def _SetDebugEnable(self, flag):
+        return 0
+
+    def _SetCmdTimeout(self, masterId, timeout):
+        self.timeout = timeout / 1000
+        return 0
+
+    def _SearchDobot(self, buffer, maxLen):
+        ports = sorted(glob.glob("/dev/ttyUSB*") + glob.glob("/dev/ttyACM*") + glob.glob("/dev/cu.usbserial*"))
+        text = " ".join(ports).encode("utf-8")[:len(buffer) - 1]
+        ctypes.memmove(buffer, text + b"\0", len(text) + 1)
+        return len(ports)
+
+    def _ConnectDobot(self, portName, baudrate, info):
+        port = portName.value.decode("utf-8")
+        if not port:
+            ports = []
+            buffer = ctypes.create_string_buffer(1000)
+            if self._SearchDobot(buffer, 1000):
+                ports = buffer.value.decode("utf-8").split()
+            if not ports:
+                return dType.DobotConnect.DobotConnect_NotFound
+            port = ports[0]
+        try:
+            link = SerialLink(port, baudrate)
+        except FileNotFoundError:
+            return dType.DobotConnect.DobotConnect_NotFound
+        except OSError:
+            return dType.DobotConnect.DobotConnect_Occupied
+        with self._lock:
+            masterId = self._nextMasterId
+            self._nextMasterId += 1
+            self._links[masterId] = link
+        info = _obj(info)
+        info.masterDevInfo.devId = masterId
+        info.masterDevInfo.type = dType.DevType.Magician
+        name = b"Magician"
+        ctypes.memmove(info.masterDevInfo.firmwareName, name, len(name))
+        return dType.DobotConnect.DobotConnect_NoError
+
+    def _DisconnectDobot(self, masterId):
+        with self._lock:
+            link = self._links.pop(masterId, None)
+        if link is not None:
+            link.close()
+        return 0
+
+
+class LoopbackEmulator(object):
+    """A fake Magician on a pty, answering frames from a SimulatedDll.
+
+    ``port`` is the device path to hand to ConnectDobot. Requests are
+    decoded with the same tables SerialDll uses and run against ``sim``;
+    a queued command that hits a full queue gets an empty reply, which
+    SerialDll reports as DobotCommunicate_BufferFull. That empty reply is
+    a convention of this emulator only: the protocol document does not
+    say what the firmware answers when its queue is full, so against a
+    real arm a full queue may show up as a timeout instead. Keep the queue
+    below its limit with QueuedCmdSender rather than relying on it.
+    Setting ``drop`` to n leaves the next n requests unanswered, as if
+    their replies were lost. POSIX only, like SerialLink.
+    """
+
+    def __init__(self, sim=None):
+        import tty
+        if sim is None:
+            import DobotSimulator
+            sim = DobotSimulator.SimulatedDll()
+        self.sim = sim
+        self._names = dict(((cmdId, _isWrite(name)), name) for name, cmdId in COMMANDS.items())
+        self._fd, slave = os.openpty()
+        tty.setraw(slave)
+        self.port = os.ttyname(slave)
+        self._slave = slave
+        self.drop = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="DobotLoopbackEmulator", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        reader = FrameReader()
+        while not self._closed:
+            try:
+                ready = select.select([self._fd], [], [], 0.1)[0]
+                data = os.read(self._fd, 4096) if ready else b""
+            except OSError:
+                break
+            for cmdId, ctrl, params in reader.feed(data):
+                name = self._names.get((cmdId, bool(ctrl & CTRL_WRITE)))
+                if name is None:
+                    continue
+                reply = self._handle(name, ctrl, params)
+                if self.drop:
+                    self.drop -= 1
+                    continue
+                frame = bytes([len(reply) + 2, cmdId, ctrl]) + reply
+                os.write(self._fd, HEADER + frame + bytes([checksum(frame[1:])]))
+
+    def _handle(self, name, ctrl, params):
+        signature = dType._signature(name)
+        argtypes, queued = _params(signature)
+        write = _isWrite(name)
+        args = [0, 0]
+        outputs = []
+        offset = 0
+        skipLength = False
+        for argtype in argtypes:
+            if skipLength:
+                args.append(256)
+                skipLength = False
+            elif argtype is ctypes.c_char_p:
+                buffer = ctypes.create_string_buffer(params[offset:] if write else 256)
+                offset = len(params)
+                args.append(buffer)
+                if not write:
+                    outputs.append(buffer)
+                    skipLength = True
+            elif _isPointer(argtype):
+                obj = argtype._type_()
+                size = ctypes.sizeof(obj) if write else (1 if _addressed(type(obj)) else 0)
+                ctypes.memmove(ctypes.addressof(obj), params[offset:offset + size], len(params[offset:offset + size]))
+                offset += size
+                args.append(ctypes.byref(obj))
+                if not write:
+                    outputs.append(obj)
+            else:
+                size = ctypes.sizeof(argtype)
+                args.append(argtype.from_buffer_copy(params[offset:offset + size].ljust(size, b"\0")).value)
+                offset += size
+        index = ctypes.c_uint64(0)
+        if queued:
+            args += [bool(ctrl & CTRL_QUEUED), ctypes.byref(index)]
+        result = getattr(self.sim, name)(*args)
+        if ctrl & CTRL_QUEUED:
+            if result == dType.DobotCommunicate.DobotCommunicate_BufferFull:
+                return b""
+            return index.value.to_bytes(8, "little")
+        return b"".join(out.value if isinstance(out, ctypes.Array) else bytes(out) for out in outputs)
+
+    def close(self):
+        self._closed = True
+        self._thread.join()
+        os.close(self._fd)
+        os.close(self._slave)
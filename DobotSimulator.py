@@ -0,0 +1,496 @@
+import collections
+import ctypes
+import math
+import threading
+import time
+import DobotDllType as dType
+
+NoError = dType.DobotCommunicate.DobotCommunicate_NoError
+BufferFull = dType.DobotCommunicate.DobotCommunicate_BufferFull
+
+# 简化的Magician几何：大臂、小臂长度与末端水平偏移(mm)
+# Simplified Magician geometry: rear arm, forearm and end offset in mm
+REAR_ARM = 135.0
+FORE_ARM = 147.0
+END_OFFSET = 60.0
+
+
+def forward(joints):
+    """Joint angles (deg) -> [x, y, z, rHead]."""
+    j1, j2, j3, j4 = [math.radians(j) for j in joints]
+    reach = REAR_ARM * math.sin(j2) + FORE_ARM * math.cos(j3) + END_OFFSET
+    return [reach * math.cos(j1), reach * math.sin(j1),
+            REAR_ARM * math.cos(j2) - FORE_ARM * math.sin(j3), joints[0] + joints[3]]
+
+
+def inverse(x, y, z, rHead):
+    """[x, y, z, rHead] -> joint angles (deg), clamped to the reachable range."""
+    j1 = math.atan2(y, x)
+    reach = math.hypot(x, y) - END_OFFSET
+    d = min(max(math.hypot(reach, z), abs(REAR_ARM - FORE_ARM) + 1e-6), REAR_ARM + FORE_ARM - 1e-6)
+    alpha = math.acos((REAR_ARM ** 2 + d ** 2 - FORE_ARM ** 2) / (2 * REAR_ARM * d))
+    j2 = math.atan2(reach, z) - alpha
+    j3 = math.atan2(-(z - REAR_ARM * math.cos(j2)), reach - REAR_ARM * math.sin(j2))
+    j1, j2, j3 = math.degrees(j1), math.degrees(j2), math.degrees(j3)
+    return [j1, j2, j3, rHead - j1]
+
+
+def trapezoid(distance, velocity, acceleration):
+    """Time in ms to cover ``distance`` from rest to rest on a trapezoidal profile."""
+    distance = abs(distance)
+    if distance == 0:
+        return 0.0
+    velocity = max(velocity, 1e-3)
+    acceleration = max(acceleration, 1e-3)
+    if distance * acceleration >= velocity * velocity:
+        return (distance / velocity + velocity / acceleration) * 1000
+    return 2 * math.sqrt(distance / acceleration) * 1000
+
+
+class SimClock(object):
+    """Wall clock scaled by ``speed``: 1 is real time, 10 runs ten times faster."""
+
+    def __init__(self, speed=1.0):
+        self.speed = speed
+        self._t0 = time.monotonic()
+
+    def now(self):
+        return (time.monotonic() - self._t0) * 1000 * self.speed
+
+    def tick(self):
+        pass
+
+
+class VirtualClock(object):
+    """Deterministic clock in ms.
+
+    Moves only by ``callTime`` per simulated DLL call and by advance(), so
+    the same sequence of calls always sees the same device state.
+    """
+
+    def __init__(self, callTime=1.0):
+        self.callTime = callTime
+        self._now = 0.0
+
+    def now(self):
+        return self._now
+
+    def tick(self):
+        self._now += self.callTime
+
+    def advance(self, ms):
+        self._now += ms
+
+
+def _defaultParams():
+    return {
+        "PTPJointParams": dType.PTPJointParams(200, 200, 200, 200, 200, 200, 200, 200),
+        "PTPCoordinateParams": dType.PTPCoordinateParams(200, 200, 200, 200),
+        "PTPCommonParams": dType.PTPCommonParams(100, 100),
+        "PTPJumpParams": dType.PTPJumpParams(20, 200),
+        "CPParams": dType.CPParams(200, 100, 200, 0),
+        "CPCommonParams": dType.CPCommonParams(100, 100),
+        "ARCParams": dType.ARCParams(200, 200, 200, 200),
+        "ARCCommonParams": dType.ARCCommonParams(100, 100),
+        "HOMEParams": dType.HOMEParams(200, 0, 0, 0),
+    }
+
+
+class _Command(object):
+    __slots__ = ("index", "issued", "plan", "start", "duration", "fromJoints", "toJoints", "effect")
+
+    def __init__(self, index, issued, plan):
+        self.index = index
+        self.issued = issued
+        self.plan = plan
+        self.start = None
+
+
+class _Device(object):
+    # 一个目标(主机本身、-1控制盒或从机)的状态与指令队列
+    # State and command queue of one target: the master, the controller (-1) or a slave
+
+    def __init__(self, now):
+        self.params = _defaultParams()
+        home = self.params["HOMEParams"]
+        self.joints = inverse(home.x, home.y, home.z, home.r)
+        self.io = collections.defaultdict(dict)
+        self.queue = collections.deque()
+        self.running = True
+        self.lastIndex = 0
+        self.executedIndex = 0
+        self.cursor = now
+
+    def update(self, now):
+        # 按时间执行队列：运行中的指令即使StopExec后也会走完
+        while self.queue and (self.running or self.queue[0].start is not None):
+            cmd = self.queue[0]
+            if cmd.start is None:
+                cmd.start = max(self.cursor, cmd.issued)
+                cmd.fromJoints = list(self.joints)
+                cmd.duration, cmd.toJoints, cmd.effect = cmd.plan(self)
+            end = cmd.start + cmd.duration
+            if end > now:
+                return
+            self._finish(cmd)
+            self.executedIndex = cmd.index
+            self.cursor = end
+            self.queue.popleft()
+        self.cursor = max(self.cursor, now)
+
+    def _finish(self, cmd):
+        if cmd.toJoints is not None:
+            self.joints = cmd.toJoints
+        if cmd.effect is not None:
+            cmd.effect(self)
+
+    def runNow(self, plan):
+        cmd = _Command(0, 0, plan)
+        cmd.duration, cmd.toJoints, cmd.effect = plan(self)
+        self._finish(cmd)
+
+    def jointsAt(self, now):
+        if self.queue and self.queue[0].start is not None and self.queue[0].toJoints is not None:
+            cmd = self.queue[0]
+            fraction = min(max((now - cmd.start) / cmd.duration, 0.0), 1.0) if cmd.duration else 1.0
+            return [a + (b - a) * fraction for a, b in zip(cmd.fromJoints, cmd.toJoints)]
+        return list(self.joints)
+
+    def abort(self, now, clear):
+        # 运行中的指令停在当前位置
+        if self.queue and self.queue[0].start is not None:
+            self.joints = self.jointsAt(now)
+            self.queue.popleft()
+        if clear:
+            self.queue.clear()
+        self.cursor = now
+
+    def _ratios(self, name):
+        common = self.params[name]
+        return common.velocityRatio / 100, common.accelerationRatio / 100
+
+    def jointTime(self, fromJoints, toJoints):
+        p = self.params["PTPJointParams"]
+        vr, ar = self._ratios("PTPCommonParams")
+        velocities = (p.joint1Velocity, p.joint2Velocity, p.joint3Velocity, p.joint4Velocity)
+        accelerations = (p.joint1Acceleration, p.joint2Acceleration, p.joint3Acceleration, p.joint4Acceleration)
+        return max(trapezoid(b - a, v * vr, acc * ar)
+                   for a, b, v, acc in zip(fromJoints, toJoints, velocities, accelerations))
+
+    def linearTime(self, distance, rDistance, params="PTPCoordinateParams", common="PTPCommonParams"):
+        p = self.params[params]
+        vr, ar = self._ratios(common)
+        return max(trapezoid(distance, p.xyzVelocity * vr, p.xyzAcceleration * ar),
+                   trapezoid(rDistance, p.rVelocity * vr, p.rAcceleration * ar))
+
+    def planPTP(self, mode, target):
+        pose = forward(self.joints)
+        if mode in (dType.PTPMode.PTPJUMPANGLEMode, dType.PTPMode.PTPMOVJANGLEMode, dType.PTPMode.PTPMOVLANGLEMode):
+            toJoints = list(target)
+        elif mode == dType.PTPMode.PTPMOVJANGLEINCMode:
+            toJoints = [a + b for a, b in zip(self.joints, target)]
+        elif mode in (dType.PTPMode.PTPMOVLXYZINCMode, dType.PTPMode.PTPMOVJXYZINCMode):
+            toJoints = inverse(*[a + b for a, b in zip(pose, target)])
+        else:
+            toJoints = inverse(*target)
+        toPose = forward(toJoints)
+        distance = math.dist(pose[:3], toPose[:3])
+        if mode in (dType.PTPMode.PTPMOVLXYZMode, dType.PTPMode.PTPMOVLANGLEMode, dType.PTPMode.PTPMOVLXYZINCMode):
+            duration = self.linearTime(distance, toPose[3] - pose[3])
+        elif mode == dType.PTPMode.PTPJUMPMOVLXYZMode:
+            duration = self.linearTime(distance, toPose[3] - pose[3]) + 2 * self.linearTime(self.params["PTPJumpParams"].jumpHeight, 0)
+        elif mode in (dType.PTPMode.PTPJUMPXYZMode, dType.PTPMode.PTPJUMPANGLEMode):
+            duration = self.jointTime(self.joints, toJoints) + 2 * self.linearTime(self.params["PTPJumpParams"].jumpHeight, 0)
+        else:
+            duration = self.jointTime(self.joints, toJoints)
+        return duration, toJoints, None
+
+
+def _struct(arg, structType):
+    # byref()、结构体或地址(批量接口)都复制一份，调用方之后可以复用缓冲区
+    if isinstance(arg, int):
+        return structType.from_buffer_copy(structType.from_address(arg))
+    return structType.from_buffer_copy(getattr(arg, "_obj", arg))
+
+
+def _obj(arg):
+    # byref()传入的参数取回原对象
+    return getattr(arg, "_obj", arg)
+
+
+def _setText(array, text):
+    data = text.encode("utf-8")[:len(array) - 1]
+    ctypes.memset(array, 0, len(array))
+    ctypes.memmove(array, data, len(data))
+
+
+def _store(name, value):
+    def effect(device):
+        device.params[name] = value
+    return lambda device: (0.0, None, effect)
+
+
+class SimulatedDll(object):
+    """In-process Magician simulator, returned by ``load("sim")``.
+
+    Has every function with a DobotDllType signature and takes the same
+    arguments as the real library. Each target (the master, the controller
+    queue -1 and each slave) has its own command queue of ``queueSize``
+    entries; a full queue answers DobotCommunicate_BufferFull. Queued
+    commands run one after another while the queue is started, which it is
+    from the beginning; SetQueuedCmdStopExec/StartExec pause and resume it:
+
+    - PTP motions take trapezoidal time from PTPJointParams (MOVJ) or
+      PTPCoordinateParams (MOVL), scaled by PTPCommonParams; JUMP adds the
+      lift and drop of PTPJumpParams.jumpHeight
+    - CP and ARC segments use CPParams/ARCParams the same way
+    - WAIT takes its waitTime
+    - Set*Params, IO and everything else take effect in zero time
+
+    ``clock`` is a SimClock (real time, or accelerated with speed > 1) or a
+    VirtualClock for fully deterministic runs. Other Get* functions return
+    the last value set or zeros. ``masterDevType``/``slaveDevType`` choose
+    what ConnectDobot reports, e.g. DevType.Conntroller with
+    DevType.MagicianLite for the dual-queue routing.
+    """
+
+    def __init__(self, masterDevType=dType.DevType.Magician, slaveDevType=dType.DevType.Idle,
+                 clock=None, queueSize=32):
+        self.masterDevType = masterDevType
+        self.slaveDevType = slaveDevType
+        self.clock = clock if clock is not None else SimClock()
+        self.queueSize = queueSize
+        self._lock = threading.RLock()
+        self._nextMasterId = 0
+        self._devices = {}
+
+    def __getattr__(self, name):
+        # 与CDLL一样，首次取到的函数对象缓存在实例上
+        if name.startswith("_"):
+            raise AttributeError(name)
+        func = self[name]
+        self.__dict__[name] = func
+        return func
+
+    def __getitem__(self, name):
+        signature = dType._signature(name)
+        if signature is None:
+            raise AttributeError("simulated Dobot has no function %r" % name)
+        queued = signature[-2:] == dType._QUEUED
+        handler = getattr(self, "_" + name, None)
+
+        def func(*args):
+            with self._lock:
+                self.clock.tick()
+                if queued:
+                    return self._queue(name, handler, args)
+                if handler is not None:
+                    return handler(*args)
+                return self._get(name, args)
+        func.__name__ = name
+        return func
+
+    def now(self):
+        """Simulated time in ms."""
+        return self.clock.now()
+
+    def advance(self, ms):
+        """Move a VirtualClock forward by ``ms``."""
+        with self._lock:
+            self.clock.advance(ms)
+
+    def setIODI(self, address, level, masterId=0, targetId=0):
+        with self._lock:
+            self._device(masterId, targetId).io[address]["di"] = level
+
+    def setIOADC(self, address, value, masterId=0, targetId=0):
+        with self._lock:
+            self._device(masterId, targetId).io[address]["adc"] = value
+
+    def _device(self, masterId, targetId):
+        # 非控制盒时-1即主机本身
+        if self.masterDevType != dType.DevType.Conntroller and targetId == -1:
+            targetId = 0
+        now = self.clock.now()
+        device = self._devices.get((masterId, targetId))
+        if device is None:
+            device = self._devices[(masterId, targetId)] = _Device(now)
+        device.update(now)
+        return device
+
+    def _queue(self, name, handler, args):
+        device = self._device(args[0], args[1])
+        if handler is not None:
+            plan = handler(*args[2:-2])
+        elif name.startswith("Set") and dType._signature("Get" + name[3:]) is not None and len(args) == 5:
+            arg = _obj(args[2])
+            plan = _store(name[3:], _struct(arg, type(arg)) if isinstance(arg, ctypes.Structure) else arg)
+        else:
+            plan = lambda device: (0.0, None, None)
+        if not args[-2]:
+            device.runNow(plan)
+            return NoError
+        if len(device.queue) >= self.queueSize:
+            return BufferFull
+        device.lastIndex += 1
+        device.queue.append(_Command(device.lastIndex, self.clock.now(), plan))
+        _obj(args[-1]).value = device.lastIndex
+        device.update(self.clock.now())
+        return NoError
+
+    def _get(self, name, args):
+        if name.startswith("Get") and len(args) == 3:
+            value = self._device(args[0], args[1]).params.get(name[3:])
+            out = _obj(args[2])
+            if isinstance(value, ctypes.Structure) and type(value) is type(out):
+                ctypes.memmove(ctypes.addressof(out), ctypes.addressof(value), ctypes.sizeof(value))
+        return NoError
+
+    # ---- connection ----
+
+    def _SearchDobot(self, buffer, maxLen):
+        ctypes.memmove(buffer, b"SIM\0", 4)
+        return 1
+
+    def _ConnectDobot(self, portName, baudrate, info):
+        info = _obj(info)
+        masterId = self._nextMasterId
+        self._nextMasterId += 1
+        info.masterDevInfo.devId = masterId
+        info.masterDevInfo.type = self.masterDevType
+        _setText(info.masterDevInfo.firmwareName, "Simulator")
+        _setText(info.masterDevInfo.firwareVersion, "0.0.0")
+        if self.masterDevType == dType.DevType.Conntroller and self.slaveDevType != dType.DevType.Idle:
+            info.slaveDevInfo1.devId = 1
+            info.slaveDevInfo1.type = self.slaveDevType
+            _setText(info.slaveDevInfo1.firmwareName, "Simulator")
+            _setText(info.slaveDevInfo1.firwareVersion, "0.0.0")
+        return dType.DobotConnect.DobotConnect_NoError
+
+    # ---- queue control ----
+
+    def _GetQueuedCmdCurrentIndex(self, masterId, targetId, index):
+        _obj(index).value = self._device(masterId, targetId).executedIndex
+        return NoError
+
+    def _GetQueuedCmdMotionFinish(self, masterId, targetId, finish):
+        _obj(finish).value = not self._device(masterId, targetId).queue
+        return NoError
+
+    def _SetQueuedCmdStartExec(self, masterId, targetId):
+        device = self._device(masterId, targetId)
+        if not device.running:
+            device.running = True
+            device.cursor = self.clock.now()
+        return NoError
+
+    def _SetQueuedCmdStopExec(self, masterId, targetId):
+        self._device(masterId, targetId).running = False
+        return NoError
+
+    def _SetQueuedCmdForceStopExec(self, masterId, targetId):
+        device = self._device(masterId, targetId)
+        device.running = False
+        device.abort(self.clock.now(), False)
+        return NoError
+
+    def _SetQueuedCmdClear(self, masterId, targetId):
+        self._device(masterId, targetId).abort(self.clock.now(), True)
+        return NoError
+
+    # ---- pose ----
+
+    def _GetPose(self, masterId, targetId, pose):
+        device = self._device(masterId, targetId)
+        joints = device.jointsAt(self.clock.now())
+        out = _obj(pose)
+        out.x, out.y, out.z, out.rHead = forward(joints)
+        out.joint1Angle, out.joint2Angle, out.joint3Angle, out.joint4Angle = joints
+        return NoError
+
+    # ---- queued motions: return plan(device) -> (duration ms, target joints, effect) ----
+
+    def _SetPTPCmd(self, cmd):
+        cmd = _struct(cmd, dType.PTPCmd)
+        return lambda device: device.planPTP(cmd.ptpMode, (cmd.x, cmd.y, cmd.z, cmd.rHead))
+
+    def _SetPTPWithLCmd(self, cmd):
+        cmd = _struct(cmd, dType.PTPWithLCmd)
+        return lambda device: device.planPTP(cmd.ptpMode, (cmd.x, cmd.y, cmd.z, cmd.rHead))
+
+    def _SetCPCmd(self, cmd):
+        cmd = _struct(cmd, dType.CPCmd)
+
+        def plan(device):
+            pose = forward(device.joints)
+            target = [cmd.x, cmd.y, cmd.z]
+            if cmd.cpMode == dType.ContinuousPathMode.CPRelativeMode:
+                target = [a + b for a, b in zip(pose[:3], target)]
+            p = device.params["CPParams"]
+            vr, ar = device._ratios("CPCommonParams")
+            velocity = cmd.velocity if cmd.velocity > 0 else p.juncitionVel
+            duration = trapezoid(math.dist(pose[:3], target), velocity * vr, p.planAcc * ar)
+            return duration, inverse(target[0], target[1], target[2], pose[3]), None
+        return plan
+
+    def _SetARCCmd(self, cmd):
+        cmd = _struct(cmd, dType.ARCCmd)
+
+        def plan(device):
+            pose = forward(device.joints)
+            cir = (cmd.cirPoint.x, cmd.cirPoint.y, cmd.cirPoint.z)
+            to = (cmd.toPoint.x, cmd.toPoint.y, cmd.toPoint.z)
+            distance = math.dist(pose[:3], cir) + math.dist(cir, to)
+            duration = device.linearTime(distance, cmd.toPoint.rHead - pose[3], "ARCParams", "ARCCommonParams")
+            return duration, inverse(to[0], to[1], to[2], cmd.toPoint.rHead), None
+        return plan
+
+    def _SetWAITCmd(self, cmd):
+        cmd = _struct(cmd, dType.WAITCmd)
+        return lambda device: (float(cmd.waitTime), None, None)
+
+    def _SetHOMECmd(self, cmd):
+        def plan(device):
+            home = device.params["HOMEParams"]
+            toJoints = inverse(home.x, home.y, home.z, home.r)
+            return device.jointTime(device.joints, toJoints), toJoints, None
+        return plan
+
+    # ---- IO ----
+
+    def _SetIOMultiplexing(self, cmd):
+        cmd = _struct(cmd, dType.IOMultiplexing)
+        return lambda device: (0.0, None, lambda d: d.io[cmd.address].__setitem__("multiplex", cmd.multiplex))
+
+    def _SetIODO(self, cmd):
+        cmd = _struct(cmd, dType.IODO)
+        return lambda device: (0.0, None, lambda d: d.io[cmd.address].__setitem__("do", cmd.level))
+
+    def _SetIOPWM(self, cmd):
+        cmd = _struct(cmd, dType.IOPWM)
+        return lambda device: (0.0, None, lambda d: d.io[cmd.address].__setitem__("pwm", (cmd.frequency, cmd.dutyCycle)))
+
+    def _GetIOMultiplexing(self, masterId, targetId, cmd):
+        cmd = _obj(cmd)
+        cmd.multiplex = self._device(masterId, targetId).io[cmd.address].get("multiplex", 0)
+        return NoError
+
+    def _GetIODO(self, masterId, targetId, cmd):
+        cmd = _obj(cmd)
+        cmd.level = self._device(masterId, targetId).io[cmd.address].get("do", 0)
+        return NoError
+
+    def _GetIOPWM(self, masterId, targetId, cmd):
+        cmd = _obj(cmd)
+        cmd.frequency, cmd.dutyCycle = self._device(masterId, targetId).io[cmd.address].get("pwm", (0, 0))
+        return NoError
+
+    def _GetIODI(self, masterId, targetId, cmd):
+        cmd = _obj(cmd)
+        cmd.level = self._device(masterId, targetId).io[cmd.address].get("di", 0)
+        return NoError
+
+    def _GetIOADC(self, masterId, targetId, cmd):
+        cmd = _obj(cmd)
+        cmd.value = self._device(masterId, targetId).io[cmd.address].get("adc", 0)
+        return NoError
@@ -0,0 +1,75 @@
+import DobotDllType as dType
+import DobotSimulator
+import pytest
+
+
+class Recorder(object):
+    # 记录每个调用的函数名和目标id
+    def __init__(self, dll):
+        self.dll = dll
+        self.calls = []
+
+    def __getattr__(self, name):
+        func = getattr(self.dll, name)
+        if name.startswith("_") or not callable(func):
+            return func
+
+        def record(*args):
+            self.calls.append((name, args[1] if len(args) > 1 else None))
+            return func(*args)
+        record.__name__ = name
+        return record
+
+    def names(self):
+        return [name for name, _ in self.calls]
+
+
+class Flaky(object):
+    # 指定函数先返回几次错误码，之后交给模拟器
+    def __init__(self, dll):
+        self.dll = dll
+        self.failures = {}
+        self.attempts = {}
+
+    def __getattr__(self, name):
+        func = getattr(self.dll, name)
+        if name.startswith("_") or not callable(func):
+            return func
+
+        def call(*args):
+            self.attempts[name] = self.attempts.get(name, 0) + 1
+            count, result = self.failures.get(name, (0, None))
+            if count:
+                self.failures[name] = (count - 1, result)
+                return result
+            return func(*args)
+        call.__name__ = name
+        return call
+
+
+@pytest.fixture
+def connect():
+    """Factory for connected simulator sessions.
+
+    connect(masterDevType, slaveDevType, speed=20.0, clock=None, **options)
+    returns (api, dll): ``dll`` is a Recorder around a Flaky around the
+    SimulatedDll, with the connect calls already forgotten; ``options`` go
+    to DobotSession. Pollers are closed when the test ends.
+    """
+    sessions = []
+
+    def connect(masterDevType=dType.DevType.Magician, slaveDevType=dType.DevType.Idle,
+                speed=20.0, clock=None, **options):
+        sim = DobotSimulator.SimulatedDll(masterDevType, slaveDevType,
+                                          clock=clock or DobotSimulator.SimClock(speed))
+        dll = Recorder(Flaky(sim))
+        api = dType.DobotSession(dll, **options)
+        dType.ConnectDobot(api, "", 115200)
+        del dll.calls[:]
+        dll.dll.attempts.clear()
+        sessions.append(api)
+        return api, dll
+    yield connect
+    for api in sessions:
+        if api.poller is not None:
+            api.poller.close()
@@ -0,0 +1,35 @@
+import asyncio
+import DobotAsync
+import DobotDllType as dType
+import DobotSimulator
+import pytest
+
+
+@pytest.mark.parametrize("layout", [
+    (dType.DevType.Magician, dType.DevType.Idle),
+    (dType.DevType.Conntroller, dType.DevType.MagicianLite),
+    (dType.DevType.Conntroller, dType.DevType.Idle),
+])
+def test_ptp_waits_for_the_arm_queue(layout):
+    async def main():
+        sim = DobotSimulator.SimulatedDll(*layout, clock=DobotSimulator.SimClock(20.0))
+        async with await DobotAsync.AsyncDobot.connect(sim, "") as robot:
+            index = await asyncio.wait_for(robot.ptp(dType.PTPMode.PTPMOVLXYZMode, 220, 20, 30, 0), 5)
+            current = await robot.GetQueuedCmdCurrentIndex()
+            assert current[robot.api.routes.armQueue] >= index
+            last = await robot.cp(dType.ContinuousPathMode.CPAbsoluteMode, 230, 0, 30, 50)
+            assert await asyncio.wait_for(robot.wait_index(last), 5) >= last
+    asyncio.run(main())
+
+
+def test_generated_wrappers_are_methods():
+    async def main():
+        sim = DobotSimulator.SimulatedDll(clock=DobotSimulator.SimClock(20.0))
+        async with await DobotAsync.AsyncDobot.connect(sim, "") as robot:
+            await robot.SetPTPJumpParams(20, zLimit=100)
+            assert await robot.GetPTPJumpParams() == [20, 100]
+            assert robot.SetPTPJumpParams.__doc__ == dType.SetPTPJumpParams.__doc__
+            for name in ("PTPMode", "DobotSession", "load"):
+                with pytest.raises(AttributeError):
+                    getattr(robot, name)
+    asyncio.run(main())
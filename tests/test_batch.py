@@ -0,0 +1,42 @@
+import ctypes
+import sys
+
+import DobotDllType as dType
+import pytest
+
+np = pytest.importorskip("numpy")
+
+LAYOUTS = [
+    (dType.DevType.Magician, dType.DevType.Idle),
+    (dType.DevType.Conntroller, dType.DevType.MagicianLite),
+    (dType.DevType.Conntroller, dType.DevType.Idle),
+]
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_ptp_batch_moves_past_window(connect, layout):
+    api, dll = connect(*layout, speed=50.0)
+    points = np.array([(200 + 10 * (i % 2), 0, 30, 0) for i in range(20)])
+    with dType.cancellable(api, timeout=10000):
+        first, last = dType.SetPTPCmdBatch(api, dType.PTPMode.PTPMOVLXYZMode, points, window=4)
+    assert last - first == len(points) - 1
+    queue = api.routes.armQueue
+    with dType.cancellable(api, timeout=10000):
+        assert dType.GetQueuedCmdFuture(api, last, queue).result(10) >= last
+
+
+def test_batch_shape_is_checked(connect):
+    api, dll = connect()
+    with pytest.raises(ValueError):
+        dType.SetCPCmdBatch(api, dType.ContinuousPathMode.CPAbsoluteMode, np.zeros((3, 3)))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs the C library through CDLL(None)")
+def test_batch_prototype_leaves_the_dll_function():
+    libc = ctypes.CDLL(None)
+    libc.labs.argtypes = [ctypes.c_long]
+    func = dType._batchFunc(libc, "labs")
+    assert func.argtypes == tuple(dType._IDS + [ctypes.c_void_p] + dType._QUEUED)
+    assert func.__name__ == "labs"
+    assert libc.labs.argtypes == [ctypes.c_long]
+    assert ctypes.cast(func, ctypes.c_void_p).value == ctypes.cast(libc.labs, ctypes.c_void_p).value
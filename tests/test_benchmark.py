@@ -0,0 +1,18 @@
+import DobotBenchmark
+import DobotDllType as dType
+
+
+def test_routes_match_connect():
+    routes = {}
+    for name, layout in DobotBenchmark.ROUTES:
+        masterId, slaveId, masterDevType, slaveDevType = DobotBenchmark.connectedIds(*layout)
+        routes[name] = dType.DeviceRoutes(masterDevType, slaveDevType, slaveId)
+    assert routes["Magician"].all == (0,) and routes["Magician"].armQueue == 0
+    assert routes["Controller+MagicianLite"].all == (-1, routes["Controller+MagicianLite"].arm)
+    assert routes["Controller"].all == (-1,) and routes["Controller"].armQueue == 1
+
+
+def test_run_every_route():
+    results = DobotBenchmark.run(number=50, names=["GetQueuedCmdCurrentIndex", "SetPTPCmd"])
+    assert [route for _, route, _ in results] == [name for name, _ in DobotBenchmark.ROUTES] * 2
+    assert all(r["callsPerSec"] > 0 for _, _, r in results)
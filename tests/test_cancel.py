@@ -0,0 +1,58 @@
+import threading
+import time
+
+import DobotDllType as dType
+import pytest
+
+
+def test_wait_timeout_from_the_session(connect):
+    api, dll = connect(speed=1.0, waitTimeout=100)
+    assert dType.GetWaitTimeout(api) == 100
+    start = time.monotonic()
+    with pytest.raises(dType.DobotCancelledError) as error:
+        dType.SetWAITCmdEx(api, 5000, isQueued=1)
+    elapsed = time.monotonic() - start
+    assert error.value.reason == "timeout"
+    assert 0.1 <= elapsed < 0.2
+    dType.SetQueuedCmdClear(api)
+
+
+def test_set_wait_timeout(connect):
+    api, dll = connect(speed=1.0)
+    assert dType.GetWaitTimeout(api) is None
+    dType.SetWaitTimeout(api, 50)
+    assert dType.GetWaitTimeout(api) == 50
+    start = time.monotonic()
+    with pytest.raises(dType.DobotCancelledError):
+        dType.SetPTPCmdEx(api, dType.PTPMode.PTPMOVJXYZMode, 200, 100, 30, 0, isQueued=1)
+    assert 0.05 <= time.monotonic() - start < 0.15
+    dType.SetQueuedCmdClear(api)
+    # 关掉后等到指令执行完
+    dType.SetWaitTimeout(api, None)
+    dType.SetWAITCmdEx(api, 100, isQueued=1)
+
+
+def test_cancel_from_another_thread(connect):
+    api, dll = connect(speed=1.0)
+    errors = []
+    blocked = threading.Event()
+
+    def wait():
+        blocked.set()
+        try:
+            dType.SetWAITCmdEx(api, 5000, isQueued=1)
+        except dType.DobotCancelledError as error:
+            errors.append((error.reason, time.monotonic()))
+    thread = threading.Thread(target=wait)
+    thread.start()
+    blocked.wait(1)
+    time.sleep(0.05)
+    cancelled = time.monotonic()
+    dType.CancelWaits(api, "door open")
+    thread.join(1)
+    assert not thread.is_alive()
+    (reason, raised), = errors
+    assert reason == "door open"
+    # 等待线程在一个查询间隔内醒来
+    assert raised - cancelled < 0.02 + api.poller.maxInterval / 1000
+    dType.SetQueuedCmdClear(api)
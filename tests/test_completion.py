@@ -0,0 +1,105 @@
+import threading
+import time
+
+import DobotDllType as dType
+import pytest
+
+def test_futures_share_one_poll(connect):
+    api, dll = connect(speed=1.0)
+    indices = [dType.SetWAITCmd(api, 10, isQueued=1)[0] for _ in range(10)]
+    del dll.calls[:]
+    before = set(threading.enumerate())
+    start = time.monotonic()
+    futures = [dType.GetQueuedCmdFuture(api, index) for index in indices]
+    assert [future.result(5) >= index for future, index in zip(futures, indices)] == [True] * 10
+    elapsed = (time.monotonic() - start) * 1000
+    assert [thread.name for thread in set(threading.enumerate()) - before] == ["DobotCompletionPoller"]
+    # 一次查询服务所有future：次数只随时间增长，每个间隔至多一次
+    reads = dll.names().count("GetQueuedCmdCurrentIndex")
+    assert dll.names() == ["GetQueuedCmdCurrentIndex"] * reads
+    assert reads <= elapsed / api.poller.minInterval + 1
+
+
+def test_ptp_estimate_reads_no_pose(connect):
+    api, dll = connect(cacheParams=True)
+    dType.SetPTPCommonParams(api, 100, 100)
+    dType.SetPTPCoordinateParams(api, 200, 200, 200, 200)
+    with dType.cancellable(api, timeout=5000):
+        dType.SetPTPCmdEx(api, dType.PTPMode.PTPMOVLXYZMode, 200, 0, 30, 0, isQueued=1)
+        del dll.calls[:]
+        dType.SetPTPCmdEx(api, dType.PTPMode.PTPMOVLXYZMode, 230, 40, 30, 0, isQueued=1)
+    names = set(dll.names())
+    assert "GetPose" not in names
+    assert names == {"SetPTPCmd", "GetQueuedCmdCurrentIndex"}
+    assert api.ptpTarget == (dType.PTPMode.PTPMOVLXYZMode, (230, 40, 30, 0))
+
+
+def test_ptp_estimate_from_last_target(connect):
+    api, dll = connect(cacheParams=True)
+    dType.SetPTPCommonParams(api, 50, 100)
+    dType.SetPTPCoordinateParams(api, 200, 400, 100, 100)
+    dType.SetPTPJointParams(api, 100, 100, 100, 100, 100, 100, 100, 100)
+    mode = dType.PTPMode
+    assert dType._ptpDuration(api, mode.PTPMOVLXYZMode, (230, 40, 30, 0)) is None
+    dType.SetPTPCmd(api, mode.PTPMOVJXYZMode, 200, 0, 30, 0)
+    expected = dType._trapezoid(50, 100, 400)
+    assert dType._ptpDuration(api, mode.PTPMOVLXYZMode, (230, 40, 30, 0)) == pytest.approx(expected)
+    assert dType._ptpDuration(api, mode.PTPMOVLXYZINCMode, (30, 40, 0, 0)) == pytest.approx(expected)
+    # 关节角目标不能从笛卡尔目标推出
+    assert dType._ptpDuration(api, mode.PTPMOVJANGLEMode, (10, 20, 30, 0)) is None
+    dType.SetPTPCmd(api, mode.PTPMOVJANGLEMode, 0, 20, 30, 0)
+    assert dType._ptpDuration(api, mode.PTPMOVJANGLEMode, (40, 20, 30, 0)) == pytest.approx(
+        dType._trapezoid(40, 50, 100))
+    dType.SetPTPCmd(api, mode.PTPMOVLXYZINCMode, 10, 0, 0, 0)
+    assert dType._ptpDuration(api, mode.PTPMOVLXYZMode, (230, 40, 30, 0)) is None
+
+
+def test_immediate_ptp_skips_the_estimate(connect, monkeypatch):
+    api, dll = connect(cacheParams=True)
+    estimates = []
+    monkeypatch.setattr(dType, "_ptpDuration", lambda *args: estimates.append(args))
+    with dType.cancellable(api, timeout=5000):
+        dType.SetPTPCmdEx(api, dType.PTPMode.PTPMOVLXYZMode, 200, 0, 30, 0)
+        assert estimates == []
+        dType.SetPTPCmdEx(api, dType.PTPMode.PTPMOVLXYZMode, 210, 0, 30, 0, isQueued=1)
+    assert len(estimates) == 1
+
+
+def test_estimate_cuts_the_polls(connect):
+    api, dll = connect(speed=1.0)
+
+    def polls(duration):
+        index = dType.SetWAITCmd(api, 300, isQueued=1)[0]
+        del dll.calls[:]
+        assert dType.GetQueuedCmdFuture(api, index, duration=duration).result(5) >= index
+        return dll.names().count("GetQueuedCmdCurrentIndex")
+    blind = polls(None)
+    informed = polls(300)
+    # 没有估计时每20 ms查询一次，有估计时先睡过大部分时间
+    assert blind >= 12
+    assert informed <= 6 and informed * 2 < blind
+
+
+def test_long_ptp_polls_near_the_end(connect):
+    api, dll = connect(speed=1.0, cacheParams=True)
+    dType.SetPTPCommonParams(api, 100, 100)
+    dType.SetPTPCoordinateParams(api, 100, 100, 100, 100)
+    mode = dType.PTPMode.PTPMOVLXYZMode
+    with dType.cancellable(api, timeout=5000):
+        dType.SetPTPCmdEx(api, mode, 200, 0, 30, 0, isQueued=1)
+        expected = dType._ptpDuration(api, mode, (200, 30, 30, 0))
+        assert expected > 300
+        del dll.calls[:]
+        dType.SetPTPCmdEx(api, mode, 200, 30, 30, 0, isQueued=1)
+    assert dll.names().count("GetQueuedCmdCurrentIndex") <= 6
+
+
+def test_overestimate_is_seen_within_max_sleep(connect):
+    api, dll = connect()
+    api.poller = dType.CompletionPoller(api, maxSleep=50)
+    index = dType.SetWAITCmd(api, 30, isQueued=1)[0]
+    start = time.monotonic()
+    future = dType.GetQueuedCmdFuture(api, index, duration=5000)
+    assert future.result(5) >= index
+    # 估计5 s，实际1.5 ms；每次最多睡maxSleep
+    assert time.monotonic() - start < 0.15
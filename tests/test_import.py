@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+import DobotDllType as dType
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHECK = """
+import ctypes, json, sys
+loaded = []
+init = ctypes.CDLL.__init__
+def record(self, name, *args, **kwargs):
+    loaded.append(name)
+    init(self, name, *args, **kwargs)
+ctypes.CDLL.__init__ = record
+import %s
+print(json.dumps({"loaded": loaded, "modules": sorted(sys.modules)}))
+"""
+
+
+def importIn(module):
+    # 新进程里导入，记录打开的库和导入的模块
+    output = subprocess.check_output([sys.executable, "-c", CHECK % module], cwd=ROOT)
+    return json.loads(output.decode("utf-8"))
+
+
+def test_import_has_no_side_effects():
+    for module in ("DobotDllType", "DobotControl"):
+        result = importIn(module)
+        assert result["loaded"] == []
+        lazy = ["DobotDllType." + name for name in dType._LAZY_MODULES]
+        assert [name for name in result["modules"] if name in lazy] == []
+        assert "numpy" not in result["modules"]
+
+
+def test_lazy_names_import_their_module():
+    code = "import sys, DobotDllType as d; d.SetIODO; print(sorted(m for m in sys.modules if m.startswith('DobotDllType')))"
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT)
+    assert output.decode("utf-8").strip() == "['DobotDllType', 'DobotDllType.IO']"
@@ -0,0 +1,111 @@
+import DobotDllType as dType
+import pytest
+
+def test_refresh_fills_the_cache(connect):
+    api, dll = connect(cacheParams=True)
+    params = dType.RefreshParams(api)
+    assert sorted(params) == sorted(dType.CACHED_PARAMS)
+    assert dll.names() == ["Get" + name for name in dType.CACHED_PARAMS]
+    del dll.calls[:]
+    sim = dType.DobotSession(dll.dll.dll)
+    for name in dType.CACHED_PARAMS:
+        getter = getattr(dType, "Get" + name)
+        assert getter(api) == params[name] == pytest.approx(getter(sim))
+    assert dll.calls == []
+
+
+def test_set_updates_the_cache(connect):
+    api, dll = connect(cacheParams=True)
+    dType.SetPTPCommonParams(api, 30, 40)
+    assert dType.GetPTPCommonParams(api) == [30, 40]
+    assert dll.names() == ["SetPTPCommonParams"]
+    assert dType.GetPTPCommonParams(api, refresh=True) == [30, 40]
+    assert dll.names() == ["SetPTPCommonParams", "GetPTPCommonParams"]
+
+
+def test_failed_set_keeps_the_cache(connect):
+    api, dll = connect(cacheParams=True, retryPolicy=dType.RetryPolicy(maxAttempts=1))
+    dType.SetPTPCommonParams(api, 30, 40)
+    dll.dll.failures["SetPTPCommonParams"] = (1, dType.DobotCommunicate.DobotCommunicate_Timeout)
+    with pytest.raises(dType.DobotCommunicateError):
+        dType.SetPTPCommonParams(api, 50, 60)
+    assert dType.GetPTPCommonParams(api) == [30, 40]
+
+
+def test_cache_follows_every_routed_target(connect):
+    api, dll = connect(dType.DevType.Conntroller, dType.DevType.MagicianLite, cacheParams=True)
+    dType.SetPTPCommonParams(api, 30, 40)
+    assert dll.names() == ["SetPTPCommonParams"] * len(api.routes.all)
+    assert dType.GetPTPCommonParams(api) == [30, 40]
+    assert len(dll.calls) == len(api.routes.all)
+
+
+def test_clear_and_reconnect_empty_the_cache(connect):
+    api, dll = connect(cacheParams=True)
+    dType.SetHOMEParams(api, 200, 0, 30, 0)
+    dType.SetWAITCmd(api, 5000, isQueued=1)
+    dType.SetCPParams(api, 10, 10, 10, isQueued=1)
+    dType.SetQueuedCmdClear(api)
+    assert "HOMEParams" in api.paramsCache and "CPParams" not in api.paramsCache
+    dType.DisconnectDobot(api)
+    assert api.paramsCache == {}
+    dType.ConnectDobot(api, "", 115200)
+    del dll.calls[:]
+    dType.GetHOMEParams(api)
+    assert dll.names() == ["GetHOMEParams"]
+
+
+def test_cache_off_reads_the_device(connect):
+    api, dll = connect()
+    dType.SetHOMEParams(api, 200, 0, 30, 0)
+    dType.GetHOMEParams(api)
+    dType.GetHOMEParams(api)
+    assert dll.names() == ["SetHOMEParams", "GetHOMEParams", "GetHOMEParams"]
+    dType.SetParamsCache(api, True)
+    dType.GetHOMEParams(api)
+    dType.GetHOMEParams(api)
+    assert dll.names().count("GetHOMEParams") == 3
+
+
+def test_redundant_writes_are_skipped(connect):
+    api, dll = connect(skipRedundantParams=True)
+    current = dType.RefreshParams(api)["PTPCommonParams"]
+    del dll.calls[:]
+    # 读到的值：返回0，不下发
+    assert dType.SetPTPCommonParams(api, *current, isQueued=1) == [0]
+    assert dll.calls == []
+    assert dType.SetPTPCommonParams(api, 30, 40) == [0]
+    assert dType.SetPTPCommonParams(api, 30, 40, isQueued=1) == [0]
+    assert dType.SetPTPCommonParams(api, 30, 45) == [0]
+    assert dll.names() == ["SetPTPCommonParams", "SetPTPCommonParams"]
+
+
+def test_skipped_queued_write_returns_the_earlier_index(connect):
+    api, dll = connect(skipRedundantParams=True)
+    dType.SetWAITCmd(api, 200, isQueued=1)
+    index = dType.SetCPParams(api, 10, 10, 10, isQueued=1)[0]
+    assert index > 0
+    assert dType.SetCPParams(api, 10, 10, 10, isQueued=1) == [index]
+    # 排队写入可能还没执行，立即写入照常下发
+    dType.SetCPParams(api, 10, 10, 10)
+    assert dll.names().count("SetCPParams") == 2
+    assert dType.GetQueuedCmdFuture(api, index).result(5) >= index
+
+
+def test_skip_saves_every_routed_write(connect):
+    api, dll = connect(dType.DevType.Conntroller, dType.DevType.MagicianLite, skipRedundantParams=True)
+    dType.SetPTPCommonParams(api, 30, 40)
+    del dll.calls[:]
+    dType.SetPTPCommonParams(api, 30, 40)
+    dType.SetPTPCommonParamsEx(api, 30, 40)
+    assert "SetPTPCommonParams" not in dll.names()
+
+
+def test_arm_speed_ratio_is_deduplicated_per_mode(connect):
+    api, dll = connect(skipRedundantParams=True)
+    dType.SetArmSpeedRatio(api, 0, 50)
+    dType.SetArmSpeedRatio(api, 0, 50)
+    dType.SetArmSpeedRatio(api, 1, 50)
+    dType.SetArmSpeedRatio(api, 1, 60)
+    assert dll.names().count("SetArmSpeedRatio") == 3
+    assert dType.GetArmSpeedRatio(api, 1) == [60]
@@ -0,0 +1,81 @@
+import time
+
+import DobotDllType as dType
+import pytest
+
+MOVL = dType.PTPMode.PTPMOVLXYZMode
+
+
+def moves(api, count, ahead=None):
+    # 每取一条记录已取数与设备已执行数之差
+    for i in range(count):
+        if ahead is not None:
+            ahead.append(i - dType.GetQueuedCmdCurrentIndex(api)[0])
+        yield (dType.SetPTPCmd, MOVL, 200 + 20 * (i % 2), 20 * (i % 3), 30, 0)
+
+
+def test_run_keeps_the_lookahead(connect):
+    api, dll = connect()
+    ahead = []
+    pipeline = dType.QueuedCmdPipeline(api, moves(api, 20, ahead), lookahead=3)
+    assert pipeline.run() == 20
+    assert dType.GetQueuedCmdCurrentIndex(api)[0] == pipeline.lastIndex == 20
+    # 生成器按需取：取下一条时队列里不到lookahead条
+    assert max(ahead) == 2
+    assert ahead.count(2) >= 10
+    assert dType.GetPose(api)[:2] == pytest.approx([200 + 20 * (19 % 2), 20 * (19 % 3)], abs=1e-3)
+
+
+def test_background_run_and_context_manager(connect):
+    api, dll = connect()
+    pipeline = dType.QueuedCmdPipeline(api, moves(api, 6)).start()
+    assert pipeline.join(5)
+    assert pipeline.count == 6
+    with dType.QueuedCmdPipeline(api, moves(api, 4), lookahead=2) as pipeline:
+        pass
+    assert pipeline.count == 4
+    assert dType.GetQueuedCmdCurrentIndex(api)[0] == pipeline.lastIndex
+
+
+def test_stop_leaves_queued_commands(connect):
+    api, dll = connect(speed=1.0)
+    pulled = []
+
+    def commands():
+        for i in range(100):
+            pulled.append(i)
+            yield (dType.SetWAITCmd, 50)
+    pipeline = dType.QueuedCmdPipeline(api, commands(), lookahead=2).start()
+    time.sleep(0.08)
+    pipeline.stop()
+    count = pipeline.count
+    assert 2 <= count < 10 and len(pulled) <= count + 1
+    time.sleep(0.05)
+    assert pipeline.count == count
+    assert pipeline.join(0)
+    dType.SetQueuedCmdClear(api)
+
+
+def test_cancel_and_generator_errors_are_raised(connect):
+    api, dll = connect(speed=1.0)
+    pipeline = dType.QueuedCmdPipeline(api, ((dType.SetWAITCmd, 1000) for _ in range(10)), lookahead=1).start()
+    time.sleep(0.05)
+    dType.CancelWaits(api, "door open")
+    with pytest.raises(dType.DobotCancelledError, match="door open"):
+        pipeline.join(2)
+    dType.SetQueuedCmdClear(api)
+
+    def broken():
+        yield (dType.SetWAITCmd, 10)
+        raise ValueError("bad point")
+    with pytest.raises(ValueError, match="bad point"):
+        with dType.QueuedCmdPipeline(api, broken()):
+            pass
+
+
+def test_controller_queue(connect):
+    api, dll = connect(dType.DevType.Conntroller, dType.DevType.Idle)
+    pipeline = dType.QueuedCmdPipeline(api, ((dType.SetWAITCmd, 20) for _ in range(5)), lookahead=2)
+    assert pipeline.sender.queue == 1
+    assert pipeline.run() == 5
+    assert dType.GetQueuedCmdCurrentIndex(api)[1] == pipeline.lastIndex
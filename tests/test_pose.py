@@ -0,0 +1,55 @@
+import warnings
+
+import DobotDllType as dType
+
+
+def test_reads_within_max_age_are_shared(connect):
+    api, dll = connect(poseMaxAge=1000)
+    first = dType.GetPoseSnapshot(api)
+    for index in range(1, 9):
+        assert dType.GetPoseEx(api, index) == round(first[index - 1], 4)
+    assert dType.GetPoseSnapshot(api) == first
+    assert dll.names() == ["GetPose"]
+
+
+def test_max_age_zero_reads_every_call(connect):
+    api, dll = connect()
+    dType.GetPoseEx(api, 1)
+    dType.GetPoseEx(api, 2)
+    dType.GetPoseSnapshot(api, maxAge=0)
+    assert dll.names() == ["GetPose"] * 3
+
+
+class Rail(object):
+    # 模拟器没有滑轨：报告装有滑轨，位置固定为40
+    def __init__(self, dll):
+        self.dll = dll
+
+    def __getattr__(self, name):
+        return getattr(self.dll, name)
+
+    def GetDeviceWithL(self, masterId, slaveId, isWithL):
+        isWithL._obj.value = True
+        return dType.DobotCommunicate.DobotCommunicate_NoError
+
+    def GetPoseL(self, masterId, slaveId, l):
+        l._obj.value = 40.0
+        return dType.DobotCommunicate.DobotCommunicate_NoError
+
+
+def test_multi_axis_read_is_single(connect):
+    api, dll = connect()
+    dll.dll = Rail(dll.dll)
+    values = dType.GetPoseMultiEx(api, [0, 1, 2, 0, 5])
+    assert sorted(dll.names()) == ["GetDeviceWithL", "GetPose", "GetPoseL"]
+    pose = dType.GetPose(api)
+    assert values == [40.0, round(pose[0], 4), round(pose[1], 4), 40.0, round(pose[4], 4)]
+
+
+def test_multi_axis_without_rail(connect):
+    api, dll = connect()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        values = dType.GetPoseMultiEx(api, [0, 3])
+    assert values[0] is None and "not in L model" in str(caught[0].message)
+    assert sorted(dll.names()) == ["GetDeviceWithL", "GetPose"]
@@ -0,0 +1,108 @@
+import threading
+
+import DobotDllType as dType
+import DobotProtocol
+import DobotSimulator
+import pytest
+
+
+@pytest.fixture
+def loopback():
+    emulator = DobotProtocol.LoopbackEmulator(DobotSimulator.SimulatedDll())
+    api = dType.DobotSession(dType.load("serial"), retryPolicy=dType.RetryPolicy(maxAttempts=3))
+    assert dType.ConnectDobot(api, emulator.port, 115200)[0] == dType.DobotConnect.DobotConnect_NoError
+    dType.SetCmdTimeout(api, 200)
+    yield api, emulator
+    dType.DisconnectDobot(api)
+    emulator.close()
+
+
+def test_frame_roundtrip():
+    frame = bytes([4, 10, 0, 1, 2])
+    data = b"\x00" + DobotProtocol.HEADER + frame + bytes([DobotProtocol.checksum(frame[1:])])
+    reader = DobotProtocol.FrameReader()
+    assert reader.feed(data[:4]) == []
+    assert reader.feed(data[4:]) == [(10, 0, b"\x01\x02")]
+
+
+def test_loopback_calls(loopback):
+    api, emulator = loopback
+    pose = dType.GetPose(api)
+    assert pose[:4] == pytest.approx(dType.GetPose(dType.DobotSession(emulator.sim))[:4])
+    index = dType.SetPTPCmd(api, dType.PTPMode.PTPMOVLXYZMode, 210, 0, 30, 0, isQueued=1)[0]
+    assert index == 1
+    dType.SetIODO(api, 2, 1)
+    assert dType.GetIODO(api, 2) == [1]
+
+
+def test_dropped_reply_recovers(loopback):
+    api, emulator = loopback
+    expected = dType.GetPose(api)
+    emulator.drop = 1
+    # 第一次尝试超时，重试及之后的调用都拿到自己的应答
+    assert dType.GetPose(api) == expected
+    for _ in range(5):
+        assert dType.GetPose(api) == expected
+    assert dType.GetIODO(api, 3) == [0]
+    assert dType.GetPose(api) == expected
+
+
+def test_frame_reader_resyncs():
+    good = bytes([4, 10, 0, 1, 2])
+    bad = bytes([4, 11, 0, 1, 2])
+    data = b"\x55" + DobotProtocol.HEADER + bad + b"\x00" + DobotProtocol.HEADER + good + \
+        bytes([DobotProtocol.checksum(good[1:])])
+    reader = DobotProtocol.FrameReader()
+    assert reader.feed(data) == [(10, 0, b"\x01\x02")]
+
+
+def test_loopback_struct_params(loopback):
+    api, emulator = loopback
+    dType.SetPTPJumpParams(api, 25, 90)
+    assert dType.GetPTPJumpParams(api) == [25, 90]
+    dType.SetHOMEParams(api, 210, 10, 40, 5)
+    assert dType.GetHOMEParams(api) == [210, 10, 40, 5]
+    assert dType.GetPTPJumpParams(dType.DobotSession(emulator.sim)) == [25, 90]
+
+
+def test_loopback_queued_ex_waits(loopback):
+    api, emulator = loopback
+    with dType.cancellable(api, timeout=5000):
+        dType.SetPTPCmdEx(api, dType.PTPMode.PTPMOVLXYZMode, 220, 20, 30, 0, isQueued=1)
+    assert dType.GetPose(api)[:3] == pytest.approx([220, 20, 30], abs=1e-3)
+    assert dType.GetQueuedCmdCurrentIndex(api)[0] == 1
+
+
+def test_loopback_pipelines_threads(loopback):
+    api, emulator = loopback
+    for address in range(1, 5):
+        dType.SetIODO(api, address, address % 2)
+    errors = []
+
+    def read(address):
+        try:
+            for _ in range(20):
+                assert dType.GetIODO(api, address) == [address % 2]
+        except AssertionError as error:
+            errors.append(error)
+    threads = [threading.Thread(target=read, args=(address,)) for address in range(1, 5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    assert errors == []
+
+
+def test_loopback_buffer_full():
+    emulator = DobotProtocol.LoopbackEmulator(DobotSimulator.SimulatedDll(queueSize=2))
+    api = dType.DobotSession(dType.load("serial"), retryPolicy=dType.RetryPolicy(maxAttempts=2, delay=1))
+    try:
+        dType.ConnectDobot(api, emulator.port, 115200)
+        dType.SetWAITCmd(api, 5000, isQueued=1)
+        dType.SetWAITCmd(api, 5000, isQueued=1)
+        with pytest.raises(dType.DobotCommunicateError) as error:
+            dType.SetWAITCmd(api, 5000, isQueued=1)
+        assert error.value.result == dType.DobotCommunicate.DobotCommunicate_BufferFull
+    finally:
+        dType.DisconnectDobot(api)
+        emulator.close()
@@ -0,0 +1,81 @@
+import threading
+import time
+
+import DobotDllType as dType
+import pytest
+
+TIMEOUT = dType.DobotCommunicate.DobotCommunicate_Timeout
+INVALID_DEVICE = dType.DobotCommunicate.DobotCommunicate_InvalidDevice
+
+
+def test_transient_errors_are_retried(connect):
+    api, dll = connect(retryPolicy=dType.RetryPolicy(maxAttempts=5, delay=1))
+    dll.dll.failures["GetPose"] = (3, TIMEOUT)
+    assert len(dType.GetPose(api)) == 8
+    assert dll.dll.attempts["GetPose"] == 4
+
+
+def test_max_attempts(connect):
+    api, dll = connect(retryPolicy=dType.RetryPolicy(maxAttempts=3, delay=1))
+    dll.dll.failures["GetPose"] = (100, TIMEOUT)
+    with pytest.raises(dType.DobotCommunicateError) as error:
+        dType.GetPose(api)
+    assert (error.value.function, error.value.result, error.value.attempts) == ("GetPose", TIMEOUT, 3)
+    assert dll.dll.attempts["GetPose"] == 3
+    assert "DobotCommunicate_Timeout" in str(error.value)
+
+
+def test_timeout_bounds_a_dead_arm(connect):
+    api, dll = connect(retryPolicy=dType.RetryPolicy(timeout=100, delay=10))
+    dll.dll.failures["SetPTPCmd"] = (10 ** 6, TIMEOUT)
+    start = time.monotonic()
+    with pytest.raises(dType.DobotCommunicateError):
+        dType.SetPTPCmd(api, dType.PTPMode.PTPMOVLXYZMode, 200, 0, 30, 0, isQueued=1)
+    assert time.monotonic() - start < 0.3
+    assert 2 <= dll.dll.attempts["SetPTPCmd"] <= 11
+
+
+def test_fail_action_gives_up_at_once(connect):
+    api, dll = connect(retryPolicy=dType.RetryPolicy(actions={INVALID_DEVICE: dType.FAIL}, delay=1))
+    dll.dll.failures["GetPose"] = (1, INVALID_DEVICE)
+    with pytest.raises(dType.DobotCommunicateError) as error:
+        dType.GetPose(api)
+    assert error.value.attempts == 1
+    # 其余错误码照常重试
+    dll.dll.failures["GetPose"] = (2, TIMEOUT)
+    dType.GetPose(api)
+    assert dll.dll.attempts["GetPose"] == 4
+
+
+def test_backoff_is_capped(connect):
+    api, dll = connect(retryPolicy=dType.RetryPolicy(maxAttempts=5, delay=10, backoff=2, maxDelay=20))
+    dll.dll.failures["GetPose"] = (4, TIMEOUT)
+    start = time.monotonic()
+    dType.GetPose(api)
+    # 10 + 20 + 20 + 20 ms
+    assert 0.065 <= time.monotonic() - start < 0.5
+
+
+def test_cancel_breaks_the_retry_pause(connect):
+    api, dll = connect()
+    dll.dll.failures["GetPose"] = (10 ** 6, TIMEOUT)
+    errors = []
+
+    def read():
+        try:
+            dType.GetPose(api)
+        except dType.DobotCancelledError as error:
+            errors.append(error.reason)
+    thread = threading.Thread(target=read)
+    thread.start()
+    time.sleep(0.05)
+    dType.CancelWaits(api, "unplugged")
+    thread.join(1)
+    assert not thread.is_alive() and errors == ["unplugged"]
+
+
+def test_device_id_keeps_its_own_limit(connect):
+    api, dll = connect()
+    dll.dll.failures["GetDeviceID"] = (100, TIMEOUT)
+    assert dType.GetDeviceID(api) == [TIMEOUT, 0, 0, 0]
+    assert dll.dll.attempts["GetDeviceID"] == 5
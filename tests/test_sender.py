@@ -0,0 +1,125 @@
+import time
+
+import DobotDllType as dType
+import pytest
+
+MOVL = dType.PTPMode.PTPMOVLXYZMode
+
+
+def waitFor(api, index):
+    while dType.GetQueuedCmdCurrentIndex(api)[0] < index:
+        time.sleep(0.002)
+
+
+def submitMoves(sender, count):
+    return [sender.submit(dType.SetPTPCmd, MOVL, 200 + 20 * (i % 2), 20 * (i % 2), 30, 0)[0]
+            for i in range(count)]
+
+
+def test_sender_keeps_the_window(connect):
+    api, dll = connect()
+    device = dll._device(0, 0)
+    sender = dType.QueuedCmdSender(api, window=8)
+    depths = []
+    for i in range(30):
+        sender.submit(dType.SetPTPCmd, MOVL, 200 + 20 * (i % 2), 0, 30, 0)
+        depths.append(len(device.queue))
+    assert max(depths) <= 8
+    assert max(depths) >= 7
+    names = dll.names()
+    # 没有BufferFull重试，窗口未满时不读进度
+    assert names.count("SetPTPCmd") == 30
+    assert names[names.index("SetPTPCmd"):].index("GetQueuedCmdCurrentIndex", 1) == 8
+    sender.drain()
+    assert sender.inFlight() == 0 and sender.journal == {}
+    assert dType.GetQueuedCmdCurrentIndex(api)[0] == sender.lastIndex
+
+
+def test_sender_follows_the_controller_queue(connect):
+    api, dll = connect(dType.DevType.Conntroller, dType.DevType.Idle)
+    sender = dType.QueuedCmdSender(api, window=4)
+    assert sender.queue == 1
+    indices = [sender.submit(dType.SetWAITCmd, 20)[0] for _ in range(6)]
+    sender.drain()
+    assert dType.GetQueuedCmdCurrentIndex(api)[1] == indices[-1]
+
+
+def test_sender_wait_is_cancellable(connect):
+    api, dll = connect(speed=1.0)
+    sender = dType.QueuedCmdSender(api, window=2)
+    sender.submit(dType.SetWAITCmd, 5000)
+    sender.submit(dType.SetWAITCmd, 5000)
+    start = time.monotonic()
+    with pytest.raises(dType.DobotCancelledError):
+        with dType.cancellable(api, timeout=50):
+            sender.submit(dType.SetWAITCmd, 10)
+    assert time.monotonic() - start < 1
+    assert dll.names().count("SetWAITCmd") == 2
+    dType.SetQueuedCmdClear(api)
+
+
+def test_replace_tail_remaps_kept_commands(connect):
+    api, dll = connect(speed=10.0)
+    sender = dType.GetQueuedCmdSender(api)
+    indices = submitMoves(sender, 5)
+    waitFor(api, indices[0] - 1)
+    result = dType.ReplaceQueueTail(api, [(dType.SetPTPCmd, MOVL, 250, 50, 30, 0)], after=indices[3])
+    executed = result["executed"]
+    assert indices[0] <= executed < indices[3]
+    kept = [index for index in indices if executed < index <= indices[3]]
+    assert sorted(result["remap"]) == kept
+    new = [result["remap"][index] for index in kept] + result["indices"]
+    assert new == list(range(new[0], new[0] + len(new)))
+    assert new[0] > indices[-1]
+    assert result["deadTimeMs"] is not None
+    sender.drain()
+    assert sender.journal == {}
+    assert dType.GetPose(api)[:2] == pytest.approx([250, 50], abs=1e-3)
+
+
+def test_replace_tail_skips_commands_run_during_the_replace(connect):
+    api, dll = connect(speed=10.0)
+    sender = dType.GetQueuedCmdSender(api)
+    indices = submitMoves(sender, 4)
+    waitFor(api, indices[1])
+    # 第三条正在执行：等它走完，它不再重发
+    result = sender.replaceTail([], after=indices[-1])
+    assert result["executed"] >= indices[2]
+    assert all(index > result["executed"] for index in result["remap"])
+    assert dll.names().count("SetPTPCmd") == 4 + len(result["remap"])
+    sender.drain()
+    assert dType.GetQueuedCmdCurrentIndex(api)[0] == max(result["remap"].values() or [result["executed"]])
+
+
+def test_replace_tail_restarts_after_cancelled_clear(connect, monkeypatch):
+    api, dll = connect(speed=10.0)
+    sender = dType.GetQueuedCmdSender(api)
+    indices = submitMoves(sender, 3)
+    clear = dType.SetQueuedCmdClear
+
+    def cancelledClear(api):
+        clear(api)
+        raise dType.DobotCancelledError("test")
+    monkeypatch.setattr(dType, "SetQueuedCmdClear", cancelledClear)
+    with pytest.raises(dType.DobotCancelledError):
+        sender.replaceTail([(dType.SetWAITCmd, 10)], after=indices[-1])
+    names = dll.names()
+    assert names.index("SetQueuedCmdStartExec") > names.index("SetQueuedCmdClear")
+    assert sender.journal == {} and sender.lastIndex is None
+    # 队列已重新启动，新指令照常执行
+    index = sender.submit(dType.SetWAITCmd, 10)[0]
+    sender.drain()
+    assert dType.GetQueuedCmdCurrentIndex(api)[0] == index
+
+
+def test_replace_tail_cancelled_while_settling_keeps_the_plan(connect):
+    api, dll = connect(speed=1.0)
+    sender = dType.GetQueuedCmdSender(api)
+    indices = submitMoves(sender, 3)
+    with pytest.raises(dType.DobotCancelledError):
+        with dType.cancellable(api, timeout=10):
+            sender.replaceTail([], settle=1000)
+    names = dll.names()
+    assert "SetQueuedCmdClear" not in names and "SetQueuedCmdStartExec" not in names
+    assert sorted(sender.journal)[-1] == indices[-1]
+    dType.SetQueuedCmdStartExec(api)
@@ -0,0 +1,93 @@
+import threading
+
+import DobotDllType as dType
+import DobotSimulator
+import pytest
+
+MOVL = dType.PTPMode.PTPMOVLXYZMode
+CP = dType.ContinuousPathMode.CPAbsoluteMode
+
+
+def test_sessions_on_one_dll_stay_separate():
+    sim = DobotSimulator.SimulatedDll(clock=DobotSimulator.SimClock(20.0))
+    a = dType.DobotSession(sim, cacheParams=True, poseMaxAge=1000)
+    b = dType.DobotSession(sim, cacheParams=True, poseMaxAge=1000)
+    dType.ConnectDobot(a, "", 115200)
+    dType.ConnectDobot(b, "", 115200)
+    assert a.masterId != b.masterId
+    # 每台设备各自的队列和索引
+    assert dType.SetWAITCmd(a, 5000, isQueued=1) == [1]
+    assert dType.SetWAITCmd(a, 5000, isQueued=1) == [2]
+    assert dType.SetWAITCmd(b, 10, isQueued=1) == [1]
+    with dType.cancellable(b, timeout=5000):
+        dType.SetPTPCmdEx(b, MOVL, 220, 30, 30, 0, isQueued=1)
+    assert dType.GetQueuedCmdCurrentIndex(b)[0] == 2
+    assert dType.GetQueuedCmdCurrentIndex(a)[0] == 0
+    dType.SetPTPCommonParams(a, 30, 40)
+    assert dType.GetPTPCommonParams(a) == [30, 40]
+    assert dType.GetPTPCommonParams(b) == [100, 100]
+    assert a.paramsCache["PTPCommonParams"] != b.paramsCache["PTPCommonParams"]
+    assert dType.GetPoseSnapshot(b)[:2] == pytest.approx([220, 30], abs=1e-3)
+    assert dType.GetPoseSnapshot(a)[:2] != pytest.approx([220, 30], abs=1e-3)
+    dType.SetQueuedCmdClear(a)
+    assert dType.GetQueuedCmdCurrentIndex(b)[0] == 2
+
+
+def test_reused_buffers_give_the_same_results(connect):
+    results = []
+    for reuseBuffers in (False, True):
+        api, dll = connect(clock=DobotSimulator.VirtualClock(), reuseBuffers=reuseBuffers)
+        result = [
+            dType.SetPTPCmd(api, MOVL, 210, 10, 30, 0, isQueued=1),
+            dType.SetCPCmd(api, CP, 220, 0, 30, 50, isQueued=1),
+            dType.SetCPLECmd(api, CP, 230, 0, 30, 20, isQueued=1),
+        ]
+        dll.advance(10000)
+        result += [dType.GetPose(api), dType.GetQueuedCmdCurrentIndex(api),
+                   dType.SetPTPCmd(api, MOVL, 200, 0, 30, 0), dType.SetCPCmd(api, CP, 210, 0, 30, 50),
+                   dType.SetCPLECmd(api, CP, 220, 0, 30, 20)]
+        dll.advance(10000)
+        results.append(result + [dType.GetPose(api)])
+    assert results[0] == results[1]
+    assert results[1][:3] == [[1], [2], [3]] and results[1][4:8] == [[3, 0], [0], [0], [0]]
+
+
+def test_returned_lists_are_not_reused(connect):
+    api, dll = connect(reuseBuffers=True)
+    index = dType.SetPTPCmd(api, MOVL, 210, 10, 30, 0, isQueued=1)
+    current = dType.GetQueuedCmdCurrentIndex(api)
+    pose = dType.GetPose(api)
+    dType.SetPTPCmd(api, MOVL, 220, 20, 30, 0, isQueued=1)
+    with dType.cancellable(api, timeout=5000):
+        dType.GetQueuedCmdFuture(api, 2).result(5)
+    assert dType.GetPose(api) != pose and dType.GetQueuedCmdCurrentIndex(api) != current
+    assert index == [1]
+    assert current[0] <= 1 and pose[:2] != pytest.approx([220, 20], abs=1e-3)
+
+
+def test_buffers_are_per_thread(connect):
+    api, dll = connect(reuseBuffers=True)
+    real = api.dll
+    barrier = threading.Barrier(2, timeout=5)
+
+    class PoseByThread(object):
+        # 两个线程同时在GetPose里写入各自的值，再一起返回
+        def __getattr__(self, name):
+            return getattr(real, name)
+
+        def GetPose(self, masterId, slaveId, pose):
+            barrier.wait()
+            pose._obj.x = float(threading.current_thread().name)
+            barrier.wait()
+            return dType.DobotCommunicate.DobotCommunicate_NoError
+    api.dll = PoseByThread()
+    results = {}
+
+    def read():
+        results[threading.current_thread().name] = dType.GetPose(api)[0]
+    threads = [threading.Thread(target=read, name=str(i)) for i in (1, 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert results == {"1": 1.0, "2": 2.0}
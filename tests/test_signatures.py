@@ -0,0 +1,56 @@
+import ast
+import glob
+import os
+
+import DobotDllType as dType
+
+PACKAGE = os.path.dirname(dType.__file__)
+
+
+def isDllFunc(node):
+    return isinstance(node, ast.Attribute) and isinstance(node.value, ast.Attribute) and node.value.attr == "dll"
+
+
+def sources():
+    for path in sorted(glob.glob(os.path.join(PACKAGE, "*.py"))):
+        yield os.path.basename(path), ast.parse(open(path).read())
+
+
+def dllCalls():
+    # 源码里每次调用 session.dll.Name：(名字, 传入的参数个数, 位置)
+    for name, tree in sources():
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call):
+                continue
+            where = "%s:%d" % (name, node.lineno)
+            if isDllFunc(node.func):
+                yield node.func.attr, len(node.args), where
+            for i, arg in enumerate(node.args):
+                if isDllFunc(arg):
+                    yield arg.attr, len(node.args) - i - 1, where
+
+
+def test_signatures_match_the_wrappers():
+    for module in dType._LAZY_MODULES:
+        dType._importLazy(module)
+    calls = list(dllCalls())
+    assert len(calls) > 50
+    for name, count, where in calls:
+        assert name in dType._SIGNATURES, where
+        # SetDeviceName只声明id，字符串和整数两种参数都能传
+        if name != "SetDeviceName":
+            assert len(dType._SIGNATURES[name]) == count, where
+
+
+def test_every_signature_is_used():
+    for module in dType._LAZY_MODULES:
+        dType._importLazy(module)
+    used = set(name for name, _, _ in dllCalls())
+    for _, tree in sources():
+        for node in ast.walk(tree):
+            # 生成的封装和批量接口按名字取dll函数
+            if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "_generate":
+                used.update(spec.elts[0].value for spec in node.args[1].elts)
+            if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "_submitBatch":
+                used.add(node.args[1].value)
+    assert sorted(set(dType._SIGNATURES) - used) == []
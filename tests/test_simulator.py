@@ -0,0 +1,63 @@
+import ctypes
+import math
+
+import DobotDllType as dType
+import DobotSimulator
+import pytest
+
+
+def test_load_picks_the_backend(monkeypatch):
+    assert isinstance(dType.load("sim"), DobotSimulator.SimulatedDll)
+    monkeypatch.setenv("DOBOT_BACKEND", "sim")
+    assert isinstance(dType.load(), DobotSimulator.SimulatedDll)
+    with pytest.raises(ValueError):
+        dType.load("usb")
+
+
+def test_ctypes_backend_opens_the_given_path(tmp_path):
+    with pytest.raises(OSError):
+        dType.load("ctypes", str(tmp_path / "missing.so"))
+
+
+def test_sim_connects_like_the_dll():
+    api = dType.DobotSession(dType.load("sim"))
+    result = dType.ConnectDobot(api, "", 115200)
+    assert result[0] == dType.DobotConnect.DobotConnect_NoError
+    assert result[1] == dType.DevType.Magician
+    assert dType.SetPTPCmd(api, dType.PTPMode.PTPMOVLXYZMode, 210, 0, 30, 0, isQueued=1) == [1]
+
+
+def test_ptp_finishes_at_the_model_time(connect):
+    api, dll = connect(clock=DobotSimulator.VirtualClock(callTime=0))
+    dType.SetPTPCoordinateParams(api, 100, 100, 100, 100)
+    dType.SetPTPCommonParams(api, 50, 100)
+    start = dType.GetPose(api)
+    index = dType.SetPTPCmd(api, dType.PTPMode.PTPMOVLXYZMode, start[0], start[1] + 100, start[2], start[3],
+                            isQueued=1)[0]
+    end = DobotSimulator.forward(DobotSimulator.inverse(start[0], start[1] + 100, start[2], start[3]))
+    # 梯形速度曲线：速度50 mm/s，加速度100 mm/s²
+    expected = DobotSimulator.trapezoid(math.dist(start[:3], end[:3]), 50, 100)
+    assert expected == pytest.approx(2500, rel=0.01)
+    dll.advance(expected / 2)
+    assert dType.GetQueuedCmdCurrentIndex(api)[0] == index - 1
+    middle = dType.GetPose(api)
+    assert start[1] < middle[1] < end[1]
+    dll.advance(expected / 2 - 0.01)
+    assert dType.GetQueuedCmdCurrentIndex(api)[0] == index - 1
+    dll.advance(0.02)
+    assert dType.GetQueuedCmdCurrentIndex(api)[0] == index
+    assert dType.GetPose(api)[:3] == pytest.approx(end[:3], abs=1e-3)
+
+
+def test_full_queue_returns_buffer_full():
+    sim = DobotSimulator.SimulatedDll(clock=DobotSimulator.VirtualClock(), queueSize=2)
+    api = dType.DobotSession(sim)
+    dType.ConnectDobot(api, "", 115200)
+    assert dType.SetWAITCmd(api, 1000, isQueued=1) == [1]
+    assert dType.SetWAITCmd(api, 1000, isQueued=1) == [2]
+    index = ctypes.c_uint64(0)
+    result = sim.SetWAITCmd(api.masterId, api.slaveId, ctypes.byref(dType.WAITCmd(1000)), True, ctypes.byref(index))
+    assert result == dType.DobotCommunicate.DobotCommunicate_BufferFull
+    # 执行掉一条后又有空位
+    sim.advance(1001)
+    assert dType.SetWAITCmd(api, 1000, isQueued=1) == [3]
@@ -0,0 +1,35 @@
+import DobotDllType as dType
+import pytest
+
+TIMEOUT = dType.DobotCommunicate.DobotCommunicate_Timeout
+NO_ERROR = dType.DobotCommunicate.DobotCommunicate_NoError
+
+
+def test_retries_are_counted(connect):
+    stats = dType.CallStats()
+    api, dll = connect(stats=stats, retryPolicy=dType.RetryPolicy(maxAttempts=3, delay=10))
+    dll.dll.failures["GetPose"] = (2, TIMEOUT)
+    dType.GetPose(api)
+    dType.GetPose(api)
+    dll.dll.failures["GetPose"] = (3, TIMEOUT)
+    with pytest.raises(dType.DobotCommunicateError):
+        dType.GetPose(api)
+    entry = stats.snapshot()["GetPose"]
+    assert (entry["calls"], entry["attempts"], entry["retries"], entry["errors"]) == (3, 7, 4, 1)
+    assert entry["results"] == {TIMEOUT: 5, NO_ERROR: 2}
+    assert sum(count for _, count in entry["histogram"]) == 3
+    # 重试的两次暂停计入延时
+    assert entry["maxMs"] >= 20
+    assert stats.percentile("GetPose", 1.0) == pytest.approx(entry["maxMs"])
+    assert stats.percentile("GetIODO", 0.5) is None
+
+
+def test_snapshot_reset(connect):
+    stats = dType.CallStats()
+    api, dll = connect(stats=stats)
+    dType.GetPose(api)
+    assert stats.snapshot(reset=True)["GetPose"]["calls"] == 1
+    assert stats.snapshot() == {}
+    dType.SetCallStats(api, None)
+    dType.GetPose(api)
+    assert stats.snapshot() == {}
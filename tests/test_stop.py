@@ -0,0 +1,96 @@
+import threading
+import time
+
+import DobotDllType as dType
+import pytest
+
+
+class NoIndex(object):
+    # 读不到队列进度的库，其余调用照常
+    def __init__(self, dll):
+        self.dll = dll
+        self.indexReads = 0
+
+    def __getattr__(self, name):
+        return getattr(self.dll, name)
+
+    def GetQueuedCmdCurrentIndex(self, *args):
+        self.indexReads += 1
+        return dType.DobotCommunicate.DobotCommunicate_Timeout
+
+
+@pytest.mark.parametrize("layout", [
+    (dType.DevType.Magician, dType.DevType.Idle),
+    (dType.DevType.Conntroller, dType.DevType.MagicianLite),
+])
+def test_stop_report(connect, layout):
+    stats = dType.CallStats()
+    api, dll = connect(*layout, stats=stats)
+    dType.SetWAITCmd(api, 5000, isQueued=1)
+    report = dType.EmergencyStop(api, "test")
+    assert report["ok"] and report["reason"] == "test"
+    assert sorted(report["targets"]) == sorted(api.routes.all)
+    for entry in report["targets"].values():
+        assert entry["SetQueuedCmdForceStopExec"]["result"] == 0
+        assert entry["SetQueuedCmdClear"]["result"] == 0
+    assert dType.GetStopLane(api).last is report
+    recorded = stats.snapshot()["EmergencyStop"]
+    assert recorded["calls"] == 1 and recorded["errors"] == 0
+    assert recorded["attempts"] == 2 * len(api.routes.all)
+
+
+def test_stop_cancels_waits(connect):
+    api, dll = connect()
+    dType.GetStopLane(api)
+    errors = []
+
+    def wait():
+        try:
+            dType.SetWAITCmdEx(api, 5000, isQueued=1)
+        except dType.DobotCancelledError as error:
+            errors.append(error)
+    thread = threading.Thread(target=wait)
+    thread.start()
+    time.sleep(0.05)
+    dType.EmergencyStop(api, "light curtain")
+    thread.join(2)
+    assert not thread.is_alive()
+    assert [error.reason for error in errors] == ["light curtain"]
+
+
+def test_stop_drops_pending_params(connect):
+    api, dll = connect()
+    dType.SetSkipRedundantParams(api, True)
+    dType.SetHOMEParams(api, 200, 0, 30, 0)
+    dType.SetWAITCmd(api, 5000, isQueued=1)
+    dType.SetPTPCommonParams(api, 50, 50, isQueued=1)
+    assert "PTPCommonParams" in api.paramsCache
+    assert dType.EmergencyStop(api)["ok"]
+    # 已生效的立即写入保留，被清掉的排队写入不再缓存
+    assert "HOMEParams" in api.paramsCache
+    assert "PTPCommonParams" not in api.paramsCache
+
+
+def test_stop_cleanup_is_bounded(connect):
+    api, dll = connect()
+    dType.SetSkipRedundantParams(api, True)
+    dType.SetWAITCmd(api, 5000, isQueued=1)
+    dType.SetPTPCommonParams(api, 50, 50, isQueued=1)
+    api.dll = noIndex = NoIndex(api.dll)
+    start = time.monotonic()
+    report = dType.EmergencyStop(api, timeout=100)
+    assert time.monotonic() - start < 1
+    assert report["ok"] and noIndex.indexReads > 1
+    # 读不到进度时所有排队写入都作废
+    assert "PTPCommonParams" not in api.paramsCache
+
+
+def test_failed_stop_backs_off(connect):
+    api, dll = connect()
+    dll.dll.failures["SetQueuedCmdForceStopExec"] = (10 ** 6, dType.DobotCommunicate.DobotCommunicate_Timeout)
+    start = time.monotonic()
+    report = dType.EmergencyStop(api, timeout=100)
+    assert 0.1 <= time.monotonic() - start < 0.5
+    assert not report["ok"]
+    # 2、4、8、16 ms之后每20 ms一次，而不是空转
+    assert dll.dll.attempts["SetQueuedCmdForceStopExec"] <= 10
@@ -0,0 +1,56 @@
+import time
+import DobotDllType as dType
+import pytest
+
+pytest.importorskip("numpy")
+
+
+def waitFor(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_window_and_latest(connect):
+    api, dll = connect()
+    sampler = dType.PoseSampler(api, rate=200, capacity=8)
+    for _ in range(20):
+        sampler.sample()
+    assert len(sampler) == 7
+    window = sampler.window()
+    assert window.shape == (7, len(sampler.columns))
+    assert not window.flags.writeable
+    assert (sampler.latest() == window[-1]).all()
+    assert sampler.window(step=3).shape[0] == 3
+
+
+def test_cancelled_retry_keeps_sampling(connect):
+    api, dll = connect()
+    with dType.PoseSampler(api, rate=100) as sampler:
+        waitFor(lambda: sampler.count > 2)
+        dll.dll.failures["GetPose"] = (10 ** 6, dType.DobotCommunicate.DobotCommunicate_Timeout)
+        time.sleep(0.05)
+        dType.CancelWaits(api, "estop")
+        waitFor(lambda: sampler.errors >= 1)
+        dll.dll.failures.clear()
+        count = sampler.count
+        waitFor(lambda: sampler.count > count + 2)
+
+
+def test_other_errors_are_raised(connect):
+    api, dll = connect()
+
+    class Broken(object):
+        def __getattr__(self, name):
+            def func(*args):
+                raise OSError("device gone")
+            return func
+    with dType.PoseSampler(api, rate=100) as sampler:
+        waitFor(lambda: sampler.count > 0)
+        api.dll = Broken()
+        waitFor(lambda: sampler.error is not None)
+        with pytest.raises(OSError):
+            sampler.latest()
+        with pytest.raises(OSError):
+            sampler.stop()
@@ -0,0 +1,98 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import DobotDllType as dType
+import pytest
+
+
+def test_struct_params_roundtrip(connect):
+    api, dll = connect(speed=50.0)
+    assert dType.SetPTPJumpParams(api, 20, 100) == [0]
+    assert dType.GetPTPJumpParams(api) == [20, 100]
+    dType.SetJOGCoordinateParams(api, 1, 2, 3, 4, 5, 6, 7, 8)
+    assert dType.GetJOGCoordinateParams(api) == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert dll.calls == [("SetPTPJumpParams", 0), ("GetPTPJumpParams", 0),
+                         ("SetJOGCoordinateParams", 0), ("GetJOGCoordinateParams", 0)]
+
+
+def test_keyword_arguments(connect):
+    api, dll = connect(speed=50.0)
+    dType.SetPTPJumpParams(api, zLimit=100, jumpHeight=20)
+    assert dType.GetPTPJumpParams(api) == [20, 100]
+    assert api.SetPTPJumpParams(15, zLimit=90, isQueued=0) == [0]
+    assert api.GetPTPJumpParams() == [15, 90]
+    with pytest.raises(TypeError, match="missing required argument: 'zLimit'"):
+        dType.SetPTPJumpParams(api, 20)
+    with pytest.raises(TypeError, match="unexpected keyword argument 'height'"):
+        dType.SetPTPJumpParams(api, 20, 100, height=1)
+    with pytest.raises(TypeError, match="multiple values for argument 'jumpHeight'"):
+        dType.SetPTPJumpParams(api, 20, 100, jumpHeight=1)
+    with pytest.raises(TypeError, match="takes 4 positional arguments but 5 were given"):
+        dType.SetPTPJumpParams(api, 20, 100, 0, 1)
+    assert dType.SetPTPJumpParams.__doc__ == "SetPTPJumpParams(api, jumpHeight, zLimit, isQueued=0)"
+
+
+def test_queued_ex_variant_waits(connect):
+    api, dll = connect(speed=50.0)
+    with dType.cancellable(api, timeout=5000):
+        assert dType.SetTRIGCmdEx(api, 1, 0, 0, 100) is None
+    index = dType.SetARCCmd(api, [210, 10, 30, 0, 99], (220, 0, 30, 0), isQueued=1)[0]
+    assert index > 0
+    assert dll.calls[0] == ("SetTRIGCmd", 0)
+    assert ("GetQueuedCmdCurrentIndex", 0) in dll.calls
+
+
+@pytest.mark.parametrize("layout, arm, box", [
+    ((dType.DevType.Magician, dType.DevType.Idle), 0, 0),
+    ((dType.DevType.Conntroller, dType.DevType.MagicianLite), 1, -1),
+    ((dType.DevType.Conntroller, dType.DevType.Idle), -1, -1),
+])
+def test_routing(connect, layout, arm, box):
+    api, dll = connect(*layout, speed=50.0)
+    dType.GetArmOrientation(api)
+    dType.GetDeviceWithL(api)
+    dType.RestartMagicBox(api)
+    dType.SetPTPCommonParams(api, 50, 50)
+    assert dll.calls[:3] == [("GetArmOrientation", arm), ("GetDeviceWithL", box), ("RestartMagicBox", -1)]
+    assert dll.calls[3:] == [("SetPTPCommonParams", target) for target in api.routes.all]
+
+
+def test_scalar_outputs(connect):
+    api, dll = connect(speed=50.0)
+    dType.SetEndEffectorSuctionCup(api, 1, 1)
+    assert dType.GetEndEffectorSuctionCup(api) == [0]
+    assert dType.GetAngleSensorCoef(api) == [0.0, 0.0]
+    assert dType.SetAngleSensorCoef(api, 1, 2) is None
+
+
+def test_cached_params_skip_the_dll(connect):
+    api, dll = connect(speed=50.0)
+    dType.SetSkipRedundantParams(api, True)
+    dType.SetHOMEParams(api, 200, 0, 30, 0)
+    assert dType.GetHOMEParams(api) == [200, 0, 30, 0]
+    assert dType.SetHOMEParams(api, 200, 0, 30, 0) == [0]
+    assert dll.names() == ["SetHOMEParams"]
+    assert dType.GetHOMEParams(api, refresh=True) == [200, 0, 30, 0]
+    assert dll.names() == ["SetHOMEParams", "GetHOMEParams"]
+
+
+def test_import_writes_no_wrapper_files(tmp_path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    shutil.copytree(os.path.join(root, "DobotDllType"), str(tmp_path / "DobotDllType"),
+                    ignore=shutil.ignore_patterns("__pycache__"))
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    subprocess.check_call([sys.executable, "-c", "import DobotDllType as d; d.SetIODO; d.SetSeeedRgbExt"],
+                          cwd=str(tmp_path), env=env)
+    written = [name for _, _, names in os.walk(str(tmp_path / "DobotDllType" / "__pycache__")) for name in names]
+    assert written and all(name.endswith(".pyc") for name in written)
+
+
+def test_signatures_are_introspectable():
+    import inspect
+    assert str(inspect.signature(dType.SetPTPJumpParams)) == "(api, jumpHeight, zLimit, isQueued=0)"
+    assert str(inspect.signature(dType.GetHOMEParams)) == "(api, refresh=False)"
+    assert list(inspect.signature(dType.SetIODO).parameters) == ["api", "address", "level", "isQueued"]
+    assert dType.SetPTPJumpParams.__name__ == "SetPTPJumpParams"